@@ -0,0 +1,51 @@
+"""Operational metrics routes."""
+
+from fastapi import APIRouter
+
+from app.db.pool import pool_stats
+from app.db.session import get_async_engine, get_engine
+from app.services.cache import get_list_cache, get_task_cache, get_tasks_version
+from app.services.events import get_event_broker, get_event_publisher
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/pool")
+async def get_pool_metrics() -> dict:
+    """
+    Live connection pool statistics for this worker process.
+    
+    Reports occupancy (checked out, overflow), checkout wait histogram and
+    checkout timeouts for the asyncio engine (REST routes) and the sync engine.
+    """
+    return {
+        "async": pool_stats(get_async_engine().sync_engine.pool),
+        "sync": pool_stats(get_engine().pool),
+    }
+
+
+@router.get("/cache")
+async def get_cache_metrics() -> dict:
+    """
+    Task read cache statistics for this worker process.
+    
+    Reports size, hit rate, LRU evictions, TTL expirations and write
+    invalidations of the single-task cache and the task list cache, plus
+    the tasks table version that list cache keys are built on.
+    """
+    return {
+        "task": get_task_cache().describe(),
+        "task_list": get_list_cache().describe(),
+        "tasks_version": get_tasks_version().value,
+    }
+
+
+@router.get("/events")
+async def get_event_metrics() -> dict:
+    """
+    Task change feed statistics for this worker process.
+    
+    Reports the events backend, connected subscribers, the replay buffer
+    fill level, events published and subscribers dropped for falling behind.
+    """
+    return {"backend": get_event_publisher().name, **get_event_broker().stats()}
@@ -1,65 +1,322 @@
 """Task API routes."""
 
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db.session import get_session
+from app.core.config import get_settings
+from app.db.session import get_async_engine, get_async_session
 from app.models.task import TaskStatus
-from app.schemas.task import TaskCreate, TaskRead, TaskUpdate
-from app.services.task_service import TaskService
+from app.schemas.task import (
+    TaskBulkDelete,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskFilter,
+    TaskPage,
+    TaskRead,
+    TaskSearchPage,
+    TaskStats,
+    TaskUpdate,
+)
+from app.services.cache import get_list_cache, get_tasks_version, list_key
+from app.services.etags import (
+    PreconditionFailedError,
+    etag_matches,
+    if_match_versions,
+    list_etag,
+    task_etag,
+)
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.services.events import NullEventPublisher, get_event_broker, get_event_publisher
+from app.services.serialization import encode_tasks_page
+from app.services.task_export import MEDIA_TYPES, ExportFormat, csv_header, encode_rows
+from app.services.task_import import ImportFormat, import_tasks, open_async_upload
+from app.services.task_search import DEFAULT_SEARCH_LIMIT, MAX_QUERY_LENGTH, MAX_SEARCH_LIMIT
+from app.services.async_task_service import AsyncTaskService
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
-def get_task_service(session: Session = Depends(get_session)) -> TaskService:
+def get_task_service(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncTaskService:
     """Dependency to get task service."""
-    return TaskService(session)
+    return AsyncTaskService(session)
 
 
-@router.get("", response_model=list[TaskRead])
-def list_tasks(
-    status: Optional[TaskStatus] = Query(default=None, description="Filter by status"),
-    service: TaskService = Depends(get_task_service),
-) -> list[TaskRead]:
+@router.get("", response_model=TaskPage)
+async def list_tasks(
+    status_filter: Optional[TaskStatus] = Query(
+        default=None, alias="status", description="Filter by status"
+    ),
+    limit: int = Query(
+        default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"
+    ),
+    after: Optional[str] = Query(default=None, description="Return tasks after this cursor"),
+    before: Optional[str] = Query(default=None, description="Return tasks before this cursor"),
+    if_none_match: Optional[str] = Header(default=None),
+    service: AsyncTaskService = Depends(get_task_service),
+) -> TaskPage:
     """
-    Get list of all tasks.
+    Get a page of tasks, newest first.
+    
+    Optionally filter by status: pending, in_progress, done.
+    Use `next_cursor` as `after` (or `prev_cursor` as `before`) to move between pages.
     
-    Optionally filter by status: pending, in_progress, done
+    Pages are cached as serialized JSON until the next write to the tasks table.
+    Responses carry an ETag; send it back in `If-None-Match` to get
+    `304 Not Modified` while the filtered tasks are unchanged.
     """
+    # Read the version before querying: a write that lands mid-query bumps it,
+    # so the possibly stale page is stored under a key nobody asks for again
+    list_cache = get_list_cache()
+    key = list_key(get_tasks_version().value, status_filter, limit, after, before)
+    cached = list_cache.get(key)
+    
     try:
-        tasks = service.get_all_tasks(status=status)
-        return tasks
+        if cached is not None:
+            etag = cached["etag"]
+        else:
+            # Count + newest updated_at decide a 304 without loading any rows
+            count, max_updated_at = await service.get_tasks_fingerprint(status_filter)
+            etag = list_etag(count, max_updated_at, status_filter, limit, after, before)
+            if not etag_matches(if_none_match, etag):
+                # Plain column rows encoded straight to bytes: no ORM objects,
+                # no per-row TaskRead validation
+                page = await service.get_tasks_page_rows(
+                    status=status_filter, limit=limit, after=after, before=before
+                )
+                body = encode_tasks_page(page)
+                cached = {"etag": etag, "body": body}
+                list_cache.set(key, cached)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while fetching tasks"
         ) from e
+    
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=cached["body"], media_type="application/json", headers={"ETag": etag})
+
+
+@router.get("/stats", response_model=TaskStats)
+async def get_task_stats(
+    service: AsyncTaskService = Depends(get_task_service),
+) -> TaskStats:
+    """
+    Get the number of tasks per status and in total.
+    
+    Served from counters kept up to date by database triggers, so the cost
+    does not grow with the number of tasks.
+    """
+    try:
+        return await service.get_task_stats()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while fetching task stats"
+        ) from e
+
+
+def check_events_enabled() -> None:
+    """Dependency rejecting feed requests when EVENTS_BACKEND is "none"."""
+    if isinstance(get_event_publisher(), NullEventPublisher):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The task event feed is disabled"
+        )
+
+
+@router.get("/events", dependencies=[Depends(check_events_enabled)])
+async def stream_task_events(
+    last_event_id: Optional[str] = Header(default=None),
+    last_event_id_param: Optional[str] = Query(
+        default=None, alias="last_event_id", description="Resume after this event id"
+    ),
+) -> StreamingResponse:
+    """
+    Stream task changes as Server-Sent Events.
+    
+    Each event is `created`, `updated` or `deleted` with the affected task
+    `ids`, or `imported` with a row `count`. Events after `Last-Event-ID`
+    (header, or `last_event_id` query parameter) are replayed while they are
+    still buffered; otherwise a `reset` event says to re-list the tasks.
+    A consumer too slow to keep up gets an `overflow` event and is
+    disconnected; it can reconnect with its Last-Event-ID.
+    """
+    # Subscribe before responding: once a client has the response headers,
+    # it is guaranteed to see every later write
+    broker = get_event_broker()
+    subscription = broker.subscribe(last_event_id or last_event_id_param)
+    heartbeat = get_settings().events_heartbeat
+    
+    async def stream():
+        try:
+            async for event in subscription.events(heartbeat):
+                # Comment lines keep proxies from closing an idle stream
+                yield ": keep-alive\n\n" if event is None else event.to_sse()
+        finally:
+            broker.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/events")
+async def websocket_task_events(
+    websocket: WebSocket,
+    last_event_id: Optional[str] = Query(default=None, description="Resume after this event id"),
+) -> None:
+    """
+    WebSocket variant of GET /tasks/events: one JSON message per event.
+    
+    The connection is closed with code 1013 (try again later) after an
+    `overflow` message.
+    """
+    if isinstance(get_event_publisher(), NullEventPublisher):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="The task event feed is disabled")
+        return
+    
+    await websocket.accept()
+    broker = get_event_broker()
+    subscription = broker.subscribe(last_event_id)
+    try:
+        async for event in subscription.events():
+            await websocket.send_json(event.to_dict())
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.get("/search", response_model=TaskSearchPage)
+async def search_tasks(
+    q: str = Query(min_length=1, max_length=MAX_QUERY_LENGTH, description="Search text"),
+    status_filter: Optional[TaskStatus] = Query(
+        default=None, alias="status", description="Filter by status"
+    ),
+    limit: int = Query(
+        default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT, description="Page size"
+    ),
+    offset: int = Query(default=0, ge=0, description="Number of results to skip"),
+    service: AsyncTaskService = Depends(get_task_service),
+) -> TaskSearchPage:
+    """
+    Search task titles and descriptions, best match first.
+    
+    Every word of `q` must match the start of a word in the task (title
+    matches rank higher). On Postgres, misspelled words also match through
+    trigram similarity. Persian text is normalized: Arabic and Persian
+    yeh/kaf and the zero-width non-joiner (نیم‌فاصله) are treated alike.
+    Use `next_offset` as `offset` to fetch the next page.
+    """
+    try:
+        page = await service.search_tasks(q, status_filter, limit, offset)
+        return TaskSearchPage(tasks=page.items, next_offset=page.next_offset)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while searching tasks"
+        ) from e
+
+
+@router.get("/export")
+async def export_tasks(
+    export_format: ExportFormat = Query(
+        default="ndjson", alias="format", description="Output format: ndjson or csv"
+    ),
+    status_filter: Optional[TaskStatus] = Query(
+        default=None, alias="status", description="Filter by status"
+    ),
+) -> StreamingResponse:
+    """
+    Stream every task (optionally filtered by status) as NDJSON or CSV.
+    
+    Rows are read through a server-side cursor and written out batch by
+    batch, so memory use stays flat however large the table is.
+    """
+    async def generate():
+        # The stream outlives the request handler, so it owns its own session
+        async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+            service = AsyncTaskService(session)
+            if export_format == "csv":
+                yield csv_header()
+            async for rows in service.stream_tasks(status=status_filter):
+                yield encode_rows(rows, export_format)
+    
+    return StreamingResponse(
+        generate(),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format}"'},
+    )
 
 
 @router.get("/{task_id}", response_model=TaskRead)
-def get_task(
+async def get_task(
     task_id: int,
-    service: TaskService = Depends(get_task_service),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    service: AsyncTaskService = Depends(get_task_service),
 ) -> TaskRead:
-    """Get a single task by ID."""
-    task = service.get_task_by_id(task_id)
+    """
+    Get a single task by ID.
+    
+    The response carries an ETag; send it back in `If-None-Match` to get
+    `304 Not Modified` while the task is unchanged.
+    """
+    if if_none_match:
+        # Only updated_at is needed to answer 304
+        updated_at = await service.get_task_updated_at(task_id)
+        if updated_at is not None:
+            etag = task_etag(task_id, updated_at)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    task = await service.get_task_by_id(task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
+    response.headers["ETag"] = task_etag(task.id, task.updated_at)
     return task
 
 
 @router.post("", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     task_data: TaskCreate,
-    service: TaskService = Depends(get_task_service),
+    service: AsyncTaskService = Depends(get_task_service),
 ) -> TaskRead:
     """Create a new task."""
     try:
-        task = service.create_task(task_data)
+        task = await service.create_task(task_data)
         return task
     except ValueError as e:
         raise HTTPException(
@@ -73,23 +330,150 @@ def create_task(
         ) from e
 
 
+@router.post("/batch", response_model=list[TaskRead], status_code=status.HTTP_201_CREATED)
+async def create_tasks(
+    tasks_data: list[TaskCreate],
+    service: AsyncTaskService = Depends(get_task_service),
+) -> list[TaskRead]:
+    """
+    Create many tasks in one transaction.
+    
+    The created tasks are returned in the same order as the request body.
+    """
+    max_size = get_settings().task_batch_max_size
+    if not tasks_data or len(tasks_data) > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A batch must contain between 1 and {max_size} tasks"
+        )
+    try:
+        tasks = await service.create_tasks(tasks_data)
+        return tasks
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while creating the tasks"
+        ) from e
+
+
+@router.post("/import")
+async def import_tasks_upload(
+    request: Request,
+    import_format: ImportFormat = Query(
+        default="ndjson", alias="format", description="Input format: ndjson or csv"
+    ),
+) -> dict:
+    """
+    Bulk-load tasks from an NDJSON or CSV request body.
+    
+    The body is parsed while it streams in and loaded in chunks (COPY on
+    Postgres). Invalid rows are skipped and listed in the report with their
+    line numbers. CSV input needs a header row with at least a title column.
+    """
+    upload = open_async_upload(request.stream())
+    try:
+        report = await run_in_threadpool(import_tasks, upload, import_format)
+        return report.to_dict()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while importing tasks"
+        ) from e
+
+
+@router.patch("/bulk")
+async def update_tasks(
+    bulk_data: TaskBulkUpdate,
+    service: AsyncTaskService = Depends(get_task_service),
+) -> dict:
+    """
+    Update every task matching `ids` and/or `filter` in one statement.
+    
+    Example: `{"filter": {"status": "in_progress"}, "changes": {"status": "done"}}`
+    """
+    selection = bulk_data.filter or TaskFilter()
+    try:
+        ids = await service.update_tasks(
+            bulk_data.changes,
+            ids=bulk_data.ids,
+            status=selection.status,
+            created_before=selection.created_before,
+        )
+        return {"updated": len(ids), "ids": ids}
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while updating the tasks"
+        ) from e
+
+
+@router.delete("/bulk")
+async def delete_tasks(
+    bulk_data: TaskBulkDelete,
+    service: AsyncTaskService = Depends(get_task_service),
+) -> dict:
+    """Delete every task matching `ids` and/or `filter` in one statement."""
+    selection = bulk_data.filter or TaskFilter()
+    try:
+        ids = await service.delete_tasks(
+            ids=bulk_data.ids,
+            status=selection.status,
+            created_before=selection.created_before,
+        )
+        return {"deleted": len(ids), "ids": ids}
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred while deleting the tasks"
+        ) from e
+
+
 @router.put("/{task_id}", response_model=TaskRead)
-def update_task(
+async def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    service: TaskService = Depends(get_task_service),
+    response: Response,
+    if_match: Optional[str] = Header(default=None),
+    service: AsyncTaskService = Depends(get_task_service),
 ) -> TaskRead:
-    """Update an existing task."""
+    """
+    Update an existing task.
+    
+    With `If-Match: <etag>` the update only applies if the task is unchanged
+    since that ETag was issued, otherwise `412 Precondition Failed`.
+    """
+    if_updated_at = if_match_versions(if_match, task_id) if if_match else None
     try:
-        task = service.update_task(task_id, task_data)
+        task = await service.update_task(task_id, task_data, if_updated_at)
         if not task:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Task with id {task_id} not found"
             )
+        response.headers["ETag"] = task_etag(task.id, task.updated_at)
         return task
     except HTTPException:
         raise
+    except PreconditionFailedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=str(e)
+        ) from e
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -103,23 +487,32 @@ def update_task(
 
 
 @router.patch("/{task_id}", response_model=TaskRead)
-def patch_task(
+async def patch_task(
     task_id: int,
     task_data: TaskUpdate,
-    service: TaskService = Depends(get_task_service),
+    response: Response,
+    if_match: Optional[str] = Header(default=None),
+    service: AsyncTaskService = Depends(get_task_service),
 ) -> TaskRead:
-    """Partially update an existing task."""
-    return update_task(task_id, task_data, service)
+    """Partially update an existing task (honors `If-Match` like PUT)."""
+    return await update_task(task_id, task_data, response, if_match, service)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_200_OK)
-def delete_task(
+async def delete_task(
     task_id: int,
-    service: TaskService = Depends(get_task_service),
+    if_match: Optional[str] = Header(default=None),
+    service: AsyncTaskService = Depends(get_task_service),
 ) -> dict:
-    """Delete a task by ID."""
+    """
+    Delete a task by ID.
+    
+    With `If-Match: <etag>` the task is only deleted if it is unchanged
+    since that ETag was issued, otherwise `412 Precondition Failed`.
+    """
+    if_updated_at = if_match_versions(if_match, task_id) if if_match else None
     try:
-        deleted = service.delete_task(task_id)
+        deleted = await service.delete_task(task_id, if_updated_at)
         if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -128,6 +521,11 @@ def delete_task(
         return {"deleted": True, "id": task_id}
     except HTTPException:
         raise
+    except PreconditionFailedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=str(e)
+        ) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
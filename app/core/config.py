@@ -0,0 +1,68 @@
+"""Application settings loaded from the environment."""
+
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Tunable settings, read from environment variables or `.env`."""
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # Connection pool (applies to both the sync and the asyncio engine)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = -1
+    db_pool_pre_ping: bool = False
+    db_pool_use_lifo: bool = False
+
+    # Database setup at start-up: "auto" runs the DDL only when the schema
+    # version recorded in the database is behind, "always" runs it on every
+    # start, "skip" leaves the schema alone (managed elsewhere)
+    db_init: str = "auto"
+
+    # Maximum number of tasks accepted by one batch create call
+    task_batch_max_size: int = 5000
+
+    # Bulk import: rows validated and loaded per transaction, and how many
+    # bad rows are listed in the report
+    import_chunk_size: int = 5000
+    import_max_reported_errors: int = 100
+
+    # Single-task read cache: "memory" (per process LRU), "none", or an
+    # import path such as "mypkg.cache:RedisCache"
+    task_cache_backend: str = "memory"
+    task_cache_max_size: int = 1024
+    task_cache_ttl: float = 30.0
+
+    # Serialized task list pages, keyed on the tasks table version
+    list_cache_enabled: bool = True
+    list_cache_max_size: int = 256
+    list_cache_ttl: float = 5.0
+
+    # Seconds between recounts of the per-status task counters (0 disables)
+    stats_reconcile_interval: float = 3600.0
+
+    # Task change feed (GET /tasks/events): "auto" (Postgres LISTEN/NOTIFY on a
+    # Postgres database, in-process otherwise), "postgres", "memory" or "none".
+    # Recent events are kept for Last-Event-ID replay; a subscriber whose
+    # queue fills up is disconnected rather than slowing down publishers.
+    events_backend: str = "auto"
+    events_buffer_size: int = 10000
+    events_queue_size: int = 1000
+    events_heartbeat: float = 15.0
+
+    # JSON encoder for list responses: "auto" (orjson if installed), "orjson", "stdlib"
+    json_encoder: str = "auto"
+
+    # Default size budget (bytes) of an MCP list_tasks result; larger pages
+    # are cut short with a cursor to continue from
+    mcp_list_max_bytes: int = 65536
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Create and cache application settings."""
+    return Settings()
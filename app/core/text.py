@@ -0,0 +1,43 @@
+"""Text normalization for search (Persian/Arabic character variants)."""
+
+import re
+
+# Single-character replacements applied before indexing and searching.
+# Postgres applies the same table with translate() (see app/db/search.py);
+# SQLite calls normalize_text() itself.
+CHAR_MAP = {
+    "ي": "ی",  # Arabic yeh -> Persian yeh
+    "ى": "ی",  # Alef maksura -> Persian yeh
+    "ك": "ک",  # Arabic kaf -> Persian kaf
+    "ة": "ه",  # Teh marbuta -> heh
+    "ۀ": "ه",  # Heh with yeh above -> heh
+    "أ": "ا",  # Alef with hamza above -> alef
+    "إ": "ا",  # Alef with hamza below -> alef
+    "‌": " ",  # Zero-width non-joiner (نیم‌فاصله) -> space
+    **{chr(0x06F0 + i): str(i) for i in range(10)},  # Persian digits
+    **{chr(0x0660 + i): str(i) for i in range(10)},  # Arabic-Indic digits
+}
+
+# Characters dropped entirely: tatweel and Arabic diacritics (harakat)
+DROPPED_CHARS = "ـ" + "".join(chr(code) for code in range(0x064B, 0x0653))
+
+_TRANSLATION = str.maketrans({**CHAR_MAP, **{char: None for char in DROPPED_CHARS}})
+_WORD = re.compile(r"\w+")
+
+
+def normalize_text(value: str) -> str:
+    """
+    Normalize text for search: unify Persian/Arabic variants and lowercase.
+
+    Args:
+        value: Raw text
+
+    Returns:
+        Normalized text
+    """
+    return value.translate(_TRANSLATION).lower()
+
+
+def search_terms(value: str) -> list[str]:
+    """Split normalized text into word terms."""
+    return _WORD.findall(normalize_text(value))
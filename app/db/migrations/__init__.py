@@ -0,0 +1 @@
+"""Versioned schema migrations, applied in order by init_db or python -m app.db.migrations."""
@@ -0,0 +1,6 @@
+"""Schema migration entry point for running as module."""
+
+from app.db.migrations.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Command-line schema migrations.
+
+Usage:
+    uv run python -m app.db.migrations            # apply pending migrations
+    uv run python -m app.db.migrations --status   # list applied and pending ones
+"""
+
+import argparse
+import json
+import sys
+from typing import Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.db.migrations.runner import migrate, migration_status
+from app.db.session import get_engine
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.db.migrations",
+        description="Apply the pending schema migrations (indexes built concurrently on Postgres).",
+    )
+    parser.add_argument("--status", action="store_true", help="List the migrations and exit")
+    parser.add_argument(
+        "--reapply",
+        action="store_true",
+        help="Also re-run the applied migrations, e.g. to restore a dropped index or trigger",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Main entry point."""
+    args = parse_args(argv)
+    engine = get_engine()
+
+    try:
+        if args.status:
+            report = migration_status(engine)
+        else:
+            report = {"ran": migrate(engine, reapply=args.reapply)}
+    except (SQLAlchemyError, RuntimeError) as e:
+        print(f"Migration failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
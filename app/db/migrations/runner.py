@@ -0,0 +1,228 @@
+"""Discover the migration scripts and apply the pending ones."""
+
+import importlib
+import pkgutil
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import Connection, Engine, text
+
+from app.db.schema import (
+    SCHEMA_VERSION, ensure_schema_version_table, get_applied_migrations, record_schema_version,
+)
+
+VERSIONS_PACKAGE = "app.db.migrations.versions"
+
+# Script file names: v<version>_<name>.py
+SCRIPT_NAME = re.compile(r"^v(\d+)_(\w+)$")
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One migration script."""
+
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+    # False: run outside a transaction (CREATE/DROP INDEX CONCURRENTLY)
+    transactional: bool = True
+
+
+@lru_cache
+def load_migrations() -> tuple[Migration, ...]:
+    """
+    Import the migration scripts, ordered by version.
+
+    Returns:
+        Every migration, oldest first
+
+    Raises:
+        RuntimeError: If versions are missing or repeated, or the newest
+            one is not SCHEMA_VERSION
+    """
+    package = importlib.import_module(VERSIONS_PACKAGE)
+    migrations = []
+    for module_info in pkgutil.iter_modules(package.__path__):
+        match = SCRIPT_NAME.match(module_info.name)
+        if match is None:
+            continue
+        module = importlib.import_module(f"{VERSIONS_PACKAGE}.{module_info.name}")
+        migrations.append(Migration(
+            version=int(match.group(1)),
+            name=match.group(2),
+            upgrade=module.upgrade,
+            transactional=getattr(module, "TRANSACTIONAL", True),
+        ))
+    migrations.sort(key=lambda migration: migration.version)
+
+    versions = [migration.version for migration in migrations]
+    if versions != list(range(1, len(versions) + 1)):
+        raise RuntimeError(f"Migration versions must run 1, 2, 3, ... without gaps, found {versions}")
+    if versions[-1] != SCHEMA_VERSION:
+        raise RuntimeError(f"SCHEMA_VERSION is {SCHEMA_VERSION} but the newest migration is {versions[-1]}")
+    return tuple(migrations)
+
+
+def _require_autocommit(connection: Connection, statement: str) -> None:
+    """CONCURRENTLY cannot run inside a transaction block."""
+    if connection.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+        raise RuntimeError(f"{statement} must run in a migration with TRANSACTIONAL = False")
+
+
+def create_index(
+    connection: Connection,
+    name: str,
+    table: str,
+    columns: str,
+    using: Optional[str] = None,
+    where: Optional[str] = None,
+) -> None:
+    """
+    Create an index if it is missing, without blocking writes on Postgres.
+
+    On Postgres this is CREATE INDEX CONCURRENTLY: the table stays
+    writable while the index builds. A build that failed or was
+    interrupted leaves an invalid index behind, which IF NOT EXISTS would
+    keep, so an invalid index of the same name is dropped and rebuilt.
+    SQLite has no concurrent build and uses a plain CREATE INDEX.
+
+    Args:
+        connection: Connection of a migration with TRANSACTIONAL = False
+        name: Index name
+        table: Table name
+        columns: Column list (or expressions), e.g. "status, created_at"
+        using: Index method on Postgres, e.g. "gin"
+        where: Predicate of a partial index
+
+    Raises:
+        RuntimeError: If the migration runs in a transaction (Postgres)
+    """
+    predicate = f" WHERE {where}" if where else ""
+    if connection.dialect.name != "postgresql":
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns}){predicate}"))
+        return
+
+    _require_autocommit(connection, "CREATE INDEX CONCURRENTLY")
+    valid = connection.execute(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {"name": name}
+    ).scalar()
+    if valid is False:
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+    method = f" USING {using}" if using else ""
+    connection.execute(
+        text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table}{method} ({columns}){predicate}")
+    )
+
+
+def drop_index(connection: Connection, name: str) -> None:
+    """
+    Drop an index if it exists, without blocking reads or writes on Postgres.
+
+    Args:
+        connection: Connection of a migration with TRANSACTIONAL = False
+        name: Index name
+
+    Raises:
+        RuntimeError: If the migration runs in a transaction (Postgres)
+    """
+    if connection.dialect.name != "postgresql":
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        return
+    _require_autocommit(connection, "DROP INDEX CONCURRENTLY")
+    connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+
+@contextmanager
+def _migration_lock(engine: Engine) -> Iterator[None]:
+    """
+    Serialize migration runs across processes on Postgres.
+
+    A session-level advisory lock, held on its own idle connection: a
+    concurrent index build waits for every open transaction, so the lock
+    must not keep one open.
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        connection.execute(text("SELECT pg_advisory_lock(hashtext('schema_migrations'))"))
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(hashtext('schema_migrations'))"))
+
+
+def _apply(engine: Engine, migration: Migration, record: bool) -> None:
+    """Run one migration and record it."""
+    if migration.transactional or engine.dialect.name != "postgresql":
+        with engine.begin() as connection:
+            migration.upgrade(connection)
+            if record:
+                record_schema_version(connection, migration.version, migration.name)
+        return
+
+    # Each statement commits on its own; a failure part-way leaves the
+    # migration unrecorded, and its idempotent steps run again next time
+    with engine.connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        migration.upgrade(connection)
+    if record:
+        with engine.begin() as connection:
+            record_schema_version(connection, migration.version, migration.name)
+
+
+def migrate(engine: Engine, reapply: bool = False) -> list[int]:
+    """
+    Apply the pending migrations, oldest first.
+
+    Workers starting together on Postgres wait for each other, and each
+    sees the migrations the first one applied.
+
+    Args:
+        engine: Sync engine
+        reapply: Also run the migrations already applied (every step is
+            idempotent), without recording them again
+
+    Returns:
+        Versions of the migrations that ran
+    """
+    migrations = load_migrations()
+    with _migration_lock(engine):
+        with engine.begin() as connection:
+            ensure_schema_version_table(connection)
+            applied = get_applied_migrations(connection)
+
+        ran = []
+        for migration in migrations:
+            if migration.version in applied and not reapply:
+                continue
+            _apply(engine, migration, record=migration.version not in applied)
+            ran.append(migration.version)
+    return ran
+
+
+def migration_status(engine: Engine) -> list[dict]:
+    """
+    List every migration and whether it has been applied.
+
+    Returns:
+        Version, name, transactional flag, applied flag and applied_at
+        (None for versions stamped before migrations were recorded)
+    """
+    with engine.begin() as connection:
+        ensure_schema_version_table(connection)
+        applied = get_applied_migrations(connection)
+    return [
+        {
+            "version": migration.version,
+            "name": migration.name,
+            "transactional": migration.transactional,
+            "applied": migration.version in applied,
+            "applied_at": applied.get(migration.version, {}).get("applied_at"),
+        }
+        for migration in load_migrations()
+    ]
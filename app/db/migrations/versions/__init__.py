@@ -0,0 +1,11 @@
+"""
+Migration scripts, applied in version order.
+
+Each script is named v<version>_<name>.py, with versions numbered from 1
+without gaps, and defines upgrade(connection). Every step must be
+idempotent (IF NOT EXISTS, CREATE OR REPLACE): a script that failed
+part-way runs again from the start. Scripts that create or drop indexes
+on existing tables set TRANSACTIONAL = False and use create_index /
+drop_index from app.db.migrations.runner, which build concurrently on
+Postgres. After adding a script, bump SCHEMA_VERSION in app.db.schema.
+"""
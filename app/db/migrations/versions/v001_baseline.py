@@ -0,0 +1,18 @@
+"""Tables, per-status count triggers and search columns: the schema init_db created before migrations."""
+
+from sqlalchemy import Connection
+from sqlmodel import SQLModel
+
+from app.db.search import install_search_indexes
+from app.db.triggers import install_status_count_triggers
+
+
+def upgrade(connection: Connection) -> None:
+    """Create whatever part of the baseline schema is missing."""
+    from app.models.task import Task, TaskStatusCount  # noqa: F401
+
+    # Creates missing tables only: indexes of tables that already exist
+    # are built concurrently by v002
+    SQLModel.metadata.create_all(connection)
+    install_status_count_triggers(connection)
+    install_search_indexes(connection)
@@ -0,0 +1,33 @@
+"""
+Build the tasks indexes that create_all only adds to new tables.
+
+Databases created before the keyset pagination and ETag indexes were
+declared on the model, or before search, have none of them: create_all
+skips existing tables. Built concurrently on Postgres, where the search
+indexes are expression indexes (app.db.search).
+"""
+
+from sqlalchemy import Connection, text
+
+from app.db.migrations.runner import create_index
+from app.db.search import POSTGRES_INDEXES
+
+TRANSACTIONAL = False
+
+
+def upgrade(connection: Connection) -> None:
+    """Create the missing indexes without blocking writes."""
+    # Keyset pagination: ORDER BY created_at DESC, id DESC (optionally per status)
+    create_index(connection, "ix_tasks_status_created_at_id", "tasks", "status, created_at, id")
+    create_index(connection, "ix_tasks_created_at_id", "tasks", "created_at, id")
+    # List ETags: COUNT(*) and MAX(updated_at), optionally per status
+    create_index(connection, "ix_tasks_status_updated_at", "tasks", "status, updated_at")
+
+    if connection.dialect.name == "postgresql":
+        # Search now indexes expressions; the stored generated columns an
+        # earlier baseline added go (dropping a column is catalog-only)
+        connection.execute(text(
+            "ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector, DROP COLUMN IF EXISTS search_text"
+        ))
+        for name, method, columns in POSTGRES_INDEXES:
+            create_index(connection, name, "tasks", columns, using=method)
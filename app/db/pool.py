@@ -0,0 +1,110 @@
+"""Instrumented connection pools for sizing the pool under real load."""
+
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """Thread-safe counters for connection checkouts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def observe_wait(self, wait_ms: float) -> None:
+        """Record how long a successful checkout took."""
+        index = next(
+            (i for i, bound in enumerate(WAIT_BUCKETS_MS) if wait_ms <= bound),
+            len(WAIT_BUCKETS_MS),
+        )
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.wait_buckets[index] += 1
+
+    def record_timeout(self) -> None:
+        """Record a checkout that gave up after pool_timeout."""
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        """Return a copy of the counters."""
+        with self._lock:
+            labels = [str(bound) for bound in WAIT_BUCKETS_MS] + ["+Inf"]
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "wait_ms_avg": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_max_ms, 3),
+                "wait_ms_histogram": dict(zip(labels, self.wait_buckets)),
+            }
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout and counts checkout timeouts."""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.observe_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep the history
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """QueuePool with checkout metrics, for the sync engine."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout metrics, for the asyncio engine."""
+
+
+def pool_stats(pool: Pool) -> dict:
+    """
+    Describe the live state of a pool.
+
+    Args:
+        pool: The engine's pool (engine.pool)
+
+    Returns:
+        Dictionary with occupancy and, for instrumented pools, checkout metrics
+    """
+    stats = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, InstrumentedPoolMixin):
+        stats.update(pool.metrics.snapshot())
+    return stats
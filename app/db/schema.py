@@ -0,0 +1,89 @@
+"""Schema version table, so a start-up can skip init_db's DDL when nothing changed."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    Column, Connection, DateTime, Engine, Integer, MetaData, String, Table, func, insert, inspect, select, text,
+)
+from sqlalchemy.exc import DBAPIError
+
+# Version of the newest migration in app/db/migrations/versions; add a
+# migration (and bump this) whenever the schema changes, so existing
+# databases get it on their next start
+SCHEMA_VERSION = 2
+
+DB_INIT_MODES = ("auto", "always", "skip")
+
+# One row per applied migration
+schema_version_table = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, nullable=False),
+    Column("name", String(200), nullable=True),
+    Column("applied_at", DateTime, nullable=True),
+)
+
+
+def get_schema_version(engine: Engine) -> Optional[int]:
+    """
+    Read the version of the newest applied migration.
+
+    One query and no catalog lookups: a database that has never been
+    initialized (no schema_version table) simply fails it.
+
+    Returns:
+        The recorded version, or None if there is none
+    """
+    try:
+        with engine.connect() as connection:
+            return connection.execute(select(func.max(schema_version_table.c.version))).scalar()
+    except DBAPIError:
+        return None
+
+
+def ensure_schema_version_table(connection: Connection) -> None:
+    """
+    Create the schema_version table, or add the columns it gained since.
+
+    Databases stamped before migrations existed have only a version column.
+
+    Args:
+        connection: Connection with an open transaction
+    """
+    schema_version_table.create(connection, checkfirst=True)
+    existing = {column["name"] for column in inspect(connection).get_columns(schema_version_table.name)}
+    for column in schema_version_table.columns:
+        if column.name not in existing:
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.execute(text(f"ALTER TABLE schema_version ADD COLUMN {column.name} {column_type}"))
+
+
+def get_applied_migrations(connection: Connection) -> dict[int, dict]:
+    """
+    Read the applied migrations.
+
+    Args:
+        connection: Connection to a database with a schema_version table
+
+    Returns:
+        Name and applied_at of each applied migration, by version
+    """
+    rows = connection.execute(
+        select(schema_version_table).order_by(schema_version_table.c.version)
+    ).mappings()
+    return {row["version"]: {"name": row["name"], "applied_at": row["applied_at"]} for row in rows}
+
+
+def record_schema_version(connection: Connection, version: int, name: Optional[str] = None) -> None:
+    """
+    Record an applied migration, in the transaction that finished it.
+
+    Args:
+        connection: Connection with an open transaction
+        version: Version of the migration
+        name: Name of the migration
+    """
+    connection.execute(
+        insert(schema_version_table).values(version=version, name=name, applied_at=datetime.utcnow())
+    )
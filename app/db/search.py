@@ -0,0 +1,139 @@
+"""Full-text / fuzzy search indexes over task title and description."""
+
+from sqlalchemy import Connection, text
+
+from app.core.text import CHAR_MAP, DROPPED_CHARS, normalize_text
+
+# translate() arguments applying app.core.text's normalization in SQL: the
+# mapped characters, then the dropped ones (no counterpart, so removed)
+_TRANSLATE_FROM = "".join(CHAR_MAP) + DROPPED_CHARS
+_TRANSLATE_TO = "".join(CHAR_MAP.values())
+
+
+def postgres_normalize(expression: str) -> str:
+    """SQL applying normalize_text() to a text expression on Postgres."""
+    return f"lower(translate({expression}, '{_TRANSLATE_FROM}', '{_TRANSLATE_TO}'))"
+
+
+def _sqlite_normalize(value):
+    """normalize_text() passing NULL through, for SQLite."""
+    return normalize_text(value) if value is not None else None
+
+
+def register_sqlite_functions(dbapi_connection, connection_record) -> None:
+    """
+    Engine "connect" hook exposing normalize_text() to SQLite SQL.
+
+    SQLite has no translate(), and one nested replace() per character
+    overflows its parser, so the FTS triggers call back into Python.
+    """
+    dbapi_connection.create_function("normalize_text", 1, _sqlite_normalize, deterministic=True)
+
+
+_PG_TITLE = postgres_normalize("title")
+_PG_DESCRIPTION = postgres_normalize("coalesce(description, '')")
+
+# Postgres: expression indexes over the normalized text and its tsvector,
+# so no column is added (a stored generated column would rewrite the whole
+# table under an exclusive lock) and every write path (ORM, bulk
+# statements, COPY imports) is indexed alike. The search queries use these
+# exact expressions, which is what lets the planner use the indexes.
+# SEARCH_VECTOR ('simple' config: no stemming, so Persian and English terms
+# are indexed alike) serves ranked prefix matches; the trigram index on
+# SEARCH_TEXT serves word_similarity() for typo tolerance.
+SEARCH_TEXT = f"({_PG_TITLE} || ' ' || {_PG_DESCRIPTION})"
+SEARCH_VECTOR = (
+    f"(setweight(to_tsvector('simple'::regconfig, {_PG_TITLE}), 'A')"
+    f" || setweight(to_tsvector('simple'::regconfig, {_PG_DESCRIPTION}), 'B'))"
+)
+
+POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+]
+
+# (name, method, columns) of the Postgres search indexes, built
+# concurrently by a migration through create_index
+POSTGRES_INDEXES = [
+    ("ix_tasks_search_vector", "gin", SEARCH_VECTOR),
+    ("ix_tasks_search_text_trgm", "gin", f"{SEARCH_TEXT} gin_trgm_ops"),
+]
+
+# SQLite: a contentless FTS5 table (it stores only the index, rowid = task
+# id) fed normalized text by row triggers through the normalize_text()
+# function registered by register_sqlite_functions. Removing an entry from a
+# contentless table needs the exact values that were indexed, hence the
+# 'delete' command with the OLD values.
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, content='', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (NEW.id, normalize_text(NEW.title), normalize_text(NEW.description));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', OLD.id, normalize_text(OLD.title), normalize_text(OLD.description));
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', OLD.id, normalize_text(OLD.title), normalize_text(OLD.description));
+        INSERT INTO tasks_fts (rowid, title, description)
+        VALUES (NEW.id, normalize_text(NEW.title), normalize_text(NEW.description));
+    END
+    """,
+]
+
+# Index rows that existed before the FTS table was created
+SQLITE_BACKFILL = """
+    INSERT INTO tasks_fts (rowid, title, description)
+    SELECT id, normalize_text(title), normalize_text(description) FROM tasks
+"""
+
+SEARCH_DDL = {
+    "postgresql": POSTGRES_DDL,
+    "sqlite": SQLITE_DDL,
+}
+
+
+def install_search_indexes(connection: Connection) -> bool:
+    """
+    Create the search extension, tables and triggers if they are missing.
+
+    On Postgres only the pg_trgm extension: the GIN indexes
+    (POSTGRES_INDEXES) are built concurrently by a migration.
+
+    Args:
+        connection: Connection with an open transaction
+
+    Returns:
+        True if the dialect is supported and the indexes were installed
+    """
+    statements = SEARCH_DDL.get(connection.dialect.name)
+    if statements is None:
+        return False
+
+    backfill = False
+    if connection.dialect.name == "postgresql":
+        # Workers starting together would otherwise race on the DDL
+        connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('tasks_search'))"))
+    else:
+        backfill = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'")
+        ).first() is None
+
+    for statement in statements:
+        connection.execute(text(statement))
+    if backfill:
+        connection.execute(text(SQLITE_BACKFILL))
+    return True
@@ -1,10 +1,18 @@
 """Database session and connection management."""
 
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from functools import lru_cache
+from typing import Optional
 import os
 from dotenv import load_dotenv
 
+from app.core.config import get_settings
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+from app.db.search import register_sqlite_functions
+
 load_dotenv()
 
 
@@ -22,31 +30,118 @@ def get_database_url() -> str:
     return database_url
 
 
+def get_pool_options(database_url: str) -> dict:
+    """Build connection pool arguments from settings."""
+    if database_url.startswith("sqlite") and ":memory:" in database_url:
+        # In-memory SQLite needs its default single-connection pool
+        return {}
+    
+    settings = get_settings()
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+    }
+
+
 @lru_cache
 def get_engine():
     """Create and cache database engine."""
     database_url = get_database_url()
-    engine = create_engine(database_url, echo=False)
+    pool_options = get_pool_options(database_url)
+    if pool_options:
+        pool_options["poolclass"] = InstrumentedQueuePool
+    engine = create_engine(database_url, echo=False, **pool_options)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", register_sqlite_functions)
+    return engine
+
+
+@lru_cache
+def get_async_database_url() -> str:
+    """Get database URL for the asyncio driver (psycopg3 async, aiosqlite for SQLite)."""
+    database_url = get_database_url()
+    if database_url.startswith("sqlite://"):
+        database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return database_url
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Create and cache the asyncio database engine."""
+    database_url = get_async_database_url()
+    pool_options = get_pool_options(database_url)
+    if pool_options:
+        pool_options["poolclass"] = InstrumentedAsyncAdaptedQueuePool
+    engine = create_async_engine(database_url, echo=False, **pool_options)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", register_sqlite_functions)
     return engine
 
 
 def get_session():
     """Get a new database session."""
     engine = get_engine()
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def get_async_session():
+    """Get a new asyncio database session."""
+    engine = get_async_engine()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
         yield session
 
 
 def get_sync_session() -> Session:
     """Get a synchronous database session (for MCP server)."""
     engine = get_engine()
-    return Session(engine)
+    return Session(engine, expire_on_commit=False)
 
 
-def init_db():
-    """Initialize the database by creating all tables."""
-    from app.models.task import Task  # noqa: F401
-    from sqlmodel import SQLModel
+def init_db(mode: Optional[str] = None) -> bool:
+    """
+    Initialize the database: apply pending migrations and seed the status counts.
+    
+    In "auto" mode the migrations run only if the schema version recorded in
+    the database is older than this code's (see app.db.schema), so a restart
+    against an up-to-date database costs one query instead of the catalog
+    checks and DDL statements.
+    
+    Args:
+        mode: "auto", "always" (also re-run the applied migrations) or
+            "skip" (touch nothing); defaults to the DB_INIT setting
+    
+    Returns:
+        True if any migration ran
+    
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    from app.db.schema import DB_INIT_MODES, SCHEMA_VERSION, get_schema_version
+    
+    mode = mode or get_settings().db_init
+    if mode not in DB_INIT_MODES:
+        raise ValueError(f"Unknown database init mode: {mode}. Must be one of: {', '.join(DB_INIT_MODES)}")
+    if mode == "skip":
+        return False
     
     engine = get_engine()
-    SQLModel.metadata.create_all(engine)
+    if mode == "auto" and (get_schema_version(engine) or 0) >= SCHEMA_VERSION:
+        return False
+    
+    from sqlmodel import select
+    from app.db.migrations.runner import migrate
+    from app.models.task import TaskStatusCount
+    from app.services.task_stats import reconcile_status_counts
+    
+    ran = migrate(engine, reapply=mode == "always")
+    with engine.connect() as connection:
+        seeded = connection.execute(select(TaskStatusCount.status).limit(1)).first()
+    if seeded is None:
+        # Fresh counter table (or no tasks yet): count existing rows once
+        reconcile_status_counts(engine)
+    return bool(ran)
@@ -0,0 +1,119 @@
+"""Triggers keeping task_status_counts in step with the tasks table."""
+
+from sqlalchemy import Connection, text
+
+# Postgres: one statement-level trigger per event, because transition tables
+# (the set of rows a statement touched) can only be declared for a single
+# event. Bulk updates and COPY imports cost one counter upsert per status
+# instead of one per row. Deltas are always applied with an upsert so a
+# counter row recreated by reconciliation is never skipped.
+POSTGRES_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION task_status_counts_insert() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO task_status_counts (status, count)
+        SELECT status, COUNT(*) FROM new_rows GROUP BY status
+        ON CONFLICT (status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+        RETURN NULL;
+    END $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION task_status_counts_delete() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO task_status_counts (status, count)
+        SELECT status, -COUNT(*) FROM old_rows GROUP BY status
+        ON CONFLICT (status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+        RETURN NULL;
+    END $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION task_status_counts_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO task_status_counts (status, count)
+        SELECT status, SUM(delta) FROM (
+            SELECT status, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT status, -1 AS delta FROM old_rows
+        ) AS changes
+        GROUP BY status
+        HAVING SUM(delta) <> 0
+        ON CONFLICT (status) DO UPDATE SET count = task_status_counts.count + EXCLUDED.count;
+        RETURN NULL;
+    END $$
+    """,
+    "DROP TRIGGER IF EXISTS tasks_status_counts_insert ON tasks",
+    """
+    CREATE TRIGGER tasks_status_counts_insert AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION task_status_counts_insert()
+    """,
+    "DROP TRIGGER IF EXISTS tasks_status_counts_delete ON tasks",
+    """
+    CREATE TRIGGER tasks_status_counts_delete AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION task_status_counts_delete()
+    """,
+    "DROP TRIGGER IF EXISTS tasks_status_counts_update ON tasks",
+    """
+    CREATE TRIGGER tasks_status_counts_update AFTER UPDATE ON tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION task_status_counts_update()
+    """,
+]
+
+# SQLite has no statement-level triggers; row triggers with upserts instead
+SQLITE_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_status_counts_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO task_status_counts (status, count) VALUES (NEW.status, 1)
+        ON CONFLICT (status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_status_counts_delete AFTER DELETE ON tasks
+    BEGIN
+        INSERT INTO task_status_counts (status, count) VALUES (OLD.status, -1)
+        ON CONFLICT (status) DO UPDATE SET count = count - 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_status_counts_update AFTER UPDATE OF status ON tasks
+    WHEN OLD.status IS NOT NEW.status
+    BEGIN
+        INSERT INTO task_status_counts (status, count) VALUES (OLD.status, -1)
+        ON CONFLICT (status) DO UPDATE SET count = count - 1;
+        INSERT INTO task_status_counts (status, count) VALUES (NEW.status, 1)
+        ON CONFLICT (status) DO UPDATE SET count = count + 1;
+    END
+    """,
+]
+
+STATUS_COUNT_DDL = {
+    "postgresql": POSTGRES_DDL,
+    "sqlite": SQLITE_DDL,
+}
+
+
+def install_status_count_triggers(connection: Connection) -> bool:
+    """
+    Create (or replace) the task_status_counts triggers.
+
+    Args:
+        connection: Connection with an open transaction
+
+    Returns:
+        True if the dialect is supported and the triggers were installed
+    """
+    statements = STATUS_COUNT_DDL.get(connection.dialect.name)
+    if statements is None:
+        return False
+    if connection.dialect.name == "postgresql":
+        # Workers starting together would otherwise race on the DDL
+        connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('task_status_counts'))"))
+    for statement in statements:
+        connection.execute(text(statement))
+    return True
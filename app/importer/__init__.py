@@ -0,0 +1 @@
+"""Bulk task import command-line package."""
@@ -0,0 +1,6 @@
+"""Bulk import entry point for running as module."""
+
+from app.importer.cli import main
+
+if __name__ == "__main__":
+    main()
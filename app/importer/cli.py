@@ -0,0 +1,73 @@
+"""
+Command-line bulk import of tasks from NDJSON or CSV files.
+
+Usage:
+    uv run python -m app.importer tasks.ndjson
+    uv run python -m app.importer tasks.csv --chunk-size 20000
+    cat tasks.ndjson | uv run python -m app.importer - --format ndjson
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+from app.services.task_import import import_tasks
+
+
+def detect_format(path: str, import_format: Optional[str]) -> str:
+    """Use the explicit format, otherwise infer it from the file extension."""
+    if import_format:
+        return import_format
+    if Path(path).suffix.lower() == ".csv":
+        return "csv"
+    return "ndjson"
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.importer",
+        description="Bulk-load tasks from NDJSON or CSV (COPY on Postgres).",
+    )
+    parser.add_argument("file", help="Input file, or - for stdin")
+    parser.add_argument(
+        "--format",
+        dest="import_format",
+        choices=["ndjson", "csv"],
+        help="Input format (default: from the file extension, else ndjson)",
+    )
+    parser.add_argument("--chunk-size", type=int, help="Rows loaded per transaction")
+    parser.add_argument("--max-errors", type=int, help="Error messages kept in the report")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Main entry point."""
+    args = parse_args(argv)
+    import_format = detect_format(args.file, args.import_format)
+
+    try:
+        if args.file == "-":
+            source = open(sys.stdin.fileno(), encoding="utf-8", newline="", closefd=False)
+        else:
+            source = open(args.file, encoding="utf-8", newline="")
+        with source:
+            report = import_tasks(
+                source,
+                import_format,
+                chunk_size=args.chunk_size,
+                max_errors=args.max_errors,
+            )
+    except (OSError, ValueError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+    if report.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
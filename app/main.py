@@ -1,36 +1,47 @@
 """FastAPI main application."""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 
-from app.api.routes.tasks import router as tasks_router
-from app.db.session import init_db
+from app.core.config import get_settings
+from app.db.session import get_async_engine
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
-    # Startup: Initialize database tables
+    # Start-up only code is imported here, off the import path of the app
+    from app.db.session import init_db
+    from app.services.events import event_listener
+    from app.services.task_stats import reconcile_periodically
+    
+    # Startup: Initialize database tables (DB_INIT: auto / always / skip)
     print("Initializing database...")
-    init_db()
-    print("Database initialized successfully!")
-    yield
-    # Shutdown: cleanup if needed
-    print("Shutting down...")
-
-
-app = FastAPI(
-    title="Todo Service API",
-    description="A RESTful API for managing tasks/todos",
-    version="1.0.0",
-    lifespan=lifespan,
-)
+    if init_db():
+        print("Database initialized successfully!")
+    else:
+        print("Database schema is up to date; skipped initialization.")
+    
+    # Periodically correct any drift in the per-status task counters
+    interval = get_settings().stats_reconcile_interval
+    reconciler = asyncio.create_task(reconcile_periodically(interval)) if interval > 0 else None
+    # Fan task events out from Postgres NOTIFY to this worker's subscribers
+    # and caches
+    async with event_listener():
+        yield
+        # Shutdown: stop background jobs and release pooled connections
+        print("Shutting down...")
+    if reconciler is not None:
+        reconciler.cancel()
+        with suppress(asyncio.CancelledError):
+            await reconciler
+    await get_async_engine().dispose()
 
 
 # Custom exception handlers
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors with clean messages."""
     errors = []
@@ -49,7 +60,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-@app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected errors without exposing internal details."""
     return JSONResponse(
@@ -61,11 +71,6 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Include routers
-app.include_router(tasks_router, prefix="/api/v1")
-
-
-@app.get("/", tags=["health"])
 def root():
     """Root endpoint - health check."""
     return {
@@ -75,7 +80,46 @@ def root():
     }
 
 
-@app.get("/health", tags=["health"])
 def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application.
+    
+    The routers (and through them the services, search, events and
+    serializers) are imported here rather than at module level, so
+    importing app.main stays cheap for code that only needs its helpers;
+    `app.main:app` builds the application on first access.
+    
+    Returns:
+        FastAPI application
+    """
+    from app.api.routes.metrics import router as metrics_router
+    from app.api.routes.tasks import router as tasks_router
+    
+    application = FastAPI(
+        title="Todo Service API",
+        description="A RESTful API for managing tasks/todos",
+        version="1.0.0",
+        lifespan=lifespan,
+    )
+    application.add_exception_handler(RequestValidationError, validation_exception_handler)
+    application.add_exception_handler(Exception, general_exception_handler)
+    
+    # Include routers
+    application.include_router(tasks_router, prefix="/api/v1")
+    application.include_router(metrics_router, prefix="/api/v1")
+    application.add_api_route("/", root, methods=["GET"], tags=["health"])
+    application.add_api_route("/health", health_check, methods=["GET"], tags=["health"])
+    return application
+
+
+def __getattr__(name: str):
+    """Build `app` (e.g. for `uvicorn app.main:app`) on first access."""
+    if name == "app":
+        application = globals()["app"] = create_app()
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,191 @@
+"""Non-interactive batch mode for the MCP clients: pipelined commands in, NDJSON out."""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from typing import Callable, Optional, TextIO, Tuple
+
+DEFAULT_CONCURRENCY = 8
+
+# Finished results held back waiting for an earlier, slower command, per
+# call in flight; bounds memory when one call stalls
+REORDER_WINDOW = 4
+
+Parser = Callable[[str], Tuple[Optional[str], dict]]
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --batch / --concurrency options of the clients."""
+    group = parser.add_argument_group("batch mode")
+    group.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Run the commands in FILE (one per line, - for stdin) and print NDJSON results",
+    )
+    group.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Tool calls in flight in batch mode (default: {DEFAULT_CONCURRENCY})",
+    )
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    if not samples:
+        return 0.0
+    index = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def _content(result) -> object:
+    """A tool result's first text content, parsed as JSON when it is JSON."""
+    texts = [content.text for content in result.content if getattr(content, "type", None) == "text"]
+    if not texts:
+        return None
+    try:
+        return json.loads(texts[0])
+    except json.JSONDecodeError:
+        return texts[0]
+
+
+async def _run_command(session, line_number: int, command: str, parse: Parser, slots: asyncio.Semaphore) -> dict:
+    """Parse one command and make its call once a slot is free."""
+    record = {"line": line_number, "command": command}
+    tool_name, arguments = parse(command)
+    if not tool_name:
+        record.update(ok=False, error="unrecognized command")
+        return record
+    record.update(tool=tool_name, arguments=arguments)
+
+    async with slots:
+        started = time.perf_counter()
+        try:
+            if tool_name.startswith("prompt:"):
+                prompt = await session.get_prompt(tool_name.split(":", 1)[1], arguments)
+                result = "\n".join(getattr(message.content, "text", "") for message in prompt.messages)
+                failed = False
+            else:
+                response = await session.call_tool(tool_name, arguments)
+                result = _content(response)
+                failed = response.isError or (isinstance(result, dict) and "error" in result)
+        except Exception as e:
+            record.update(ok=False, error=str(e) or type(e).__name__)
+            record["ms"] = round((time.perf_counter() - started) * 1000, 2)
+            return record
+        record["ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    record.update(ok=not failed, result=result)
+    return record
+
+
+async def run_batch(
+    session,
+    parse: Parser,
+    source: TextIO,
+    out: TextIO,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict:
+    """
+    Run every command from `source` and write one JSON result per line to `out`.
+
+    Commands are read as they arrive, so a pipe can feed the batch while
+    it runs; up to `concurrency` tool calls are in flight on the one
+    session at a time. Results are written in input order, each with its
+    line number, command, tool, arguments, ok flag, result or error and
+    call latency. Blank lines and lines starting with "#" are skipped.
+
+    Args:
+        session: Connected session (ReconnectingSession or ClientSession)
+        parse: Maps a command to (tool_name, arguments); "prompt:<name>"
+            tools are fetched with get_prompt
+        source: Commands, one per line
+        out: Where to write the NDJSON results
+        concurrency: Maximum tool calls in flight
+
+    Returns:
+        Summary: command counts, wall time, throughput and latency percentiles
+    """
+    slots = asyncio.Semaphore(max(1, concurrency))
+    window = max(1, concurrency) * REORDER_WINDOW
+    pending: deque[asyncio.Task] = deque()
+    latencies: list[float] = []
+    counts = {"commands": 0, "ok": 0, "failed": 0, "unrecognized": 0}
+
+    def write(record: dict) -> None:
+        counts["commands"] += 1
+        if record["ok"]:
+            counts["ok"] += 1
+        elif "tool" not in record:
+            counts["unrecognized"] += 1
+        else:
+            counts["failed"] += 1
+        if "ms" in record:
+            latencies.append(record["ms"])
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    async def flush(wait: bool) -> None:
+        while pending and (wait or pending[0].done()):
+            write(await pending.popleft())
+        out.flush()
+
+    started = time.perf_counter()
+    line_number = 0
+    try:
+        while True:
+            line = await asyncio.to_thread(source.readline)
+            if not line:
+                break
+            line_number += 1
+            command = line.strip()
+            if not command or command.startswith("#"):
+                continue
+            pending.append(asyncio.create_task(_run_command(session, line_number, command, parse, slots)))
+            if len(pending) >= window:
+                write(await pending.popleft())
+            await flush(wait=False)
+        await flush(wait=True)
+    finally:
+        for task in pending:
+            task.cancel()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    calls = len(latencies)
+    return {
+        **counts,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "calls_per_s": round(calls / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "p99_ms": _percentile(latencies, 99),
+    }
+
+
+async def run_batch_file(session, parse: Parser, path: str, concurrency: int) -> dict:
+    """
+    Run a batch from a file (or stdin for "-"), writing NDJSON to stdout.
+
+    The summary is printed to stderr, so stdout holds only results.
+
+    Returns:
+        The summary from run_batch
+    """
+    source = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        summary = await run_batch(session, parse, source, sys.stdout, concurrency)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    print(
+        f"{summary['commands']} commands ({summary['ok']} ok, {summary['failed']} failed, "
+        f"{summary['unrecognized']} unrecognized) in {summary['seconds']}s: "
+        f"{summary['calls_per_s']} calls/s, p50 {summary['p50_ms']}ms, "
+        f"p95 {summary['p95_ms']}ms, p99 {summary['p99_ms']}ms",
+        file=sys.stderr,
+    )
+    return summary
@@ -1,46 +1,25 @@
 """MCP Client CLI for Todo Service using the official mcp package."""
 
+import argparse
 import asyncio
 import json
-import re
 import sys
-import os
 from typing import Optional, Tuple
 
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from app.mcp_client.batch import add_batch_arguments, run_batch_file
+from app.mcp_client.connection import (
+    ReconnectingSession,
+    ServerTarget,
+    add_connection_arguments,
+    handle_stop_daemon,
+    target_from_args,
+)
+from app.mcp_client.parser import CommandParser
 
+SERVER_MODULE = "app.mcp_server"
+DEFAULT_DAEMON_PORT = 8001
 
-# Persian to English status mapping
-STATUS_MAPPING = {
-    # Persian terms
-    "انجام‌شده": "done",
-    "انجام شده": "done",
-    "تمام شده": "done",
-    "تموم شده": "done",
-    "انجام": "done",
-    "تمام": "done",
-    "در حال انجام": "in_progress",
-    "درحال انجام": "in_progress",
-    "در جریان": "in_progress",
-    "شروع شده": "in_progress",
-    "معلق": "pending",
-    "در انتظار": "pending",
-    "منتظر": "pending",
-    # English terms
-    "done": "done",
-    "completed": "done",
-    "finish": "done",
-    "finished": "done",
-    "in_progress": "in_progress",
-    "in progress": "in_progress",
-    "inprogress": "in_progress",
-    "started": "in_progress",
-    "working": "in_progress",
-    "pending": "pending",
-    "waiting": "pending",
-    "new": "pending",
-}
+COMMAND_PARSER = CommandParser()
 
 
 def parse_user_input(user_input: str) -> Tuple[Optional[str], dict]:
@@ -50,137 +29,7 @@ def parse_user_input(user_input: str) -> Tuple[Optional[str], dict]:
     Returns:
         Tuple of (tool_name, arguments_dict) or (None, {}) if not recognized
     """
-    text = user_input.lower().strip()
-    
-    # Pattern for listing tasks
-    list_patterns = [
-        r"لیست.*تسک",
-        r"تسک.*ها.*نشون",
-        r"نشون.*بده.*تسک",
-        r"همه.*تسک",
-        r"لیست.*(pending|in_progress|done|انجام|معلق)",
-        r"(pending|in_progress|done).*لیست",
-        r"list.*task",
-        r"show.*task",
-        r"get.*task",
-        r"all.*task",
-        r"list.*(pending|in_progress|done)",
-        r"(pending|in_progress|done).*list",
-    ]
-    
-    # Pattern for creating tasks
-    create_patterns = [
-        r"(?:یک\s*)?تسک.*(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?(?:\s*بساز)?$",
-        r"(?:بساز|ایجاد).*تسک.*(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?",
-        r"(?:تسک\s*)?(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?\s*(?:بساز|ایجاد)",
-        r"create.*task.*(?:titled?|with)\s+[\"']?(.+)[\"']?$",
-        r"new.*task\s+[\"']?(.+)[\"']?$",
-        r"add.*task\s+[\"']?(.+)[\"']?$",
-    ]
-    
-    # Pattern for updating status
-    update_patterns = [
-        r"وضعیت.*تسک\s*(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
-        r"(?:تسک\s*)?(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)\s*کن",
-        r"(?:تغییر|آپدیت).*(?:وضعیت)?.*(\d+).*(?:به)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
-        r"update.*(?:task\s*)?(\d+).*(?:to|status)?\s*(pending|in_progress|done)",
-        r"(?:mark|set).*(?:task\s*)?(\d+).*(?:as|to)?\s*(pending|in_progress|done)",
-    ]
-    
-    # Pattern for getting task details
-    detail_patterns = [
-        r"جزئیات.*تسک\s*(\d+)",
-        r"تسک\s*(\d+).*(?:جزئیات|نشون|ببین)",
-        r"(?:نشون|نمایش).*تسک\s*(\d+)",
-        r"(?:get|show|view).*task\s*(\d+)",
-        r"task\s*(\d+).*(?:detail|info)",
-        r"(?:detail|info).*(?:of|for)?.*task\s*(\d+)",
-    ]
-    
-    # Pattern for deleting tasks
-    delete_patterns = [
-        r"(?:حذف|پاک).*تسک\s*(\d+)",
-        r"تسک\s*(\d+).*(?:رو|را)?\s*(?:حذف|پاک)\s*کن",
-        r"delete.*task\s*(\d+)",
-        r"remove.*task\s*(\d+)",
-        r"task\s*(\d+).*delete",
-    ]
-    
-    # Check for list with status filter
-    for pattern in list_patterns:
-        if re.search(pattern, text):
-            # Check for status filter
-            status = None
-            # First check for English status in original input
-            for eng_status in ["pending", "in_progress", "done"]:
-                if eng_status in user_input.lower():
-                    status = eng_status
-                    break
-            # Then check for Persian status
-            if not status:
-                for persian, english in STATUS_MAPPING.items():
-                    if persian in user_input:
-                        status = english
-                        break
-            
-            args = {}
-            if status:
-                args["status"] = status
-            return ("list_tasks", args)
-    
-    # Check for create task
-    for pattern in create_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            title = match.group(1).strip()
-            # Clean up title
-            title = re.sub(r'\s*(بساز|ایجاد کن|create|add).*$', '', title, flags=re.IGNORECASE)
-            title = title.strip().strip('"\'')
-            if title:
-                return ("create_task", {"title": title})
-    
-    # Check for update status
-    for pattern in update_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            task_id = int(match.group(1))
-            status_raw = match.group(2).strip()
-            status = STATUS_MAPPING.get(status_raw, status_raw)
-            return ("update_task_status", {"id": task_id, "status": status})
-    
-    # Check for get task details
-    for pattern in detail_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            task_id = int(match.group(1))
-            return ("get_task_by_id", {"id": task_id})
-    
-    # Check for delete task
-    for pattern in delete_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            task_id = int(match.group(1))
-            return ("delete_task", {"id": task_id})
-    
-    # Fallback: try to extract any number and status for update
-    numbers = re.findall(r'\d+', text)
-    if numbers:
-        task_id = int(numbers[0])
-        
-        # Check for status words
-        for persian, english in STATUS_MAPPING.items():
-            if persian in text:
-                return ("update_task_status", {"id": task_id, "status": english})
-        
-        # Just show details if only a number mentioned
-        if "جزئیات" in text or "detail" in text or "نشون" in text or "show" in text:
-            return ("get_task_by_id", {"id": task_id})
-    
-    # Check if it's just asking for list
-    if any(word in text for word in ["تسک", "task", "list", "لیست", "همه", "all"]):
-        return ("list_tasks", {})
-    
-    return (None, {})
+    return COMMAND_PARSER.parse(user_input)
 
 
 def format_task_table(tasks: list) -> str:
@@ -227,6 +76,8 @@ def format_result(tool_name: str, result: dict) -> str:
         count = len(tasks)
         output = f"📋 Found {count} task(s):\n\n"
         output += format_task_table(tasks)
+        if result.get("next_cursor"):
+            output += f"\n\n➡️  More tasks available (after: {result['next_cursor']})"
         return output
     
     elif tool_name == "get_task_by_id":
@@ -251,89 +102,90 @@ def format_result(tool_name: str, result: dict) -> str:
         output = f"✅ Task {result.get('id')} deleted successfully!"
         return output
     
+    elif tool_name == "get_task_stats":
+        stats = result.get("stats", {})
+        output = "📊 Task Stats:\n\n"
+        output += "\n".join(f"  {key}: {value}" for key, value in stats.items())
+        return output
+    
+    elif tool_name == "search_tasks":
+        tasks = result.get("tasks", [])
+        output = f"🔎 Found {len(tasks)} matching task(s):\n\n"
+        output += format_task_table(tasks)
+        if result.get("next_offset"):
+            output += f"\n\n➡️  More results available (offset: {result['next_offset']})"
+        return output
+    
     else:
         return json.dumps(result, ensure_ascii=False, indent=2)
 
 
-async def run_client():
+async def run_client(target: ServerTarget):
     """Run the MCP client."""
     print("=" * 60)
     print("🚀 Todo MCP Client")
     print("=" * 60)
-    print("\nConnecting to MCP Server...")
-    
-    # Get the path to the MCP server module
-    server_command = sys.executable
-    server_args = ["-m", "app.mcp_server"]
-    
-    # Create server parameters
-    server_params = StdioServerParameters(
-        command=server_command,
-        args=server_args,
-        env={**os.environ}
-    )
+    print(f"\nConnecting to MCP Server ({target.describe()})...")
     
     try:
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                # Initialize the session
-                await session.initialize()
-                
-                print("✅ Connected to MCP Server!")
-                print("\n" + "-" * 60)
-                print("Available commands (Persian/English):")
-                print("  - لیست تسک‌ها رو نشون بده / show all tasks")
-                print("  - لیست pending رو نشون بده / list pending tasks")
-                print("  - یک تسک جدید با عنوان X بساز / create task with title X")
-                print("  - وضعیت تسک 5 رو done کن / update task 5 to done")
-                print("  - جزئیات تسک 3 / show task 3 details")
-                print("  - تسک 2 رو حذف کن / delete task 2")
-                print("  - exit / quit / خروج")
-                print("-" * 60 + "\n")
-                
-                while True:
-                    try:
-                        user_input = input("You: ").strip()
-                        
-                        if not user_input:
-                            continue
-                        
-                        if user_input.lower() in ["exit", "quit", "خروج", "q"]:
-                            print("\n👋 Goodbye!")
-                            break
-                        
-                        # Parse user input
-                        tool_name, arguments = parse_user_input(user_input)
-                        
-                        if not tool_name:
-                            print("\n❓ I didn't understand that. Please try one of the supported commands.")
-                            print("   متوجه نشدم. لطفاً یکی از دستورات پشتیبانی شده را امتحان کنید.\n")
-                            continue
-                        
-                        print(f"\n🔧 Calling: {tool_name}")
-                        if arguments:
-                            print(f"   Arguments: {arguments}")
-                        
-                        # Call the tool
-                        result = await session.call_tool(tool_name, arguments)
-                        
-                        # Parse and format result
-                        if result.content:
-                            try:
-                                result_text = result.content[0].text
-                                result_data = json.loads(result_text)
-                                formatted = format_result(tool_name, result_data)
-                                print(f"\n{formatted}\n")
-                            except (json.JSONDecodeError, IndexError, AttributeError):
-                                print(f"\n{result.content}\n")
-                        else:
-                            print("\n❌ No response from server\n")
+        async with ReconnectingSession(target) as session:
+            print("✅ Connected to MCP Server!")
+            print("\n" + "-" * 60)
+            print("Available commands (Persian/English):")
+            print("  - لیست تسک‌ها رو نشون بده / show all tasks")
+            print("  - لیست pending رو نشون بده / list pending tasks")
+            print("  - یک تسک جدید با عنوان X بساز / create task with title X")
+            print("  - وضعیت تسک 5 رو done کن / update task 5 to done")
+            print("  - جزئیات تسک 3 / show task 3 details")
+            print("  - تسک 2 رو حذف کن / delete task 2")
+            print("  - آمار تسک‌ها / task stats")
+            print("  - جستجوی فاکتور / search invoice")
+            print("  - exit / quit / خروج")
+            print("-" * 60 + "\n")
+            
+            while True:
+                try:
+                    user_input = input("You: ").strip()
+                    
+                    if not user_input:
+                        continue
                     
-                    except KeyboardInterrupt:
-                        print("\n\n👋 Goodbye!")
+                    if user_input.lower() in ["exit", "quit", "خروج", "q"]:
+                        print("\n👋 Goodbye!")
                         break
-                    except Exception as e:
-                        print(f"\n❌ Error: {e}\n")
+                    
+                    # Parse user input
+                    tool_name, arguments = parse_user_input(user_input)
+                    
+                    if not tool_name:
+                        print("\n❓ I didn't understand that. Please try one of the supported commands.")
+                        print("   متوجه نشدم. لطفاً یکی از دستورات پشتیبانی شده را امتحان کنید.\n")
+                        continue
+                    
+                    print(f"\n🔧 Calling: {tool_name}")
+                    if arguments:
+                        print(f"   Arguments: {arguments}")
+                    
+                    # Call the tool
+                    result = await session.call_tool(tool_name, arguments)
+                    
+                    # Parse and format result
+                    if result.content:
+                        try:
+                            result_text = result.content[0].text
+                            result_data = json.loads(result_text)
+                            formatted = format_result(tool_name, result_data)
+                            print(f"\n{formatted}\n")
+                        except (json.JSONDecodeError, IndexError, AttributeError):
+                            print(f"\n{result.content}\n")
+                    else:
+                        print("\n❌ No response from server\n")
+                
+                except KeyboardInterrupt:
+                    print("\n\n👋 Goodbye!")
+                    break
+                except Exception as e:
+                    print(f"\n❌ Error: {e}\n")
     
     except Exception as e:
         print(f"❌ Failed to connect to MCP Server: {e}")
@@ -341,9 +193,33 @@ async def run_client():
         sys.exit(1)
 
 
-def main():
+async def run_batch(target: ServerTarget, path: str, concurrency: int) -> dict:
+    """Run the commands in a file (or stdin for "-") without the interactive prompt."""
+    async with ReconnectingSession(target) as session:
+        return await run_batch_file(session, parse_user_input, path, concurrency)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.mcp_client",
+        description="Interactive Todo MCP client.",
+    )
+    add_connection_arguments(parser, DEFAULT_DAEMON_PORT)
+    add_batch_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None):
     """Main entry point."""
-    asyncio.run(run_client())
+    args = parse_args(argv)
+    if handle_stop_daemon(args):
+        return
+    target = target_from_args(args, SERVER_MODULE)
+    if args.batch:
+        summary = asyncio.run(run_batch(target, args.batch, args.concurrency))
+        sys.exit(1 if summary["failed"] or summary["unrecognized"] else 0)
+    asyncio.run(run_client(target))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,313 @@
+"""Persistent, reconnecting MCP client connections (stdio, HTTP or a warm daemon)."""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+import anyio
+from mcp import ClientSession, StdioServerParameters
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+from app.mcp_client.daemon import DEFAULT_DAEMON_HOST, ensure_daemon, stop_daemon
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Tools that only read, so a call cut off by a lost connection can safely
+# be sent again; writes may or may not have been applied and are not retried
+READ_ONLY_TOOLS = frozenset({"list_tasks", "get_task_by_id", "get_task_stats", "search_tasks"})
+
+# Errors meaning the transport under a session is gone
+CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+
+class ConnectionLostError(ConnectionError):
+    """The connection to the server was lost while a request was in flight."""
+
+
+@dataclass
+class ServerTarget:
+    """
+    Where a client finds its MCP server.
+
+    Exactly one of `url` (attach over HTTP/SSE), `daemon_module` (attach
+    to a warm daemon, starting it if needed) or `command` (spawn a stdio
+    server per connection) is used, in that order.
+    """
+
+    url: Optional[str] = None
+    daemon_module: Optional[str] = None
+    port: int = 8001
+    host: str = DEFAULT_DAEMON_HOST
+    command: str = sys.executable
+    args: list[str] = field(default_factory=list)
+
+    @classmethod
+    def stdio(cls, module: str) -> "ServerTarget":
+        """Spawn `python -m <module>` over stdio with this interpreter."""
+        return cls(command=sys.executable, args=["-m", module])
+
+    def describe(self) -> str:
+        """Human-readable description for connection messages."""
+        if self.url:
+            return self.url
+        if self.daemon_module:
+            return f"daemon {self.daemon_module} on {self.host}:{self.port}"
+        return " ".join([self.command, *self.args])
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[tuple]:
+        """Open a transport to the server and yield its (read, write) streams."""
+        url = self.url
+        if url is None and self.daemon_module:
+            # Runs on every (re)connect, so a daemon that died is restarted
+            url = await asyncio.to_thread(ensure_daemon, self.daemon_module, self.port, self.host)
+
+        if url is None:
+            from mcp.client.stdio import stdio_client
+
+            params = StdioServerParameters(command=self.command, args=self.args, env={**os.environ})
+            async with stdio_client(params) as streams:
+                yield streams
+        elif url.rstrip("/").endswith("/sse"):
+            from mcp.client.sse import sse_client
+
+            async with sse_client(url) as streams:
+                yield streams
+        else:
+            from mcp.client.streamable_http import streamable_http_client
+
+            async with streamable_http_client(url) as streams:
+                yield streams[0], streams[1]
+
+
+class ReconnectingSession:
+    """
+    One long-lived MCP client session that reconnects after the server goes away.
+
+    The transport and ClientSession live in a background task, so a dropped
+    connection only ends that task; the next request opens a new one (with
+    exponential backoff) instead of the whole client failing. Read-only
+    tool calls cut off by a lost connection are retried on the new
+    session; other calls raise ConnectionLostError, since the server may
+    or may not have applied them.
+
+    Use as an async context manager.
+    """
+
+    def __init__(
+        self,
+        target: ServerTarget,
+        retries: int = 3,
+        retry_delay: float = 0.2,
+        max_retry_delay: float = 5.0,
+        read_timeout: float = 60.0,
+    ):
+        self.target = target
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.read_timeout = read_timeout
+        self.connects = 0
+        self._session: Optional[ClientSession] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "ReconnectingSession":
+        await self.session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def connected(self) -> bool:
+        return self._session is not None and self._worker is not None and not self._worker.done()
+
+    async def session(self) -> ClientSession:
+        """
+        Return the live session, connecting (with backoff) if there is none.
+
+        Raises:
+            ConnectionError: If the server cannot be reached after all retries
+        """
+        async with self._lock:
+            if self.connected:
+                return self._session
+            delay = self.retry_delay
+            for attempt in range(self.retries + 1):
+                try:
+                    return await self._connect()
+                except Exception as e:
+                    if attempt == self.retries:
+                        raise ConnectionError(f"Cannot connect to {self.target.describe()}: {e}") from e
+                    logger.warning("Connecting to %s failed (%s); retrying in %.1fs", self.target.describe(), e, delay)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.max_retry_delay)
+
+    async def close(self) -> None:
+        """Close the session and its transport."""
+        if self._worker is not None:
+            self._closing.set()
+            try:
+                await self._worker
+            finally:
+                self._worker = None
+                self._session = None
+
+    async def call_tool(self, name: str, arguments: Optional[dict] = None):
+        """Call a tool, reconnecting first if needed; see the class docstring for retries."""
+        return await self._request(
+            lambda session: session.call_tool(name, arguments or {}),
+            retry=name in READ_ONLY_TOOLS,
+            what=f"tool {name}",
+        )
+
+    async def list_tools(self):
+        return await self._request(lambda session: session.list_tools(), retry=True, what="list_tools")
+
+    async def list_prompts(self):
+        return await self._request(lambda session: session.list_prompts(), retry=True, what="list_prompts")
+
+    async def get_prompt(self, name: str, arguments: Optional[dict] = None):
+        return await self._request(
+            lambda session: session.get_prompt(name, arguments or {}), retry=True, what=f"prompt {name}"
+        )
+
+    async def _request(self, send: Callable[[ClientSession], Awaitable[T]], retry: bool, what: str) -> T:
+        """Send one request, watching for the connection dropping under it."""
+        for attempt in range(self.retries + 1):
+            session = await self.session()
+            worker = self._worker
+            request = asyncio.ensure_future(send(session))
+            try:
+                await asyncio.wait({request, worker}, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                request.cancel()
+                raise
+            try:
+                if request.done():
+                    return request.result()
+                # The connection task ended first: the reply is never coming
+                request.cancel()
+                raise ConnectionLostError("connection closed")
+            except (McpError, *CONNECTION_ERRORS) as e:
+                if isinstance(e, McpError) and e.error.code != CONNECTION_CLOSED:
+                    raise
+                await self._discard(worker)
+                if not retry or attempt == self.retries:
+                    raise ConnectionLostError(
+                        f"Connection to {self.target.describe()} lost during {what}"
+                        + ("" if retry else "; it may or may not have been applied")
+                    ) from e
+                logger.warning("Connection lost during %s; reconnecting", what)
+
+    async def _connect(self) -> ClientSession:
+        """Start the connection task and wait until its session is initialized."""
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._worker = asyncio.create_task(self._hold_connection(ready, self._closing))
+        try:
+            self._session = await ready
+        except BaseException:
+            await self._discard(self._worker)
+            raise
+        self.connects += 1
+        return self._session
+
+    async def _hold_connection(self, ready: asyncio.Future, closing: asyncio.Event) -> None:
+        """
+        Own the transport and session until closed or the connection drops.
+
+        Both are entered and exited in this one task, as anyio's cancel
+        scopes require; a transport failure ends the task rather than
+        propagating into whoever is waiting on a reply.
+        """
+        try:
+            async with self.target.open() as (read, write):
+                async with ClientSession(
+                    read, write, read_timeout_seconds=timedelta(seconds=self.read_timeout)
+                ) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning("Connection to %s closed: %r", self.target.describe(), e)
+        finally:
+            if not ready.done():
+                ready.set_exception(ConnectionError("connection closed before it was initialized"))
+
+    async def _discard(self, worker: Optional[asyncio.Task]) -> None:
+        """Forget a dead (or dying) connection task."""
+        if worker is None:
+            return
+        if not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except BaseException:
+                pass
+        if self._worker is worker:
+            self._worker = None
+            self._session = None
+
+
+def add_connection_arguments(parser: argparse.ArgumentParser, default_port: int) -> None:
+    """Add the --url / --daemon / --port / --stop-daemon options of the clients."""
+    group = parser.add_argument_group("server connection")
+    group.add_argument(
+        "--url",
+        default=os.environ.get("MCP_SERVER_URL"),
+        help="Attach to a running HTTP/SSE server (default: $MCP_SERVER_URL)",
+    )
+    group.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Attach to the warm server daemon, starting it if it is not running",
+    )
+    group.add_argument("--port", type=int, default=default_port, help="Daemon port")
+    group.add_argument("--stop-daemon", action="store_true", help="Stop the daemon on --port and exit")
+
+
+def target_from_args(args: argparse.Namespace, module: str) -> ServerTarget:
+    """
+    Build the server target chosen on the command line.
+
+    Args:
+        args: Parsed arguments (see add_connection_arguments)
+        module: Server module to spawn over stdio or run as the daemon
+
+    Returns:
+        --url if given, else the daemon with --daemon, else a stdio server
+    """
+    if args.url:
+        return ServerTarget(url=args.url)
+    if args.daemon:
+        return ServerTarget(daemon_module=module, port=args.port)
+    return ServerTarget.stdio(module)
+
+
+def handle_stop_daemon(args: argparse.Namespace) -> bool:
+    """Stop the daemon if --stop-daemon was given; returns whether it was."""
+    if not args.stop_daemon:
+        return False
+    pid = stop_daemon(args.port)
+    print(f"Stopped MCP server daemon (pid {pid})" if pid else f"No MCP server daemon on port {args.port}")
+    return True
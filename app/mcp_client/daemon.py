@@ -0,0 +1,194 @@
+"""Warm MCP server daemon: one long-running HTTP server that clients attach to."""
+
+import fcntl
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+import httpx
+from mcp.types import LATEST_PROTOCOL_VERSION
+
+DEFAULT_DAEMON_HOST = "127.0.0.1"
+
+
+def daemon_files(port: int) -> tuple[Path, Path]:
+    """Pidfile and logfile of the daemon listening on a port."""
+    base = Path(tempfile.gettempdir())
+    return base / f"todo-mcp-{port}.pid", base / f"todo-mcp-{port}.log"
+
+
+@contextmanager
+def daemon_lock(port: int) -> Iterator[None]:
+    """
+    Hold the lock on a port's daemon while starting or stopping it.
+
+    Clients that find no daemon at the same moment queue here, so only the
+    first one spawns it and the others find it running.
+    """
+    lockfile = Path(tempfile.gettempdir()) / f"todo-mcp-{port}.lock"
+    with open(lockfile, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def daemon_url(host: str, port: int) -> str:
+    """Streamable HTTP endpoint of a daemon."""
+    return f"http://{host}:{port}/mcp"
+
+
+def is_listening(host: str, port: int, timeout: float = 0.2) -> bool:
+    """Whether something accepts TCP connections on host:port."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _initialize_result(response: httpx.Response) -> Optional[dict]:
+    """Result of an initialize response, sent as JSON or as one SSE event."""
+    if response.headers.get("content-type", "").startswith("text/event-stream"):
+        data = [line[5:].strip() for line in response.text.splitlines() if line.startswith("data:")]
+        body = data[0] if data else ""
+    else:
+        body = response.text
+    try:
+        message = json.loads(body)
+    except ValueError:
+        return None
+    return message.get("result") if isinstance(message, dict) else None
+
+
+def is_mcp_server(url: str, timeout: float = 1.0) -> bool:
+    """
+    Whether an MCP server answers initialize on a streamable HTTP URL.
+
+    Unlike a bare TCP connect this is not fooled by another program on
+    the port, or by a server that is bound but not yet serving. The
+    probe's session is closed again right away.
+
+    Args:
+        url: Streamable HTTP endpoint, e.g. "http://127.0.0.1:8001/mcp"
+        timeout: Seconds to wait for the answer
+
+    Returns:
+        True if the server completed the initialize handshake
+    """
+    request = {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": LATEST_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "todo-mcp-daemon-probe", "version": "1.0"},
+        },
+    }
+    headers = {"Accept": "application/json, text/event-stream"}
+    try:
+        with httpx.Client(timeout=timeout) as client:
+            response = client.post(url, json=request, headers=headers)
+            result = _initialize_result(response) if response.status_code == 200 else None
+            session_id = response.headers.get("mcp-session-id")
+            if session_id:
+                client.delete(url, headers={"mcp-session-id": session_id})
+    except httpx.HTTPError:
+        return False
+    return isinstance(result, dict) and "serverInfo" in result
+
+
+def ensure_daemon(
+    module: str,
+    port: int,
+    host: str = DEFAULT_DAEMON_HOST,
+    startup_timeout: float = 30.0,
+) -> str:
+    """
+    Return the URL of a running server daemon, starting one if needed.
+
+    The daemon is `python -m <module> --transport http` in its own session,
+    so it outlives the client that started it and every later client
+    attaches to the same warm process (imports done, engine and pool open).
+    It inherits this process's environment (DATABASE_URL etc.) and logs
+    to the temp directory. Clients starting together spawn it once: the
+    check and the spawn happen under daemon_lock, and the pidfile is only
+    written once the new daemon answers an MCP initialize.
+
+    Args:
+        module: Server module, e.g. "app.mcp_server"
+        port: Port the daemon listens on
+        host: Address the daemon listens on
+        startup_timeout: Seconds to wait for a new daemon to answer
+
+    Returns:
+        Streamable HTTP URL of the daemon
+
+    Raises:
+        RuntimeError: If the daemon exits or does not start in time
+    """
+    url = daemon_url(host, port)
+    if is_mcp_server(url):
+        return url
+
+    with daemon_lock(port):
+        # Another client may have started it while this one waited
+        if is_mcp_server(url):
+            return url
+
+        pidfile, logfile = daemon_files(port)
+        command = [sys.executable, "-m", module, "--transport", "http", "--host", host, "--port", str(port)]
+        with open(logfile, "ab") as log:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                env={**os.environ},
+                start_new_session=True,
+            )
+
+        deadline = time.monotonic() + startup_timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"MCP server daemon exited with status {process.returncode}; see {logfile}")
+            if is_mcp_server(url):
+                pidfile.write_text(str(process.pid))
+                return url
+            time.sleep(0.05)
+        process.terminate()
+        raise RuntimeError(f"MCP server daemon did not start within {startup_timeout:.0f}s; see {logfile}")
+
+
+def stop_daemon(port: int) -> Optional[int]:
+    """
+    Stop the daemon started by ensure_daemon on a port.
+
+    Args:
+        port: Port the daemon listens on
+
+    Returns:
+        PID of the stopped daemon, or None if none was running
+    """
+    pidfile, _ = daemon_files(port)
+    with daemon_lock(port):
+        try:
+            pid = int(pidfile.read_text())
+        except (OSError, ValueError):
+            return None
+        pidfile.unlink(missing_ok=True)
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return None
+    return pid
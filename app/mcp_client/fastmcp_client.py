@@ -1,66 +1,43 @@
 """FastMCP Client for Todo Service - Interactive CLI."""
 
+import argparse
 import asyncio
 import json
-import os
-import re
-from pathlib import Path
+import sys
 from typing import Optional, Tuple
 
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from app.mcp_client.batch import add_batch_arguments, run_batch_file
+from app.mcp_client.connection import (
+    ReconnectingSession,
+    ServerTarget,
+    add_connection_arguments,
+    handle_stop_daemon,
+    target_from_args,
+)
+from app.mcp_client.parser import CommandParser
 
+SERVER_MODULE = "app.mcp_server.fastmcp_server"
+# Not the low-level server's daemon port, so both daemons can run at once
+DEFAULT_DAEMON_PORT = 8002
 
-# Persian to English status mapping
-STATUS_MAPPING = {
-    # Persian terms
-    "انجام‌شده": "done",
-    "انجام شده": "done",
-    "تمام شده": "done",
-    "تموم شده": "done",
-    "انجام": "done",
-    "تمام": "done",
-    "در حال انجام": "in_progress",
-    "درحال انجام": "in_progress",
-    "در جریان": "in_progress",
-    "شروع شده": "in_progress",
-    "معلق": "pending",
-    "در انتظار": "pending",
-    "منتظر": "pending",
-    # English terms
-    "done": "done",
-    "completed": "done",
-    "finish": "done",
-    "finished": "done",
-    "in_progress": "in_progress",
-    "in progress": "in_progress",
-    "inprogress": "in_progress",
-    "started": "in_progress",
-    "working": "in_progress",
-    "pending": "pending",
-    "waiting": "pending",
-    "new": "pending",
-}
+# Adds the prompt commands and "delete <number>" to the standard client's
+COMMAND_PARSER = CommandParser(id_argument="task_id", prompts=True, loose_delete=True)
 
 
 class TodoFastMCPClient:
     """Interactive CLI client for Todo FastMCP Server."""
     
     def __init__(self):
-        self.session: Optional[ClientSession] = None
+        self.session: Optional[ReconnectingSession] = None
         self.exit_commands = ["exit", "quit", "q", "خروج"]
         self.tools = {}
         self.prompts = {}
     
-    async def initialize_session(self, stdio, write):
-        """Initialize the MCP session with the server."""
-        self.session = ClientSession(stdio, write)
-        
-        # Use session as a context manager
+    async def initialize_session(self, target: ServerTarget):
+        """Connect to the server; the session reconnects by itself if it drops."""
+        self.session = ReconnectingSession(target)
         await self.session.__aenter__()
         
-        await self.session.initialize()
-        
         # List available tools
         response = await self.session.list_tools()
         self.tools = {tool.name: tool for tool in response.tools}
@@ -73,6 +50,7 @@ class TodoFastMCPClient:
         """Cleanup the MCP session."""
         if self.session:
             await self.session.__aexit__(None, None, None)
+            self.session = None
     
     def parse_command(self, user_input: str) -> Tuple[Optional[str], dict]:
         """
@@ -80,150 +58,7 @@ class TodoFastMCPClient:
         
         Supports both English and Persian commands with comprehensive patterns.
         """
-        text = user_input.lower().strip()
-        
-        # Pattern for listing tasks
-        list_patterns = [
-            r"لیست.*تسک",
-            r"تسک.*ها.*نشون",
-            r"نشون.*بده.*تسک",
-            r"همه.*تسک",
-            r"لیست.*(pending|in_progress|done|انجام|معلق)",
-            r"(pending|in_progress|done).*لیست",
-            r"list.*task",
-            r"show.*task",
-            r"get.*task",
-            r"all.*task",
-            r"list.*(pending|in_progress|done)",
-            r"(pending|in_progress|done).*list",
-        ]
-        
-        # Pattern for creating tasks
-        create_patterns = [
-            r"(?:یک\s*)?تسک.*(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?(?:\s*بساز)?$",
-            r"(?:بساز|ایجاد).*تسک.*(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?",
-            r"(?:تسک\s*)?(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?\s*(?:بساز|ایجاد)",
-            r"create.*task.*(?:titled?|with)\s+[\"']?(.+)[\"']?$",
-            r"new.*task\s+[\"']?(.+)[\"']?$",
-            r"add.*task\s+[\"']?(.+)[\"']?$",
-        ]
-        
-        # Pattern for updating status
-        update_patterns = [
-            r"وضعیت.*تسک\s*(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
-            r"(?:تسک\s*)?(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)\s*کن",
-            r"(?:تغییر|آپدیت).*(?:وضعیت)?.*(\d+).*(?:به)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
-            r"update.*(?:task\s*)?(\d+).*(?:to|status)?\s*(pending|in_progress|done)",
-            r"(?:mark|set).*(?:task\s*)?(\d+).*(?:as|to)?\s*(pending|in_progress|done)",
-        ]
-        
-        # Pattern for getting task details
-        detail_patterns = [
-            r"جزئیات.*تسک\s*(\d+)",
-            r"تسک\s*(\d+).*(?:جزئیات|نشون|ببین)",
-            r"(?:نشون|نمایش).*تسک\s*(\d+)",
-            r"(?:get|show|view).*task\s*(\d+)",
-            r"task\s*(\d+).*(?:detail|info)",
-            r"(?:detail|info).*(?:of|for)?.*task\s*(\d+)",
-        ]
-        
-        # Pattern for deleting tasks
-        delete_patterns = [
-            r"(?:حذف|پاک).*تسک\s*(\d+)",
-            r"(?:حذف|پاک).*\s*(\d+)",
-            r"تسک\s*(\d+).*(?:رو|را)?\s*(?:حذف|پاک)\s*کن",
-            r"delete.*task\s*(\d+)",
-            r"delete.*\s*(\d+)",
-            r"remove.*task\s*(\d+)",
-            r"remove.*\s*(\d+)",
-            r"task\s*(\d+).*delete",
-        ]
-        
-        # Check for prompt patterns first
-        if re.search(r"(help|guide|راهنما|کمک)", text, re.IGNORECASE):
-            return ("prompt:task_management_guide", {})
-        
-        if re.search(r"(workflow|جریان کار|مراحل)", text, re.IGNORECASE):
-            return ("prompt:task_status_workflow", {})
-        
-        if re.search(r"(daily|روزانه|summary|خلاصه)", text, re.IGNORECASE):
-            return ("prompt:daily_task_summary", {})
-        
-        # Check for list with status filter
-        for pattern in list_patterns:
-            if re.search(pattern, text):
-                # Check for status filter
-                status = None
-                # First check for English status in original input
-                for eng_status in ["pending", "in_progress", "done"]:
-                    if eng_status in user_input.lower():
-                        status = eng_status
-                        break
-                # Then check for Persian status using STATUS_MAPPING
-                if not status:
-                    for persian, english in STATUS_MAPPING.items():
-                        if persian in user_input:
-                            status = english
-                            break
-                
-                args = {}
-                if status:
-                    args["status"] = status
-                return ("list_tasks", args)
-        
-        # Check for create task
-        for pattern in create_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                title = match.group(1).strip()
-                # Clean up title
-                title = re.sub(r'\s*(بساز|ایجاد کن|create|add).*$', '', title, flags=re.IGNORECASE)
-                title = title.strip().strip('"\'')
-                if title:
-                    return ("create_task", {"title": title})
-        
-        # Check for update status
-        for pattern in update_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                task_id = int(match.group(1))
-                status_raw = match.group(2).strip()
-                status = STATUS_MAPPING.get(status_raw, status_raw)
-                return ("update_task_status", {"task_id": task_id, "status": status})
-        
-        # Check for get task details
-        for pattern in detail_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                task_id = int(match.group(1))
-                return ("get_task_by_id", {"task_id": task_id})
-        
-        # Check for delete task
-        for pattern in delete_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                task_id = int(match.group(1))
-                return ("delete_task", {"task_id": task_id})
-        
-        # Fallback: try to extract any number and status for update
-        numbers = re.findall(r'\d+', text)
-        if numbers:
-            task_id = int(numbers[0])
-            
-            # Check for status words using STATUS_MAPPING
-            for persian, english in STATUS_MAPPING.items():
-                if persian in text:
-                    return ("update_task_status", {"task_id": task_id, "status": english})
-            
-            # Just show details if only a number mentioned
-            if "جزئیات" in text or "detail" in text or "نشون" in text or "show" in text:
-                return ("get_task_by_id", {"task_id": task_id})
-        
-        # Check if it's just asking for list
-        if any(word in text for word in ["تسک", "task", "list", "لیست", "همه", "all"]):
-            return ("list_tasks", {})
-        
-        return (None, {})
+        return COMMAND_PARSER.parse(user_input)
     
     def format_result(self, tool_name: str, result: dict) -> str:
         """Format the result based on tool type."""
@@ -239,6 +74,8 @@ class TodoFastMCPClient:
                 output += self.format_tasks_table(tasks)
             else:
                 output += "هیچ تسکی یافت نشد / No tasks found"
+            if result.get("next_cursor"):
+                output += f"\n\n➡️  More tasks available (after: {result['next_cursor']})"
             return output
         
         elif tool_name == "get_task_by_id":
@@ -263,6 +100,23 @@ class TodoFastMCPClient:
             output = f"✅ Task {result.get('id')} deleted successfully!"
             return output
         
+        elif tool_name == "get_task_stats":
+            stats = result.get("stats", {})
+            output = "📊 Task Stats:\n\n"
+            output += "\n".join(f"  {key}: {value}" for key, value in stats.items())
+            return output
+        
+        elif tool_name == "search_tasks":
+            tasks = result.get("tasks", [])
+            output = f"🔎 Found {len(tasks)} matching task(s):\n\n"
+            if tasks:
+                output += self.format_tasks_table(tasks)
+            else:
+                output += "هیچ تسکی یافت نشد / No tasks found"
+            if result.get("next_offset"):
+                output += f"\n\n➡️  More results available (offset: {result['next_offset']})"
+            return output
+        
         else:
             return json.dumps(result, ensure_ascii=False, indent=2)
     
@@ -338,93 +192,110 @@ class TodoFastMCPClient:
         
         return "\n".join(lines)
     
-    async def run(self):
+    async def run_batch(self, target: ServerTarget, path: str, concurrency: int) -> dict:
+        """Run the commands in a file (or stdin for "-") without the interactive prompt."""
+        try:
+            await self.initialize_session(target)
+            return await run_batch_file(self.session, self.parse_command, path, concurrency)
+        finally:
+            await self.cleanup_session()
+    
+    async def run(self, target: ServerTarget):
         """Run the interactive CLI."""
         print("="*60)
         print("🚀 Todo FastMCP Client")
         print("="*60)
-        print("\nConnecting to FastMCP Server...")
-        
-        # Get the workspace root directory
-        workspace_root = Path(__file__).parent.parent.parent
-        server_script = workspace_root / "app" / "mcp_server" / "fastmcp_server.py"
-        
-        server_params = StdioServerParameters(
-            command="uv",
-            args=["run", "python", str(server_script)],
-            env=None
-        )
+        print(f"\nConnecting to FastMCP Server ({target.describe()})...")
+        
+        try:
+            await self.initialize_session(target)
+            print("✅ Connected to FastMCP Server!")
+            print(f"\n📦 Available tools: {len(self.tools)}")
+            print(f"📝 Available prompts: {len(self.prompts)}")
+        except Exception as e:
+            print(f"❌ Failed to connect: {e}")
+            await self.cleanup_session()
+            return
         
-        # Use the context manager properly
-        async with stdio_client(server_params) as (stdio, write):
-            try:
-                await self.initialize_session(stdio, write)
-                print("✅ Connected to FastMCP Server!")
-                print(f"\n📦 Available tools: {len(self.tools)}")
-                print(f"📝 Available prompts: {len(self.prompts)}")
-            except Exception as e:
-                print(f"❌ Failed to connect: {e}")
-                return
-            
-            print("\n" + "-"*60)
-            print("Available commands (Persian/English):")
-            print("  - لیست تسک‌ها رو نشون بده / show all tasks")
-            print("  - لیست pending رو نشون بده / list pending tasks")
-            print("  - یک تسک جدید با عنوان X بساز / create task with title X")
-            print("  - وضعیت تسک 5 رو done کن / update task 5 to done")
-            print("  - جزئیات تسک 3 / show task 3 details")
-            print("  - تسک 2 رو حذف کن / delete task 2")
-            print("  - help / راهنما - Show task management guide")
-            print("  - workflow / جریان کار - Show status workflow")
-            print("  - daily / روزانه - Show daily summary template")
-            print("  - exit / quit / خروج")
-            print("-"*60 + "\n")
-            
-            try:
-                while True:
-                    try:
-                        user_input = input("You: ").strip()
-                        
-                        if not user_input:
-                            continue
-                        
-                        # Check for exit commands
-                        if user_input.lower() in self.exit_commands:
-                            print("\n👋 Goodbye!")
-                            break
-                        
-                        # Parse and execute command
-                        tool_name, arguments = self.parse_command(user_input)
-                        
-                        if not tool_name:
-                            print("\n❓ I didn't understand that. Please try one of the supported commands.")
-                            print("   متوجه نشدم. لطفاً یکی از دستورات پشتیبانی شده را امتحان کنید.\n")
-                            continue
-                        
-                        # Check if it's a prompt request
-                        if tool_name.startswith("prompt:"):
-                            prompt_name = tool_name.split(":", 1)[1]
-                            await self.get_prompt(prompt_name, arguments)
-                        else:
-                            await self.call_tool(tool_name, arguments)
-                        
-                        print()  # Empty line for readability
+        print("\n" + "-"*60)
+        print("Available commands (Persian/English):")
+        print("  - لیست تسک‌ها رو نشون بده / show all tasks")
+        print("  - لیست pending رو نشون بده / list pending tasks")
+        print("  - یک تسک جدید با عنوان X بساز / create task with title X")
+        print("  - وضعیت تسک 5 رو done کن / update task 5 to done")
+        print("  - جزئیات تسک 3 / show task 3 details")
+        print("  - تسک 2 رو حذف کن / delete task 2")
+        print("  - آمار تسک‌ها / task stats")
+        print("  - جستجوی فاکتور / search invoice")
+        print("  - help / راهنما - Show task management guide")
+        print("  - workflow / جریان کار - Show status workflow")
+        print("  - daily / روزانه - Show daily summary template")
+        print("  - exit / quit / خروج")
+        print("-"*60 + "\n")
+        
+        try:
+            while True:
+                try:
+                    user_input = input("You: ").strip()
+                    
+                    if not user_input:
+                        continue
                     
-                    except KeyboardInterrupt:
-                        print("\n\n👋 Goodbye!")
+                    # Check for exit commands
+                    if user_input.lower() in self.exit_commands:
+                        print("\n👋 Goodbye!")
                         break
-                    except Exception as e:
-                        print(f"\n❌ Error: {e}")
-            finally:
-                # Cleanup session
-                await self.cleanup_session()
+                    
+                    # Parse and execute command
+                    tool_name, arguments = self.parse_command(user_input)
+                    
+                    if not tool_name:
+                        print("\n❓ I didn't understand that. Please try one of the supported commands.")
+                        print("   متوجه نشدم. لطفاً یکی از دستورات پشتیبانی شده را امتحان کنید.\n")
+                        continue
+                    
+                    # Check if it's a prompt request
+                    if tool_name.startswith("prompt:"):
+                        prompt_name = tool_name.split(":", 1)[1]
+                        await self.get_prompt(prompt_name, arguments)
+                    else:
+                        await self.call_tool(tool_name, arguments)
+                    
+                    print()  # Empty line for readability
+                
+                except KeyboardInterrupt:
+                    print("\n\n👋 Goodbye!")
+                    break
+                except Exception as e:
+                    print(f"\n❌ Error: {e}")
+        finally:
+            # Cleanup session
+            await self.cleanup_session()
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.mcp_client.fastmcp_client",
+        description="Interactive Todo FastMCP client.",
+    )
+    add_connection_arguments(parser, DEFAULT_DAEMON_PORT)
+    add_batch_arguments(parser)
+    return parser.parse_args(argv)
 
 
-async def main():
+async def main(target: ServerTarget):
     """Main entry point."""
     client = TodoFastMCPClient()
-    await client.run()
+    await client.run(target)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    if handle_stop_daemon(args):
+        sys.exit(0)
+    target = target_from_args(args, SERVER_MODULE)
+    if args.batch:
+        summary = asyncio.run(TodoFastMCPClient().run_batch(target, args.batch, args.concurrency))
+        sys.exit(1 if summary["failed"] or summary["unrecognized"] else 0)
+    asyncio.run(main(target))
@@ -0,0 +1,338 @@
+"""Natural-language (Persian/English) command parser shared by the MCP clients."""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+# Persian to English status mapping
+STATUS_MAPPING = {
+    # Persian terms
+    "انجام‌شده": "done",
+    "انجام شده": "done",
+    "تمام شده": "done",
+    "تموم شده": "done",
+    "انجام": "done",
+    "تمام": "done",
+    "در حال انجام": "in_progress",
+    "درحال انجام": "in_progress",
+    "در جریان": "in_progress",
+    "شروع شده": "in_progress",
+    "معلق": "pending",
+    "در انتظار": "pending",
+    "منتظر": "pending",
+    # English terms
+    "done": "done",
+    "completed": "done",
+    "finish": "done",
+    "finished": "done",
+    "in_progress": "in_progress",
+    "in progress": "in_progress",
+    "inprogress": "in_progress",
+    "started": "in_progress",
+    "working": "in_progress",
+    "pending": "pending",
+    "waiting": "pending",
+    "new": "pending",
+}
+
+# Arabic letters that Arabic keyboard layouts type for their Persian
+# counterparts; one character each way, so match positions stay valid
+# in the un-normalized text
+PERSIAN_NORMALIZATION = str.maketrans({"ي": "ی", "ى": "ی", "ك": "ک"})
+
+ARABIC_LETTERS = ("ي", "ى", "ك")
+
+ENGLISH_STATUSES = ("pending", "in_progress", "done")
+LIST_WORDS = ("تسک", "task", "list", "لیست", "همه", "all")
+DETAIL_WORDS = ("جزئیات", "detail", "نشون", "show")
+
+PROMPT_PATTERNS = [
+    (r"(help|guide|راهنما|کمک)", "task_management_guide"),
+    (r"(workflow|جریان کار|مراحل)", "task_status_workflow"),
+    (r"(daily|روزانه|summary|خلاصه)", "daily_task_summary"),
+]
+
+STATS_PATTERN = r"(\bstats?\b|statistics|how many|آمار|چند\s*تا)"
+
+SEARCH_PATTERNS = [
+    r"^(?:جستجو|جست\s*و\s*جو|سرچ)ی?\s*(?:کن\s*)?(?:برای\s*|تسک\s*(?:های|‌ها)?\s*)?(.+)",
+    r"^(.+?)\s*(?:رو|را)\s*پیدا\s*کن$",
+    r"^(?:search|find)\s+(?:for\s+)?(?:tasks?\s+)?(?:about\s+|with\s+|matching\s+)?(.+)",
+]
+
+LIST_PATTERNS = [
+    r"لیست.*تسک",
+    r"تسک.*ها.*نشون",
+    r"نشون.*بده.*تسک",
+    r"همه.*تسک",
+    r"لیست.*(pending|in_progress|done|انجام|معلق)",
+    r"(pending|in_progress|done).*لیست",
+    r"list.*task",
+    r"show.*task",
+    r"get.*task",
+    r"all.*task",
+    r"list.*(pending|in_progress|done)",
+    r"(pending|in_progress|done).*list",
+]
+
+CREATE_PATTERNS = [
+    r"(?:یک\s*)?تسک.*(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?(?:\s*بساز)?$",
+    r"(?:بساز|ایجاد).*تسک.*(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?",
+    r"(?:تسک\s*)?(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?\s*(?:بساز|ایجاد)",
+    r"create.*task.*(?:titled?|with)\s+[\"']?(.+)[\"']?$",
+    r"new.*task\s+[\"']?(.+)[\"']?$",
+    r"add.*task\s+[\"']?(.+)[\"']?$",
+]
+
+UPDATE_PATTERNS = [
+    r"وضعیت.*تسک\s*(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
+    r"(?:تسک\s*)?(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)\s*کن",
+    r"(?:تغییر|آپدیت).*(?:وضعیت)?.*(\d+).*(?:به)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
+    r"update.*(?:task\s*)?(\d+).*(?:to|status)?\s*(pending|in_progress|done)",
+    r"(?:mark|set).*(?:task\s*)?(\d+).*(?:as|to)?\s*(pending|in_progress|done)",
+]
+
+DETAIL_PATTERNS = [
+    r"جزئیات.*تسک\s*(\d+)",
+    r"تسک\s*(\d+).*(?:جزئیات|نشون|ببین)",
+    r"(?:نشون|نمایش).*تسک\s*(\d+)",
+    r"(?:get|show|view).*task\s*(\d+)",
+    r"task\s*(\d+).*(?:detail|info)",
+    r"(?:detail|info).*(?:of|for)?.*task\s*(\d+)",
+]
+
+DELETE_PATTERNS = [
+    r"(?:حذف|پاک).*تسک\s*(\d+)",
+    r"تسک\s*(\d+).*(?:رو|را)?\s*(?:حذف|پاک)\s*کن",
+    r"delete.*task\s*(\d+)",
+    r"remove.*task\s*(\d+)",
+    r"task\s*(\d+).*delete",
+]
+
+# The FastMCP client also deletes on a bare number ("delete 5"); each is
+# tried right after the task-specific pattern it loosens
+LOOSE_DELETE_PATTERNS = {
+    0: r"(?:حذف|پاک).*\s*(\d+)",
+    2: r"delete.*\s*(\d+)",
+    3: r"remove.*\s*(\d+)",
+}
+
+# Status words every update pattern needs, checked before running them
+UPDATE_STATUS_WORDS = ("pending", "in_progress", "done", "انجام", "تمام", "معلق")
+
+TITLE_SUFFIX = re.compile(r"\s*(بساز|ایجاد کن|create|add).*$", re.IGNORECASE)
+NUMBER = re.compile(r"\d+")
+
+Result = Tuple[Optional[str], dict]
+
+
+def normalize_persian(text: str) -> str:
+    """Replace Arabic-keyboard letters with their Persian counterparts."""
+    # str.translate is slow on non-ASCII text; most input needs nothing
+    if any(letter in text for letter in ARABIC_LETTERS):
+        return text.translate(PERSIAN_NORMALIZATION)
+    return text
+
+
+def _trim(text: str, start: int, end: int, chars: Optional[str] = None) -> Tuple[int, int]:
+    """Bounds of text[start:end].strip(chars)."""
+    part = text[start:end]
+    stripped = part.lstrip(chars)
+    start += len(part) - len(stripped)
+    return start, start + len(stripped.rstrip(chars))
+
+
+@dataclass
+class Command:
+    """One input, lowercased and Persian-normalized once for every intent."""
+
+    user_input: str
+    text: str
+    normalized: str
+    number: Optional[re.Match]
+
+    @classmethod
+    def from_input(cls, user_input: str) -> "Command":
+        text = user_input.lower().strip()
+        normalized = normalize_persian(text)
+        return cls(user_input, text, normalized, NUMBER.search(normalized))
+
+
+@dataclass
+class Intent:
+    """
+    One row of the dispatch table: a tool and the patterns that select it.
+
+    `screen` is all the patterns in one alternation, so a command that
+    matches none of them costs a single search. Only when it matches are
+    the patterns tried in order, for the captures of the first that
+    matches; intents without captures use the screen's match directly.
+    """
+
+    patterns: list[re.Pattern]
+    screen: re.Pattern
+    build: Callable[[Command, re.Match], Optional[Result]]
+    captures: bool = True
+    guard: Optional[Callable[[Command], bool]] = None
+
+    @classmethod
+    def compile(cls, patterns: list[str], flags: int, build: Callable, **kwargs) -> "Intent":
+        return cls(
+            patterns=[re.compile(pattern, flags) for pattern in patterns],
+            screen=re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags),
+            build=build,
+            **kwargs,
+        )
+
+    def match(self, command: Command) -> Optional[Result]:
+        if self.guard is not None and not self.guard(command):
+            return None
+        match = self.screen.search(command.normalized)
+        if match is None:
+            return None
+        if not self.captures:
+            return self.build(command, match)
+        for pattern in self.patterns:
+            match = pattern.search(command.normalized)
+            if match is not None:
+                result = self.build(command, match)
+                if result is not None:
+                    return result
+        return None
+
+
+class CommandParser:
+    """
+    Map a Persian or English command to (tool_name, arguments).
+
+    Patterns are compiled once into a dispatch table of intents, tried in
+    priority order (prompts, stats, search, list, create, update, detail,
+    delete) exactly like the clients' original pattern lists, so every
+    command gets the same tool and arguments as before. Arabic-keyboard
+    letters are normalized to Persian before matching; titles and search
+    queries keep the letters as typed.
+
+    Args:
+        id_argument: Name of the task id argument of the server's tools
+        prompts: Recognize help / workflow / daily as "prompt:<name>"
+        loose_delete: Also delete on "delete <number>" without "task"
+    """
+
+    def __init__(self, id_argument: str = "id", prompts: bool = False, loose_delete: bool = False):
+        self.id_argument = id_argument
+        delete_patterns = []
+        for index, pattern in enumerate(DELETE_PATTERNS):
+            delete_patterns.append(pattern)
+            if loose_delete and index in LOOSE_DELETE_PATTERNS:
+                delete_patterns.append(LOOSE_DELETE_PATTERNS[index])
+
+        self.intents: list[Intent] = []
+        if prompts:
+            for pattern, name in PROMPT_PATTERNS:
+                self.intents.append(Intent.compile([pattern], re.IGNORECASE, self._prompt(name), captures=False))
+        self.intents += [
+            Intent.compile([STATS_PATTERN], re.IGNORECASE, self._stats, captures=False),
+            Intent.compile(SEARCH_PATTERNS, re.IGNORECASE, self._search),
+            Intent.compile(LIST_PATTERNS, 0, self._list, captures=False),
+            Intent.compile(CREATE_PATTERNS, re.IGNORECASE, self._create),
+            Intent.compile(UPDATE_PATTERNS, re.IGNORECASE, self._update, guard=self._has_number_and_status),
+            Intent.compile(DETAIL_PATTERNS, re.IGNORECASE, self._detail, guard=self._has_number),
+            Intent.compile(delete_patterns, re.IGNORECASE, self._delete, guard=self._has_number),
+        ]
+
+    def parse(self, user_input: str) -> Result:
+        """
+        Parse user input to determine the tool and arguments.
+
+        Returns:
+            Tuple of (tool_name, arguments_dict) or (None, {}) if not recognized
+        """
+        command = Command.from_input(user_input)
+        for intent in self.intents:
+            result = intent.match(command)
+            if result is not None:
+                return result
+        return self._fallback(command)
+
+    @staticmethod
+    def _has_number(command: Command) -> bool:
+        return command.number is not None
+
+    @staticmethod
+    def _has_number_and_status(command: Command) -> bool:
+        return command.number is not None and any(word in command.normalized for word in UPDATE_STATUS_WORDS)
+
+    def _prompt(self, name: str) -> Callable:
+        def build(command: Command, match: re.Match) -> Result:
+            return (f"prompt:{name}", {})
+        return build
+
+    def _stats(self, command: Command, match: re.Match) -> Result:
+        return ("get_task_stats", {})
+
+    def _search(self, command: Command, match: re.Match) -> Optional[Result]:
+        start, end = _trim(command.normalized, *match.span(1))
+        start, end = _trim(command.normalized, start, end, "\"'")
+        if start == end:
+            return None
+        return ("search_tasks", {"query": command.text[start:end]})
+
+    def _list(self, command: Command, match: re.Match) -> Result:
+        status = None
+        # First check for English status, then Persian (case-sensitively,
+        # as the clients always have)
+        for english in ENGLISH_STATUSES:
+            if english in command.normalized:
+                status = english
+                break
+        if not status:
+            original = normalize_persian(command.user_input)
+            for persian, english in STATUS_MAPPING.items():
+                if persian in original:
+                    status = english
+                    break
+        return ("list_tasks", {"status": status} if status else {})
+
+    def _create(self, command: Command, match: re.Match) -> Optional[Result]:
+        text = command.normalized
+        start, end = _trim(text, *match.span(1))
+        suffix = TITLE_SUFFIX.search(text, start, end)
+        if suffix is not None:
+            end = suffix.start()
+        start, end = _trim(text, start, end)
+        start, end = _trim(text, start, end, "\"'")
+        if start == end:
+            return None
+        return ("create_task", {"title": command.text[start:end]})
+
+    def _update(self, command: Command, match: re.Match) -> Result:
+        status_raw = match.group(2).strip()
+        status = STATUS_MAPPING.get(status_raw, status_raw)
+        return ("update_task_status", {self.id_argument: int(match.group(1)), "status": status})
+
+    def _detail(self, command: Command, match: re.Match) -> Result:
+        return ("get_task_by_id", {self.id_argument: int(match.group(1))})
+
+    def _delete(self, command: Command, match: re.Match) -> Result:
+        return ("delete_task", {self.id_argument: int(match.group(1))})
+
+    def _fallback(self, command: Command) -> Result:
+        """No pattern matched: guess from a bare task number and keywords."""
+        text = command.normalized
+        if command.number is not None:
+            task_id = int(command.number.group())
+
+            # Check for status words
+            for persian, english in STATUS_MAPPING.items():
+                if persian in text:
+                    return ("update_task_status", {self.id_argument: task_id, "status": english})
+
+            # Just show details if only a number mentioned
+            if any(word in text for word in DETAIL_WORDS):
+                return ("get_task_by_id", {self.id_argument: task_id})
+
+        # Check if it's just asking for list
+        if any(word in text for word in LIST_WORDS):
+            return ("list_tasks", {})
+
+        return (None, {})
@@ -1,35 +1,88 @@
 """FastMCP Server for Todo Service."""
 
-from contextlib import asynccontextmanager
-from typing import Optional
+import argparse
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from functools import lru_cache, partial, wraps
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+import anyio
 
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 
 from pydantic import Field
 
+from app.core.config import get_settings
 from app.db.session import get_sync_session, init_db
 from app.models.task import TaskStatus
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import MAX_BULK_IDS, TaskCreate, TaskUpdate
+from app.services.events import event_listener
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.services.serialization import (
+    MIN_MAX_BYTES,
+    TASK_FIELDS,
+    encode_tasks_page_within,
+    get_json_encoder,
+    parse_fields,
+    projection_columns,
+)
+from app.services.task_batch import MAX_BATCH_OPERATIONS, parse_batch_operations
+from app.services.task_search import DEFAULT_SEARCH_LIMIT, MAX_QUERY_LENGTH, MAX_SEARCH_LIMIT
 from app.services.task_service import TaskService
 
 
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Listen for other processes' writes while a session is open.
+
+    FastMCP enters this once per session; concurrent sessions share one
+    listener (Postgres events backend only).
+    """
+    async with event_listener():
+        yield
+
+
 # Initialize the FastMCP server
-mcp = FastMCP("todo-fastmcp-server")
+mcp = FastMCP("todo-fastmcp-server", lifespan=lifespan)
 
+T = TypeVar("T")
 
-# Context manager to initialize database
-@asynccontextmanager
-async def lifespan():
-    """Initialize database on startup."""
-    init_db()
-    yield
+# HTTP transport names accepted on the command line, as FastMCP calls them
+TRANSPORTS = {"stdio": "stdio", "http": "streamable-http", "sse": "sse"}
+DEFAULT_HTTP_PORT = 8001
 
 
-def get_service() -> TaskService:
-    """Get a task service with a fresh session."""
-    session = get_sync_session()
-    return TaskService(session)
+@lru_cache
+def get_tool_threads() -> anyio.CapacityLimiter:
+    """Limit tools running at once to the connection pool's capacity."""
+    settings = get_settings()
+    return anyio.CapacityLimiter(settings.db_pool_size + settings.db_max_overflow)
+
+
+def offloaded(tool: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Run a synchronous tool in a worker thread.
+    
+    FastMCP calls synchronous tools directly on the event loop, so one slow
+    query would stall every other session served by this process. Keeps
+    the tool's signature and docstring for FastMCP's schema.
+    """
+    @wraps(tool)
+    async def run(**arguments) -> T:
+        return await anyio.to_thread.run_sync(
+            partial(tool, **arguments), limiter=get_tool_threads()
+        )
+    
+    return run
+
+
+@contextmanager
+def task_service() -> Iterator[TaskService]:
+    """Open a task service for one tool call, closing its session afterwards."""
+    with get_sync_session() as session:
+        yield TaskService(session)
 
 
 def format_task(task) -> dict:
@@ -37,6 +90,11 @@ def format_task(task) -> dict:
     return task.to_dict()
 
 
+def compact_json(value: dict) -> str:
+    """Encode a tool result as compact JSON text (FastMCP would indent a dict)."""
+    return get_json_encoder().dumps(value).decode()
+
+
 def validate_status(status_str: str) -> TaskStatus:
     """Validate and convert status string to TaskStatus enum."""
     status_map = {
@@ -56,35 +114,80 @@ def validate_status(status_str: str) -> TaskStatus:
 # ==================== TOOLS ====================
 
 @mcp.tool(
+    structured_output=False,
     annotations=ToolAnnotations(
         title="List Tasks",
-        description="Retrieve all tasks with optional status filtering",
+        description="Retrieve tasks page by page with optional status filtering",
         audience=["user", "assistant"]
     )
 )
+@offloaded
 def list_tasks(
     status: Optional[str] = Field(
         None,
         description="Filter tasks by status (pending, in_progress, done)"
+    ),
+    limit: int = Field(
+        DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of tasks to return"
+    ),
+    after: Optional[str] = Field(
+        None,
+        description="Cursor: return tasks after this one (use next_cursor from a previous call)"
+    ),
+    before: Optional[str] = Field(
+        None,
+        description="Cursor: return tasks before this one (use prev_cursor from a previous call)"
+    ),
+    fields: Optional[list[str]] = Field(
+        None,
+        description=f"Task fields to return (default: all of {', '.join(TASK_FIELDS)})"
+    ),
+    max_bytes: Optional[int] = Field(
+        None,
+        ge=MIN_MAX_BYTES,
+        description="Size budget of the result in bytes (default: server setting)"
     )
-) -> dict:
+) -> str:
     """
-    List all tasks. Optionally filter by status.
+    List tasks, newest first, one page at a time. Optionally filter by status.
     
-    Returns a dictionary containing a list of tasks with their details.
+    Returns compact JSON with a page of tasks plus next_cursor/prev_cursor
+    for fetching the neighbouring pages. Request only the fields you need;
+    if the page exceeds max_bytes it is cut short ("truncated": true) and
+    next_cursor continues after the last task returned.
     """
-    service = get_service()
-    
-    # Validate status if provided
+    # Validate status and fields if provided
     status_enum = None
-    if status:
-        try:
+    try:
+        if status:
             status_enum = validate_status(status)
+        fields = parse_fields(fields)
+    except ValueError as e:
+        return compact_json({"error": str(e)})
+    
+    max_bytes = max_bytes or get_settings().mcp_list_max_bytes
+    
+    # Only the requested columns are selected, and rows are encoded
+    # directly to compact JSON without building ORM objects
+    with task_service() as service:
+        try:
+            page = service.get_tasks_page_rows(
+                status=status_enum,
+                limit=limit,
+                after=after,
+                before=before,
+                columns=projection_columns(fields),
+            )
         except ValueError as e:
-            return {"error": str(e)}
+            return compact_json({"error": str(e)})
     
-    tasks = service.get_all_tasks(status=status_enum)
-    return {"tasks": [format_task(task) for task in tasks]}
+    try:
+        return encode_tasks_page_within(page, fields, max_bytes).decode()
+    except ValueError as e:
+        return compact_json({"error": str(e)})
 
 
 @mcp.tool(
@@ -94,6 +197,7 @@ def list_tasks(
         audience=["user", "assistant"]
     )
 )
+@offloaded
 def get_task_by_id(
     task_id: int = Field(..., description="The task ID to retrieve")
 ) -> dict:
@@ -102,13 +206,13 @@ def get_task_by_id(
     
     Returns the task details including title, description, status, and timestamps.
     """
-    service = get_service()
-    task = service.get_task_by_id(task_id)
-    
-    if not task:
-        return {"error": f"Task with id {task_id} not found"}
-    
-    return {"task": format_task(task)}
+    with task_service() as service:
+        task = service.get_task_by_id(task_id)
+        
+        if not task:
+            return {"error": f"Task with id {task_id} not found"}
+        
+        return {"task": format_task(task)}
 
 
 @mcp.tool(
@@ -118,6 +222,7 @@ def get_task_by_id(
         audience=["user", "assistant"]
     )
 )
+@offloaded
 def create_task(
     title: str = Field(..., description="The task title (required, max 200 chars)"),
     description: Optional[str] = Field(None, description="The task description"),
@@ -144,10 +249,41 @@ def create_task(
         status=status_enum
     )
     
-    service = get_service()
-    task = service.create_task(task_data)
+    with task_service() as service:
+        task = service.create_task(task_data)
+        
+        return {"task": format_task(task)}
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Create Tasks",
+        description="Create several tasks at once in a single transaction",
+        audience=["user", "assistant"]
+    )
+)
+@offloaded
+def create_tasks(
+    tasks: list[TaskCreate] = Field(
+        ...,
+        min_length=1,
+        description="Tasks to create, in order (title required; description and status optional)"
+    )
+) -> dict:
+    """
+    Create several tasks at once in a single transaction.
     
-    return {"task": format_task(task)}
+    Prefer this over repeated create_task calls. Returns the created tasks
+    in the same order as given.
+    """
+    max_size = get_settings().task_batch_max_size
+    if len(tasks) > max_size:
+        return {"error": f"A batch may contain at most {max_size} tasks"}
+    
+    with task_service() as service:
+        created = service.create_tasks(tasks)
+        
+        return {"tasks": [format_task(task) for task in created]}
 
 
 @mcp.tool(
@@ -157,6 +293,7 @@ def create_task(
         audience=["user", "assistant"]
     )
 )
+@offloaded
 def update_task(
     task_id: int = Field(..., description="The task ID to update"),
     title: Optional[str] = Field(None, description="New task title (max 200 chars)"),
@@ -194,13 +331,13 @@ def update_task(
     
     task_data = TaskUpdate(**update_dict)
     
-    service = get_service()
-    task = service.update_task(task_id, task_data)
-    
-    if not task:
-        return {"error": f"Task with id {task_id} not found"}
-    
-    return {"task": format_task(task)}
+    with task_service() as service:
+        task = service.update_task(task_id, task_data)
+        
+        if not task:
+            return {"error": f"Task with id {task_id} not found"}
+        
+        return {"task": format_task(task)}
 
 
 @mcp.tool(
@@ -210,6 +347,7 @@ def update_task(
         audience=["user", "assistant"]
     )
 )
+@offloaded
 def update_task_status(
     task_id: int = Field(..., description="The task ID"),
     status: str = Field(..., description="The new task status (pending, in_progress, done)")
@@ -225,13 +363,13 @@ def update_task_status(
     except ValueError as e:
         return {"error": str(e)}
     
-    service = get_service()
-    task = service.update_task_status(task_id, status_enum)
-    
-    if not task:
-        return {"error": f"Task with id {task_id} not found"}
-    
-    return {"task": format_task(task)}
+    with task_service() as service:
+        task = service.update_task_status(task_id, status_enum)
+        
+        if not task:
+            return {"error": f"Task with id {task_id} not found"}
+        
+        return {"task": format_task(task)}
 
 
 @mcp.tool(
@@ -241,6 +379,7 @@ def update_task_status(
         audience=["user", "assistant"]
     )
 )
+@offloaded
 def delete_task(
     task_id: int = Field(..., description="The task ID to delete")
 ) -> dict:
@@ -249,13 +388,219 @@ def delete_task(
     
     Returns confirmation of deletion.
     """
-    service = get_service()
-    deleted = service.delete_task(task_id)
+    with task_service() as service:
+        deleted = service.delete_task(task_id)
+        
+        if not deleted:
+            return {"error": f"Task with id {task_id} not found"}
+        
+        return {"deleted": True, "id": task_id}
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Update Tasks",
+        description="Update many tasks at once, selected by ids and/or a filter",
+        audience=["user", "assistant"]
+    )
+)
+@offloaded
+def update_tasks(
+    ids: Optional[list[int]] = Field(None, max_length=MAX_BULK_IDS, description="Only tasks with these IDs"),
+    filter_status: Optional[str] = Field(None, description="Only tasks currently in this status (pending, in_progress, done)"),
+    created_before: Optional[datetime] = Field(None, description="Only tasks created before this ISO 8601 timestamp"),
+    title: Optional[str] = Field(None, description="New title for the selected tasks (max 200 chars)"),
+    description: Optional[str] = Field(None, description="New description for the selected tasks"),
+    status: Optional[str] = Field(None, description="New status for the selected tasks (pending, in_progress, done)")
+) -> dict:
+    """
+    Update many tasks at once in a single statement.
+    
+    Select tasks by ids and/or filter_status/created_before, e.g. mark all
+    in_progress tasks as done. Returns the number and IDs of updated tasks.
+    """
+    if title and len(title) > 200:
+        return {"error": "Title must be 200 characters or less"}
+    
+    try:
+        filter_enum = validate_status(filter_status) if filter_status else None
+        status_enum = validate_status(status) if status else None
+    except ValueError as e:
+        return {"error": str(e)}
+    
+    update_dict = {}
+    if title is not None:
+        update_dict["title"] = title
+    if description is not None:
+        update_dict["description"] = description
+    if status_enum is not None:
+        update_dict["status"] = status_enum
+    
+    if not update_dict:
+        return {"error": "No fields to update"}
+    
+    with task_service() as service:
+        try:
+            updated_ids = service.update_tasks(
+                TaskUpdate(**update_dict),
+                ids=ids,
+                status=filter_enum,
+                created_before=created_before,
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+        
+        return {"updated": len(updated_ids), "ids": updated_ids}
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Delete Tasks",
+        description="Permanently remove many tasks at once, selected by ids and/or a filter",
+        audience=["user", "assistant"]
+    )
+)
+@offloaded
+def delete_tasks(
+    ids: Optional[list[int]] = Field(None, max_length=MAX_BULK_IDS, description="Only tasks with these IDs"),
+    filter_status: Optional[str] = Field(None, description="Only tasks currently in this status (pending, in_progress, done)"),
+    created_before: Optional[datetime] = Field(None, description="Only tasks created before this ISO 8601 timestamp")
+) -> dict:
+    """
+    Delete many tasks at once in a single statement.
     
-    if not deleted:
-        return {"error": f"Task with id {task_id} not found"}
+    Returns the number and IDs of deleted tasks.
+    """
+    try:
+        filter_enum = validate_status(filter_status) if filter_status else None
+    except ValueError as e:
+        return {"error": str(e)}
     
-    return {"deleted": True, "id": task_id}
+    with task_service() as service:
+        try:
+            deleted_ids = service.delete_tasks(
+                ids=ids,
+                status=filter_enum,
+                created_before=created_before,
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+        
+        return {"deleted": len(deleted_ids), "ids": deleted_ids}
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Get Task Stats",
+        description="Get the number of tasks per status and in total",
+        audience=["user", "assistant"]
+    )
+)
+@offloaded
+def get_task_stats() -> dict:
+    """
+    Get how many tasks are pending, in progress and done, plus the total.
+    
+    Cheap to call regardless of the number of tasks; prefer it over listing
+    and counting tasks.
+    """
+    with task_service() as service:
+        return {"stats": service.get_task_stats()}
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Search Tasks",
+        description="Full-text and fuzzy search over task titles and descriptions",
+        audience=["user", "assistant"]
+    )
+)
+@offloaded
+def search_tasks(
+    query: str = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_QUERY_LENGTH,
+        description="Search text (Persian or English)"
+    ),
+    status: Optional[str] = Field(
+        None,
+        description="Only tasks in this status (pending, in_progress, done)"
+    ),
+    limit: int = Field(
+        DEFAULT_SEARCH_LIMIT,
+        ge=1,
+        le=MAX_SEARCH_LIMIT,
+        description="Maximum number of tasks to return"
+    ),
+    offset: int = Field(
+        0,
+        ge=0,
+        description="Number of results to skip; pass 'next_offset' from the previous result"
+    )
+) -> dict:
+    """
+    Search task titles and descriptions, best match first.
+    
+    Every word must match the start of a word in the task; title matches
+    rank higher. Typos are tolerated on Postgres. Persian text is normalized
+    (Arabic/Persian yeh and kaf, zero-width non-joiner).
+    """
+    try:
+        status_enum = validate_status(status) if status else None
+    except ValueError as e:
+        return {"error": str(e)}
+    
+    with task_service() as service:
+        try:
+            page = service.search_tasks(query, status=status_enum, limit=limit, offset=offset)
+        except ValueError as e:
+            return {"error": str(e)}
+        
+        return {
+            "tasks": [format_task(task) for task in page.items],
+            "next_offset": page.next_offset,
+        }
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Batch",
+        description="Run several task operations in order, in one transaction",
+        audience=["user", "assistant"]
+    )
+)
+@offloaded
+def batch(
+    operations: list[dict] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_OPERATIONS,
+        description=(
+            "Operations to run, in order. Each has an 'op' and its fields: "
+            "create (title, description, status), update (id, title, description, status), "
+            "update_status (id, status), delete (id), get (id)"
+        )
+    ),
+    atomic: bool = Field(
+        True,
+        description="All-or-nothing; if false, failed operations are skipped and the rest committed"
+    )
+) -> dict:
+    """
+    Run several task operations in order, in one transaction.
+    
+    Prefer this over separate calls when making several changes at once,
+    e.g. creating a few tasks, marking others done and deleting one.
+    Returns one result per operation and whether the batch was committed.
+    """
+    try:
+        parsed = parse_batch_operations(operations)
+    except ValueError as e:
+        return {"error": str(e)}
+    
+    with task_service() as service:
+        return service.run_batch(parsed, atomic=atomic).to_dict()
 
 
 # ==================== PROMPTS ====================
@@ -270,7 +615,8 @@ def task_management_guide() -> str:
 ## Available Operations
 
 ### 1. List Tasks
-- View all tasks or filter by status (pending, in_progress, done)
+- View tasks page by page, newest first, or filter by status (pending, in_progress, done)
+- Pass `next_cursor` from a result as `after` to get the next page
 - Example: "Show me all pending tasks"
 
 ### 2. Get Task Details
@@ -283,15 +629,38 @@ def task_management_guide() -> str:
 - Status defaults to 'pending' if not specified
 - Example: "Create a task titled 'Buy groceries'"
 
-### 4. Update Task
+### 4. Create Many Tasks
+- Create several tasks in one call (single transaction)
+- Example: "Create tasks 'Buy milk', 'Call mom' and 'Pay rent'"
+
+### 5. Update Task
 - Modify task title, description, or status
 - Can update one or more fields at once
 - Example: "Update task 3 to status done"
 
-### 5. Delete Task
+### 6. Delete Task
 - Remove a task by ID
 - Example: "Delete task 7"
 
+### 7. Bulk Update / Delete
+- Update or delete many tasks in one call, by IDs or by filter (status, created_before)
+- Example: "Mark all in_progress tasks as done" → `update_tasks(filter_status="in_progress", status="done")`
+
+### 8. Task Stats
+- Get the number of pending, in_progress and done tasks and the total
+- Example: "How many tasks are still pending?" → `get_task_stats()`
+
+### 9. Search Tasks
+- Find tasks by words in their title or description (Persian or English), best match first
+- Pass `next_offset` from a result as `offset` to get the next page
+- Example: "Find tasks about the invoice" → `search_tasks(query="invoice")`
+
+### 10. Batch
+- Run several operations (create, update, update_status, delete, get) in one call and one transaction
+- All-or-nothing by default; pass `atomic=false` to skip failed operations and keep the rest
+- Example: "Create 'Buy milk', mark 4 and 7 done, delete 9" →
+  `batch(operations=[{"op": "create", "title": "Buy milk"}, {"op": "update_status", "id": 4, "status": "done"}, {"op": "update_status", "id": 7, "status": "done"}, {"op": "delete", "id": 9}])`
+
 ## Status Values
 - **pending**: Task is not yet started
 - **in_progress**: Task is currently being worked on
@@ -418,6 +787,10 @@ def daily_task_summary() -> str:
     """
     return """# Daily Task Summary
 
+## Overview
+Use: `get_task_stats()` to get the pending / in_progress / done counts and the total
+(do not list and count tasks yourself)
+
 ## Morning Review (صبح)
 
 ### Tasks to Complete Today
@@ -473,9 +846,26 @@ create_task(title="...", description="...")
 """
 
 
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Todo FastMCP server.")
+    parser.add_argument(
+        "--transport",
+        choices=list(TRANSPORTS),
+        default="stdio",
+        help="stdio (default), http (streamable HTTP at /mcp) or sse (GET /sse)",
+    )
+    parser.add_argument("--host", default=mcp.settings.host, help="Listen address for http/sse")
+    parser.add_argument("--port", type=int, default=DEFAULT_HTTP_PORT, help="Listen port for http/sse")
+    return parser.parse_args(argv)
+
+
 # Run the server
 if __name__ == "__main__":
+    args = parse_args()
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
     # Initialize database
     init_db()
     # Run with mcp dev app/mcp_server/fastmcp_server
-    mcp.run()
+    mcp.run(TRANSPORTS[args.transport])
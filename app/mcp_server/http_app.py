@@ -0,0 +1,88 @@
+"""Serve the low-level MCP server over HTTP (streamable HTTP or SSE)."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Literal
+
+from mcp.server.sse import SseServerTransport
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Mount, Route
+from starlette.types import Receive, Scope, Send
+
+from app.db.session import get_async_engine, init_db
+from app.mcp_server.server import server
+from app.services.events import event_listener
+
+HTTPTransport = Literal["http", "sse"]
+
+# Endpoint paths, the same as FastMCP's defaults
+STREAMABLE_HTTP_PATH = "/mcp"
+SSE_PATH = "/sse"
+SSE_MESSAGES_PATH = "/messages/"
+
+
+class StreamableHTTPEndpoint:
+    """ASGI endpoint handing every request to the session manager."""
+
+    def __init__(self, session_manager: StreamableHTTPSessionManager):
+        self.session_manager = session_manager
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.session_manager.handle_request(scope, receive, send)
+
+
+async def health(request: Request) -> JSONResponse:
+    """Liveness check for clients and load balancers."""
+    return JSONResponse({"status": "ok"})
+
+
+def create_http_app(transport: HTTPTransport = "http") -> Starlette:
+    """
+    Build the ASGI app serving MCP over HTTP.
+
+    One long-lived process serves every connected agent: all sessions
+    share the engine, its connection pool and the tool call slots, instead
+    of each stdio client starting its own process and pool.
+
+    Args:
+        transport: "http" for streamable HTTP (POST/GET /mcp) or "sse" for
+            the older SSE transport (GET /sse, POST /messages/)
+
+    Returns:
+        Starlette application; run it with uvicorn
+    """
+    routes = [Route("/health", health)]
+    session_manager = None
+
+    if transport == "http":
+        session_manager = StreamableHTTPSessionManager(app=server)
+        routes.append(Route(STREAMABLE_HTTP_PATH, StreamableHTTPEndpoint(session_manager)))
+    elif transport == "sse":
+        sse = SseServerTransport(SSE_MESSAGES_PATH)
+
+        async def handle_sse(request: Request) -> Response:
+            async with sse.connect_sse(request.scope, request.receive, request._send) as streams:
+                await server.run(streams[0], streams[1], server.create_initialization_options())
+            return Response()
+
+        routes.append(Route(SSE_PATH, handle_sse, methods=["GET"]))
+        routes.append(Mount(SSE_MESSAGES_PATH, app=sse.handle_post_message))
+    else:
+        raise ValueError(f"Unknown HTTP transport: {transport}")
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        init_db()
+        try:
+            async with event_listener():
+                if session_manager is not None:
+                    async with session_manager.run():
+                        yield
+                else:
+                    yield
+        finally:
+            await get_async_engine().dispose()
+
+    return Starlette(routes=routes, lifespan=lifespan)
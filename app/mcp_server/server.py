@@ -1,24 +1,46 @@
 """MCP Server for Todo Service using the official mcp package."""
 
+import argparse
+import asyncio
 import json
-from typing import Optional
+import weakref
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Optional
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
     Tool,
     TextContent,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db.session import get_sync_session, init_db
+from app.core.config import get_settings
+from app.db.session import get_async_engine, init_db
 from app.models.task import TaskStatus
-from app.schemas.task import TaskCreate, TaskUpdate
-from app.services.task_service import TaskService
+from app.schemas.task import MAX_BULK_IDS, TaskCreate, TaskUpdate
+from app.services.events import event_listener
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.services.serialization import (
+    MIN_MAX_BYTES,
+    TASK_FIELDS,
+    encode_tasks_page_within,
+    parse_fields,
+    projection_columns,
+)
+from app.services.task_batch import MAX_BATCH_OPERATIONS, OPERATION_FIELDS, parse_batch_operations
+from app.services.task_search import DEFAULT_SEARCH_LIMIT, MAX_QUERY_LENGTH, MAX_SEARCH_LIMIT
+from app.services.async_task_service import AsyncTaskService
 
 
 # Create MCP Server instance
 server = Server("todo-mcp-server")
 
+TRANSPORTS = ("stdio", "http", "sse")
+DEFAULT_HTTP_HOST = "127.0.0.1"
+DEFAULT_HTTP_PORT = 8001
+
 
 class MCPError(Exception):
     """Custom MCP error with code and message."""
@@ -28,10 +50,42 @@ class MCPError(Exception):
         super().__init__(message)
 
 
-def get_service() -> TaskService:
-    """Get a task service with a fresh session."""
-    session = get_sync_session()
-    return TaskService(session)
+# Tool call slots of each event loop the server runs on
+_call_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_call_slots() -> asyncio.Semaphore:
+    """
+    Limit concurrent database-bound tool calls to the pool's capacity.
+    
+    One semaphore per running event loop: a semaphore belongs to the loop
+    it was first used on, and the server may run on several in one
+    process (a new asyncio.run, tests, an embedding application).
+    """
+    loop = asyncio.get_running_loop()
+    slots = _call_slots.get(loop)
+    if slots is None:
+        settings = get_settings()
+        slots = _call_slots[loop] = asyncio.Semaphore(settings.db_pool_size + settings.db_max_overflow)
+    return slots
+
+
+@asynccontextmanager
+async def task_service() -> AsyncIterator[AsyncTaskService]:
+    """
+    Open a task service for one tool call.
+    
+    Tool calls run concurrently on the event loop, so database work uses
+    the asyncio engine instead of blocking it. Each call gets its own
+    session, closed (returning its connection to the pool) when the call
+    ends. Calls beyond the pool's capacity wait for a slot here rather
+    than timing out on pool checkout.
+    """
+    async with get_call_slots():
+        async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+            yield AsyncTaskService(session)
 
 
 def format_error(code: str, message: str) -> dict:
@@ -64,13 +118,44 @@ def validate_status(status_str: str) -> Optional[TaskStatus]:
     return status_map[status_lower]
 
 
+def parse_selection(arguments: dict) -> dict:
+    """Extract bulk selection criteria (ids, status, created_before) from tool arguments."""
+    selection = {}
+    if arguments.get("ids"):
+        if len(arguments["ids"]) > MAX_BULK_IDS:
+            raise MCPError("VALIDATION_ERROR", f"Parameter 'ids' may list at most {MAX_BULK_IDS} tasks")
+        selection["ids"] = [int(task_id) for task_id in arguments["ids"]]
+    if arguments.get("filter_status"):
+        selection["status"] = validate_status(arguments["filter_status"])
+    if arguments.get("created_before"):
+        try:
+            selection["created_before"] = datetime.fromisoformat(arguments["created_before"])
+        except ValueError as e:
+            raise MCPError(
+                "VALIDATION_ERROR",
+                f"Invalid created_before: {arguments['created_before']}. Use ISO 8601"
+            ) from e
+    if not selection:
+        raise MCPError(
+            "MISSING_PARAMETER",
+            "One of 'ids', 'filter_status' or 'created_before' is required"
+        )
+    return selection
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List all available tools."""
     return [
         Tool(
             name="list_tasks",
-            description="List all tasks. Optionally filter by status (pending, in_progress, done).",
+            description=(
+                "List tasks, newest first, one page at a time. Optionally filter by "
+                "status (pending, in_progress, done). Pass 'next_cursor' from the "
+                "result as 'after' to fetch the next page. Request only the 'fields' "
+                "you need; if the page exceeds 'max_bytes' it is cut short "
+                "('truncated': true) and 'next_cursor' continues after the last task."
+            ),
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -78,6 +163,30 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "enum": ["pending", "in_progress", "done"],
                         "description": "Filter tasks by status"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": MAX_PAGE_SIZE,
+                        "description": f"Page size (default: {DEFAULT_PAGE_SIZE})"
+                    },
+                    "after": {
+                        "type": "string",
+                        "description": "Cursor: return tasks after this one (next page)"
+                    },
+                    "before": {
+                        "type": "string",
+                        "description": "Cursor: return tasks before this one (previous page)"
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": list(TASK_FIELDS)},
+                        "description": "Task fields to return (default: all)"
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "minimum": MIN_MAX_BYTES,
+                        "description": "Size budget of the result in bytes (default: server setting)"
                     }
                 },
                 "required": []
@@ -120,6 +229,100 @@ async def list_tools() -> list[Tool]:
                 "required": ["title"]
             }
         ),
+        Tool(
+            name="create_tasks",
+            description=(
+                "Create several tasks at once in a single transaction. "
+                "Prefer this over repeated create_task calls."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tasks": {
+                        "type": "array",
+                        "minItems": 1,
+                        "description": "Tasks to create, in order",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {
+                                    "type": "string",
+                                    "description": "The task title (required, max 200 chars)"
+                                },
+                                "description": {
+                                    "type": "string",
+                                    "description": "The task description (optional)"
+                                },
+                                "status": {
+                                    "type": "string",
+                                    "enum": ["pending", "in_progress", "done"],
+                                    "description": "Initial task status (default: pending)"
+                                }
+                            },
+                            "required": ["title"]
+                        }
+                    }
+                },
+                "required": ["tasks"]
+            }
+        ),
+        Tool(
+            name="batch",
+            description=(
+                "Run several task operations in order, in one transaction. "
+                "Prefer this over separate calls when making several changes at once. "
+                "Returns one result per operation; with atomic=true (the default) "
+                "a failed operation rolls back the whole batch."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "operations": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": MAX_BATCH_OPERATIONS,
+                        "description": "Operations to run, in order",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "op": {
+                                    "type": "string",
+                                    "enum": list(OPERATION_FIELDS),
+                                    "description": "Operation to run"
+                                },
+                                "id": {
+                                    "type": "integer",
+                                    "description": "Task ID (all operations except create)"
+                                },
+                                "title": {
+                                    "type": "string",
+                                    "description": "Task title (create, update)"
+                                },
+                                "description": {
+                                    "type": "string",
+                                    "description": "Task description (create, update)"
+                                },
+                                "status": {
+                                    "type": "string",
+                                    "enum": ["pending", "in_progress", "done"],
+                                    "description": "Task status (create, update, update_status)"
+                                }
+                            },
+                            "required": ["op"]
+                        }
+                    },
+                    "atomic": {
+                        "type": "boolean",
+                        "description": (
+                            "All-or-nothing (default: true). If false, failed operations "
+                            "are skipped and the rest are still committed."
+                        ),
+                        "default": True
+                    }
+                },
+                "required": ["operations"]
+            }
+        ),
         Tool(
             name="update_task_status",
             description="Update the status of an existing task.",
@@ -139,6 +342,121 @@ async def list_tools() -> list[Tool]:
                 "required": ["id", "status"]
             }
         ),
+        Tool(
+            name="update_tasks",
+            description=(
+                "Update many tasks at once, selected by 'ids' and/or a filter "
+                "('filter_status', 'created_before'). Runs as a single statement, e.g. "
+                "mark all in_progress tasks as done."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "maxItems": MAX_BULK_IDS,
+                        "description": "Only tasks with these IDs"
+                    },
+                    "filter_status": {
+                        "type": "string",
+                        "enum": ["pending", "in_progress", "done"],
+                        "description": "Only tasks currently in this status"
+                    },
+                    "created_before": {
+                        "type": "string",
+                        "description": "Only tasks created before this ISO 8601 timestamp"
+                    },
+                    "status": {
+                        "type": "string",
+                        "enum": ["pending", "in_progress", "done"],
+                        "description": "New status for the selected tasks"
+                    },
+                    "title": {
+                        "type": "string",
+                        "description": "New title for the selected tasks (max 200 chars)"
+                    },
+                    "description": {
+                        "type": "string",
+                        "description": "New description for the selected tasks"
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="delete_tasks",
+            description=(
+                "Delete many tasks at once, selected by 'ids' and/or a filter "
+                "('filter_status', 'created_before'). Runs as a single statement."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "maxItems": MAX_BULK_IDS,
+                        "description": "Only tasks with these IDs"
+                    },
+                    "filter_status": {
+                        "type": "string",
+                        "enum": ["pending", "in_progress", "done"],
+                        "description": "Only tasks currently in this status"
+                    },
+                    "created_before": {
+                        "type": "string",
+                        "description": "Only tasks created before this ISO 8601 timestamp"
+                    }
+                },
+                "required": []
+            }
+        ),
+        Tool(
+            name="search_tasks",
+            description=(
+                "Search task titles and descriptions (Persian or English), best match "
+                "first. Every word must match the start of a word in the task; typos are "
+                "tolerated on Postgres. Pass 'next_offset' from the result as 'offset' "
+                "to fetch the next page."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "maxLength": MAX_QUERY_LENGTH,
+                        "description": "Search text"
+                    },
+                    "status": {
+                        "type": "string",
+                        "enum": ["pending", "in_progress", "done"],
+                        "description": "Only tasks in this status"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": MAX_SEARCH_LIMIT,
+                        "description": f"Page size (default: {DEFAULT_SEARCH_LIMIT})"
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "description": "Number of results to skip (default: 0)"
+                    }
+                },
+                "required": ["query"]
+            }
+        ),
+        Tool(
+            name="get_task_stats",
+            description="Get the number of tasks per status (pending, in_progress, done) and the total. Cheaper than listing and counting tasks.",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        ),
         Tool(
             name="delete_task",
             description="Delete a task by its ID.",
@@ -166,10 +484,22 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             return await handle_get_task_by_id(arguments)
         elif name == "create_task":
             return await handle_create_task(arguments)
+        elif name == "create_tasks":
+            return await handle_create_tasks(arguments)
+        elif name == "batch":
+            return await handle_batch(arguments)
         elif name == "update_task_status":
             return await handle_update_task_status(arguments)
         elif name == "delete_task":
             return await handle_delete_task(arguments)
+        elif name == "update_tasks":
+            return await handle_update_tasks(arguments)
+        elif name == "delete_tasks":
+            return await handle_delete_tasks(arguments)
+        elif name == "get_task_stats":
+            return await handle_get_task_stats(arguments)
+        elif name == "search_tasks":
+            return await handle_search_tasks(arguments)
         else:
             result = format_error("UNKNOWN_TOOL", f"Unknown tool: {name}")
             return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False))]
@@ -183,14 +513,42 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 async def handle_list_tasks(arguments: dict) -> list[TextContent]:
     """Handle list_tasks tool call."""
-    service = get_service()
     status_str = arguments.get("status")
     status = validate_status(status_str) if status_str else None
     
-    tasks = service.get_all_tasks(status=status)
-    result = {"tasks": [format_task(task) for task in tasks]}
+    limit = int(arguments.get("limit", DEFAULT_PAGE_SIZE))
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise MCPError("VALIDATION_ERROR", f"Parameter 'limit' must be between 1 and {MAX_PAGE_SIZE}")
     
-    return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+    try:
+        fields = parse_fields(arguments.get("fields"))
+    except ValueError as e:
+        raise MCPError("VALIDATION_ERROR", str(e)) from e
+    
+    max_bytes = int(arguments.get("max_bytes", get_settings().mcp_list_max_bytes))
+    if max_bytes < MIN_MAX_BYTES:
+        raise MCPError("VALIDATION_ERROR", f"Parameter 'max_bytes' must be at least {MIN_MAX_BYTES}")
+    
+    # Only the requested columns are selected, and rows are encoded
+    # directly to compact JSON without building ORM objects
+    async with task_service() as service:
+        try:
+            page = await service.get_tasks_page_rows(
+                status=status,
+                limit=limit,
+                after=arguments.get("after"),
+                before=arguments.get("before"),
+                columns=projection_columns(fields),
+            )
+        except ValueError as e:
+            raise MCPError("INVALID_CURSOR", str(e)) from e
+    
+    try:
+        result = encode_tasks_page_within(page, fields, max_bytes)
+    except ValueError as e:
+        raise MCPError("RESPONSE_TOO_LARGE", str(e)) from e
+    
+    return [TextContent(type="text", text=result.decode())]
 
 
 async def handle_get_task_by_id(arguments: dict) -> list[TextContent]:
@@ -199,8 +557,8 @@ async def handle_get_task_by_id(arguments: dict) -> list[TextContent]:
     if task_id is None:
         raise MCPError("MISSING_PARAMETER", "Parameter 'id' is required")
     
-    service = get_service()
-    task = service.get_task_by_id(int(task_id))
+    async with task_service() as service:
+        task = await service.get_task_by_id(int(task_id))
     
     if not task:
         raise MCPError("NOT_FOUND", f"Task with id {task_id} not found")
@@ -228,13 +586,58 @@ async def handle_create_task(arguments: dict) -> list[TextContent]:
         status=status or TaskStatus.PENDING
     )
     
-    service = get_service()
-    task = service.create_task(task_data)
+    async with task_service() as service:
+        task = await service.create_task(task_data)
     
     result = {"task": format_task(task)}
     return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
 
 
+async def handle_create_tasks(arguments: dict) -> list[TextContent]:
+    """Handle create_tasks tool call."""
+    items = arguments.get("tasks")
+    if not items:
+        raise MCPError("MISSING_PARAMETER", "Parameter 'tasks' is required")
+    
+    max_size = get_settings().task_batch_max_size
+    if len(items) > max_size:
+        raise MCPError("VALIDATION_ERROR", f"A batch may contain at most {max_size} tasks")
+    
+    tasks_data = []
+    for index, item in enumerate(items):
+        status = validate_status(item.get("status", "pending"))
+        try:
+            tasks_data.append(TaskCreate(
+                title=item.get("title"),
+                description=item.get("description"),
+                status=status or TaskStatus.PENDING
+            ))
+        except ValidationError as e:
+            message = "; ".join(error["msg"] for error in e.errors())
+            raise MCPError("VALIDATION_ERROR", f"tasks[{index}]: {message}") from e
+    
+    async with task_service() as service:
+        tasks = await service.create_tasks(tasks_data)
+    
+    result = {"tasks": [format_task(task) for task in tasks]}
+    return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+
+
+async def handle_batch(arguments: dict) -> list[TextContent]:
+    """Handle batch tool call."""
+    try:
+        operations = parse_batch_operations(arguments.get("operations"))
+    except ValueError as e:
+        raise MCPError("VALIDATION_ERROR", str(e)) from e
+    atomic = bool(arguments.get("atomic", True))
+    
+    async with task_service() as service:
+        outcome = await service.run_batch(operations, atomic=atomic)
+    
+    result = outcome.to_dict()
+    return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+
+
 async def handle_update_task_status(arguments: dict) -> list[TextContent]:
     """Handle update_task_status tool call."""
     task_id = arguments.get("id")
@@ -247,8 +650,8 @@ async def handle_update_task_status(arguments: dict) -> list[TextContent]:
     
     status = validate_status(status_str)
     
-    service = get_service()
-    task = service.update_task_status(int(task_id), status)
+    async with task_service() as service:
+        task = await service.update_task_status(int(task_id), status)
     
     if not task:
         raise MCPError("NOT_FOUND", f"Task with id {task_id} not found")
@@ -263,8 +666,8 @@ async def handle_delete_task(arguments: dict) -> list[TextContent]:
     if task_id is None:
         raise MCPError("MISSING_PARAMETER", "Parameter 'id' is required")
     
-    service = get_service()
-    deleted = service.delete_task(int(task_id))
+    async with task_service() as service:
+        deleted = await service.delete_task(int(task_id))
     
     if not deleted:
         raise MCPError("NOT_FOUND", f"Task with id {task_id} not found")
@@ -273,24 +676,143 @@ async def handle_delete_task(arguments: dict) -> list[TextContent]:
     return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
 
 
-async def run_server():
-    """Run the MCP server."""
+async def handle_get_task_stats(arguments: dict) -> list[TextContent]:
+    """Handle get_task_stats tool call."""
+    async with task_service() as service:
+        result = {"stats": await service.get_task_stats()}
+    return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+
+
+async def handle_search_tasks(arguments: dict) -> list[TextContent]:
+    """Handle search_tasks tool call."""
+    query = arguments.get("query")
+    if not query:
+        raise MCPError("MISSING_PARAMETER", "Parameter 'query' is required")
+    if len(query) > MAX_QUERY_LENGTH:
+        raise MCPError("VALIDATION_ERROR", f"Parameter 'query' must be at most {MAX_QUERY_LENGTH} characters")
+    
+    status_str = arguments.get("status")
+    status = validate_status(status_str) if status_str else None
+    limit = int(arguments.get("limit", DEFAULT_SEARCH_LIMIT))
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        raise MCPError("VALIDATION_ERROR", f"Parameter 'limit' must be between 1 and {MAX_SEARCH_LIMIT}")
+    offset = int(arguments.get("offset") or 0)
+    if offset < 0:
+        raise MCPError("VALIDATION_ERROR", "Parameter 'offset' must not be negative")
+    
+    async with task_service() as service:
+        page = await service.search_tasks(query, status=status, limit=limit, offset=offset)
+    result = {
+        "tasks": [format_task(task) for task in page.items],
+        "next_offset": page.next_offset,
+    }
+    return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+
+
+async def handle_update_tasks(arguments: dict) -> list[TextContent]:
+    """Handle update_tasks tool call."""
+    selection = parse_selection(arguments)
+    
+    update_dict = {}
+    if arguments.get("title") is not None:
+        update_dict["title"] = arguments["title"]
+    if arguments.get("description") is not None:
+        update_dict["description"] = arguments["description"]
+    if arguments.get("status"):
+        update_dict["status"] = validate_status(arguments["status"])
+    if not update_dict:
+        raise MCPError("MISSING_PARAMETER", "At least one of 'status', 'title' or 'description' is required")
+    
+    try:
+        task_data = TaskUpdate(**update_dict)
+    except ValidationError as e:
+        message = "; ".join(error["msg"] for error in e.errors())
+        raise MCPError("VALIDATION_ERROR", message) from e
+    
+    async with task_service() as service:
+        try:
+            ids = await service.update_tasks(task_data, **selection)
+        except ValueError as e:
+            raise MCPError("VALIDATION_ERROR", str(e)) from e
+    
+    result = {"updated": len(ids), "ids": ids}
+    return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+
+
+async def handle_delete_tasks(arguments: dict) -> list[TextContent]:
+    """Handle delete_tasks tool call."""
+    selection = parse_selection(arguments)
+    
+    async with task_service() as service:
+        try:
+            ids = await service.delete_tasks(**selection)
+        except ValueError as e:
+            raise MCPError("VALIDATION_ERROR", str(e)) from e
+    
+    result = {"deleted": len(ids), "ids": ids}
+    return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+
+
+async def run_server(
+    transport: str = "stdio",
+    host: str = DEFAULT_HTTP_HOST,
+    port: int = DEFAULT_HTTP_PORT,
+):
+    """
+    Run the MCP server.
+    
+    Args:
+        transport: "stdio" (one client, the parent process), or "http" /
+            "sse" to serve many concurrent clients from this process
+        host: Interface to listen on (HTTP transports)
+        port: Port to listen on (HTTP transports)
+    """
+    if transport != "stdio":
+        import uvicorn
+        
+        from app.mcp_server.http_app import create_http_app
+        
+        config = uvicorn.Config(create_http_app(transport), host=host, port=port)
+        await uvicorn.Server(config).serve()
+        return
+    
     # Initialize database on startup
     init_db()
     
-    # Run the stdio server
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    # Run the stdio server, seeing other processes' writes through the
+    # event listener (Postgres events backend)
+    try:
+        async with event_listener(), stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        await get_async_engine().dispose()
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.mcp_server",
+        description="Todo MCP server.",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default="stdio",
+        help="stdio (default), http (streamable HTTP at /mcp) or sse (GET /sse)",
+    )
+    parser.add_argument("--host", default=DEFAULT_HTTP_HOST, help="Listen address for http/sse")
+    parser.add_argument("--port", type=int, default=DEFAULT_HTTP_PORT, help="Listen port for http/sse")
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv: Optional[list[str]] = None):
     """Main entry point."""
-    import asyncio
-    asyncio.run(run_server())
+    args = parse_args(argv)
+    asyncio.run(run_server(args.transport, args.host, args.port))
 
 
 if __name__ == "__main__":
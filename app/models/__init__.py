@@ -1,5 +1,5 @@
 """Models package initialization."""
 
-from app.models.task import Task, TaskStatus
+from app.models.task import Task, TaskStatus, TaskStatusCount
 
-__all__ = ["Task", "TaskStatus"]
+__all__ = ["Task", "TaskStatus", "TaskStatusCount"]
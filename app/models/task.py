@@ -3,6 +3,7 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional
+from sqlalchemy import Index, Sequence
 from sqlmodel import Field, SQLModel
 
 
@@ -17,6 +18,13 @@ class Task(SQLModel, table=True):
     """Task database model."""
     
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC (optionally per status)
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        # List ETags: COUNT(*) and MAX(updated_at), optionally per status
+        Index("ix_tasks_status_updated_at", "status", "updated_at"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=200, nullable=False, index=True)
@@ -35,3 +43,17 @@ class Task(SQLModel, table=True):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+class TaskStatusCount(SQLModel, table=True):
+    """Number of tasks per status, maintained by triggers on the tasks table."""
+    
+    __tablename__ = "task_status_counts"
+    
+    status: TaskStatus = Field(primary_key=True)
+    count: int = Field(default=0, nullable=False)
+
+
+# Ids of task change events (GET /tasks/events), shared by every process
+# publishing through Postgres NOTIFY. Created by create_all on Postgres only.
+task_event_id_seq = Sequence("task_events_id_seq", metadata=SQLModel.metadata)
@@ -1,10 +1,29 @@
 """Schemas package initialization."""
 
 from app.schemas.task import (
+    TaskBulkDelete,
+    TaskBulkUpdate,
     TaskCreate,
+    TaskFilter,
+    TaskImport,
     TaskRead,
+    TaskPage,
+    TaskSearchPage,
+    TaskStats,
     TaskUpdate,
     TaskStatusUpdate,
 )
 
-__all__ = ["TaskCreate", "TaskRead", "TaskUpdate", "TaskStatusUpdate"]
+__all__ = [
+    "TaskBulkDelete",
+    "TaskBulkUpdate",
+    "TaskCreate",
+    "TaskFilter",
+    "TaskImport",
+    "TaskRead",
+    "TaskPage",
+    "TaskSearchPage",
+    "TaskStats",
+    "TaskUpdate",
+    "TaskStatusUpdate",
+]
@@ -2,10 +2,13 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from app.models.task import TaskStatus
 
+# Most task IDs one bulk update/delete may list; larger selections use a filter
+MAX_BULK_IDS = 1000
+
 
 class TaskCreate(BaseModel):
     """Schema for creating a new task."""
@@ -24,6 +27,13 @@ class TaskCreate(BaseModel):
         }
 
 
+class TaskImport(TaskCreate):
+    """Schema for one row of a bulk import; timestamps default to import time."""
+    
+    created_at: Optional[datetime] = Field(default=None, description="Original creation time")
+    updated_at: Optional[datetime] = Field(default=None, description="Original last update time")
+
+
 class TaskRead(BaseModel):
     """Schema for reading task data."""
     
@@ -48,6 +58,30 @@ class TaskRead(BaseModel):
         }
 
 
+class TaskPage(BaseModel):
+    """Schema for a page of tasks returned by keyset pagination."""
+    
+    tasks: list[TaskRead]
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next (older) page")
+    prev_cursor: Optional[str] = Field(default=None, description="Cursor for the previous (newer) page")
+
+
+class TaskSearchPage(BaseModel):
+    """Schema for a page of search results, best match first."""
+    
+    tasks: list[TaskRead]
+    next_offset: Optional[int] = Field(default=None, description="Offset of the next page of results")
+
+
+class TaskStats(BaseModel):
+    """Schema for the number of tasks per status."""
+    
+    pending: int
+    in_progress: int
+    done: int
+    total: int
+
+
 class TaskUpdate(BaseModel):
     """Schema for updating a task."""
     
@@ -75,3 +109,46 @@ class TaskStatusUpdate(BaseModel):
                 "status": "done"
             }
         }
+
+
+class TaskFilter(BaseModel):
+    """Schema for selecting tasks by attributes in bulk operations."""
+    
+    status: Optional[TaskStatus] = Field(default=None, description="Only tasks with this status")
+    created_before: Optional[datetime] = Field(default=None, description="Only tasks created before this time")
+
+
+class TaskBulkDelete(BaseModel):
+    """Schema for deleting many tasks by id list and/or filter."""
+    
+    ids: Optional[list[int]] = Field(default=None, min_length=1, max_length=MAX_BULK_IDS, description="Task IDs")
+    filter: Optional[TaskFilter] = Field(default=None, description="Attribute filter")
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        """Refuse requests that would select the whole table."""
+        has_filter = self.filter is not None and bool(self.filter.model_dump(exclude_none=True))
+        if self.ids is None and not has_filter:
+            raise ValueError("Either 'ids' or a non-empty 'filter' is required")
+        return self
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "filter": {"status": "done", "created_before": "2026-01-01T00:00:00"}
+            }
+        }
+
+
+class TaskBulkUpdate(TaskBulkDelete):
+    """Schema for updating many tasks by id list and/or filter."""
+    
+    changes: TaskUpdate = Field(..., description="Fields to set on every selected task")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "filter": {"status": "in_progress"},
+                "changes": {"status": "done"}
+            }
+        }
@@ -1,5 +1,6 @@
 """Services package initialization."""
 
+from app.services.async_task_service import AsyncTaskService
 from app.services.task_service import TaskService
 
-__all__ = ["TaskService"]
+__all__ = ["AsyncTaskService", "TaskService"]
@@ -0,0 +1,308 @@
+"""Read caches for tasks: single tasks (pluggable backends) and versioned lists."""
+
+import importlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+from app.core.config import get_settings
+from app.models.task import Task
+
+
+class CacheStats:
+    """Thread-safe hit/miss/eviction counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def record(self, counter: str, amount: int = 1) -> None:
+        """Increment one counter."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def snapshot(self) -> dict:
+        """Return a copy of the counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+class CacheBackend(ABC):
+    """
+    Key/value store behind the task caches.
+
+    Values are plain dictionaries or bytes, so a backend shared between
+    workers (e.g. Redis) only has to serialize them. Implementations must be safe to
+    call from several threads and should return quickly: they are called
+    inline from request handlers.
+
+    Backends are assumed to be shared between processes unless they set
+    `shared = False`. A shared backend is only safe with the Postgres
+    events backend: every process then drops entries written elsewhere as
+    soon as the write's notification arrives (see get_task_cache).
+    """
+
+    shared = True
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for at most `ttl` seconds."""
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """Drop keys if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every key."""
+
+    def size(self) -> Optional[int]:
+        """Number of cached entries, if the backend can tell cheaply."""
+        return None
+
+    def describe(self) -> dict:
+        """Configuration and counters, for the metrics endpoint."""
+        return {
+            "backend": type(self).__name__,
+            "size": self.size(),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            **self.stats.snapshot(),
+        }
+
+
+class NullCache(CacheBackend):
+    """Backend that stores nothing (caching disabled)."""
+
+    shared = False
+
+    def get(self, key: str) -> Optional[Any]:
+        self.stats.record("misses")
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class LRUCache(CacheBackend):
+    """In-process LRU cache with a per-entry time to live."""
+
+    shared = False
+
+    def __init__(self, max_size: int, ttl: float):
+        super().__init__(max_size, ttl)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.record("misses")
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.record("expirations")
+                self.stats.record("misses")
+                return None
+            self._entries.move_to_end(key)
+        self.stats.record("hits")
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self.stats.record("evictions", evicted)
+
+    def delete(self, *keys: str) -> None:
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+        if removed:
+            self.stats.record("invalidations", removed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+BACKENDS = {
+    "memory": LRUCache,
+    "none": NullCache,
+}
+
+
+def load_backend(name: str) -> type[CacheBackend]:
+    """
+    Resolve a backend name.
+
+    Args:
+        name: "memory", "none", or an import path like "mypkg.cache:RedisCache"
+
+    Returns:
+        CacheBackend subclass
+
+    Raises:
+        ValueError: If the name is not a known backend or import path
+    """
+    if name in BACKENDS:
+        return BACKENDS[name]
+    module_name, _, class_name = name.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown cache backend: {name}")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@lru_cache
+def get_task_cache() -> CacheBackend:
+    """
+    Create and cache the task cache backend configured in settings.
+
+    Raises:
+        ValueError: If the backend is shared between processes but writes
+            are not announced to them (EVENTS_BACKEND is not postgres).
+            Each process's tasks version only tracks the writes it sees, so
+            a read racing a write in another process could store a stale
+            row in the shared cache that nothing would drop before the TTL.
+    """
+    from app.services.events import get_event_publisher
+
+    settings = get_settings()
+    backend = load_backend(settings.task_cache_backend)
+    if backend.shared and not get_event_publisher().listens:
+        raise ValueError(
+            f"Task cache backend {settings.task_cache_backend} is shared between processes and needs "
+            "cross-process invalidation: set EVENTS_BACKEND=postgres, or use the memory backend"
+        )
+    return backend(max_size=settings.task_cache_max_size, ttl=settings.task_cache_ttl)
+
+
+def task_key(task_id: int) -> str:
+    """Cache key of one task."""
+    return f"task:{task_id}"
+
+
+def cache_task(cache: CacheBackend, task: Task, read_version: int) -> None:
+    """
+    Store a snapshot of a task loaded from the database.
+
+    A write committed while the row was being read would otherwise be
+    undone by this store: its invalidation may already have run. Writers
+    bump the tasks version before invalidating, so the snapshot is skipped,
+    or dropped again, when the version moved since `read_version`.
+
+    Args:
+        cache: Task cache
+        task: Task as read from the database
+        read_version: get_tasks_version().value taken before the read
+    """
+    version = get_tasks_version()
+    if version.value != read_version:
+        return
+    key = task_key(task.id)
+    cache.set(key, task.model_dump())
+    if version.value != read_version:
+        cache.delete(key)
+
+
+def cached_task(cache: CacheBackend, task_id: int) -> Optional[Task]:
+    """Rebuild a task from the cache; the instance is not attached to a session."""
+    data = cache.get(task_key(task_id))
+    if data is None:
+        return None
+    return Task(**data)
+
+
+def invalidate_tasks(cache: CacheBackend, task_ids: Sequence[int]) -> None:
+    """Drop cached copies of tasks that were just written."""
+    if task_ids:
+        cache.delete(*(task_key(task_id) for task_id in task_ids))
+
+
+class VersionCounter:
+    """Monotonic counter bumped on every committed write to the tasks table."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def bump(self) -> int:
+        """Advance the version and return the new value."""
+        with self._lock:
+            self.value += 1
+            return self.value
+
+
+@lru_cache
+def get_tasks_version() -> VersionCounter:
+    """Create and cache this process's tasks table version."""
+    return VersionCounter()
+
+
+def bump_tasks_version() -> None:
+    """Mark every cached task list as stale."""
+    get_tasks_version().bump()
+
+
+@lru_cache
+def get_list_cache() -> CacheBackend:
+    """
+    Create and cache the task list cache.
+
+    Always in-process: keys embed this process's table version, which means
+    nothing to other workers. With the Postgres events backend, writes made
+    elsewhere bump the version through the event listener; otherwise the
+    TTL bounds how long they (other workers, the import CLI) can go unseen.
+    """
+    settings = get_settings()
+    if not settings.list_cache_enabled:
+        return NullCache(max_size=0, ttl=0)
+    return LRUCache(max_size=settings.list_cache_max_size, ttl=settings.list_cache_ttl)
+
+
+def list_key(version: int, *params: Any) -> str:
+    """Cache key of one list query at a table version."""
+    parts = ("" if param is None else str(param) for param in params)
+    return ":".join(["tasks", str(version), *parts])
@@ -0,0 +1,104 @@
+"""Entity tags for conditional task requests (If-None-Match / If-Match)."""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+
+# updated_at as it appears inside a task ETag
+ETAG_TIME_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+class PreconditionFailedError(Exception):
+    """An If-Match condition did not hold: the task changed since it was read."""
+
+
+def task_etag(task_id: int, updated_at: datetime) -> str:
+    """
+    Strong ETag of one task.
+
+    The tag carries the id and updated_at in the clear, so an If-Match
+    header can be turned straight into a conditional UPDATE.
+
+    Args:
+        task_id: The task ID
+        updated_at: The task's last update time
+
+    Returns:
+        Quoted entity tag
+    """
+    return f'"{task_id}-{updated_at.strftime(ETAG_TIME_FORMAT)}"'
+
+
+def list_etag(count: int, max_updated_at: Optional[datetime], *params: Any) -> str:
+    """
+    Strong ETag of one list page.
+
+    Any insert, update or delete in the filtered set changes the row count
+    or the newest updated_at.
+
+    Args:
+        count: Number of tasks matching the filter
+        max_updated_at: Newest updated_at among them
+        params: Query parameters that select the page
+
+    Returns:
+        Quoted entity tag
+    """
+    newest = max_updated_at.strftime(ETAG_TIME_FORMAT) if max_updated_at else ""
+    source = "|".join(str(part) for part in (count, newest, *params))
+    return f'"{hashlib.sha1(source.encode()).hexdigest()}"'
+
+
+def parse_etags(header: str) -> list[str]:
+    """Split an If-Match / If-None-Match header into its entity tags."""
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def etag_matches(header: Optional[str], etag: str, weak: bool = True) -> bool:
+    """
+    Check an ETag against a conditional request header.
+
+    Args:
+        header: If-None-Match or If-Match header value
+        etag: Current ETag of the resource
+        weak: Use weak comparison (If-None-Match); If-Match needs strong
+
+    Returns:
+        True if any listed tag, or "*", matches
+    """
+    if not header:
+        return False
+    for tag in parse_etags(header):
+        if tag == "*" or tag == etag:
+            return True
+        if weak and tag.startswith("W/") and tag[2:] == etag:
+            return True
+    return False
+
+
+def if_match_versions(header: str, task_id: int) -> Optional[list[datetime]]:
+    """
+    Turn an If-Match header into the updated_at values a write may replace.
+
+    Args:
+        header: If-Match header value
+        task_id: The task being written
+
+    Returns:
+        None for "*" (any current version), otherwise the updated_at values
+        of this task's tags; an empty list when none of the tags can match
+    """
+    versions = []
+    for tag in parse_etags(header):
+        if tag == "*":
+            return None
+        if tag.startswith("W/") or len(tag) < 2 or tag[0] != '"' or tag[-1] != '"':
+            continue
+        tag_id, _, stamp = tag[1:-1].partition("-")
+        if tag_id != str(task_id):
+            continue
+        try:
+            versions.append(datetime.strptime(stamp, ETAG_TIME_FORMAT))
+        except ValueError:
+            continue
+    return versions
@@ -0,0 +1,397 @@
+"""Task change feed: publishing, fan-out, replay and the Postgres listener."""
+
+import asyncio
+import itertools
+import json
+import logging
+import secrets
+import threading
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Sequence
+
+from sqlalchemy import Executable, func, make_url, select
+
+from app.core.config import get_settings
+from app.db.session import get_database_url
+from app.models.task import task_event_id_seq
+
+logger = logging.getLogger(__name__)
+
+EVENT_CHANNEL = "task_events"
+
+# Postgres caps NOTIFY payloads at 8000 bytes; bulk writes are split into
+# several events of at most this many task ids
+MAX_IDS_PER_EVENT = 500
+
+# Control events (no id, not replayed): "reset" means events may have been
+# missed and the consumer should re-list; "overflow" means the consumer fell
+# too far behind and is being disconnected (reconnect with Last-Event-ID)
+RESET = "reset"
+OVERFLOW = "overflow"
+
+
+@dataclass
+class TaskEvent:
+    """One change event: created / updated / deleted task ids, or imported rows."""
+
+    id: Optional[str]
+    type: str
+    data: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Event as sent to WebSocket consumers."""
+        return {"id": self.id, **self.data}
+
+    def to_sse(self) -> str:
+        """Event in Server-Sent Events wire format."""
+        lines = [f"id: {self.id}"] if self.id is not None else []
+        lines.append(f"event: {self.type}")
+        lines.append(f"data: {json.dumps(self.data, separators=(',', ':'))}")
+        return "\n".join(lines) + "\n\n"
+
+
+def change_events(event_type: str, task_ids: Sequence[int]) -> list[dict]:
+    """
+    Build the payloads announcing a write to some tasks.
+
+    Args:
+        event_type: "created", "updated" or "deleted"
+        task_ids: IDs of the written tasks
+
+    Returns:
+        One payload per MAX_IDS_PER_EVENT ids (none if no task was written)
+    """
+    return [
+        {"type": event_type, "ids": list(task_ids[start:start + MAX_IDS_PER_EVENT])}
+        for start in range(0, len(task_ids), MAX_IDS_PER_EVENT)
+    ]
+
+
+class Subscription:
+    """One consumer of the feed, with a bounded queue of pending events."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, replay: list[TaskEvent], max_size: int):
+        self.loop = loop
+        self.overflowed = False
+        self._replay = replay
+        self._queue: asyncio.Queue[TaskEvent] = asyncio.Queue(max_size)
+
+    def put(self, event: TaskEvent) -> None:
+        """Queue an event; must run on the subscription's event loop."""
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Never block the publisher on a slow consumer: drop its backlog
+            # and tell it to reconnect, resuming from its Last-Event-ID
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(TaskEvent(id=None, type=OVERFLOW, data={"type": OVERFLOW}))
+
+    async def events(self, heartbeat: Optional[float] = None) -> AsyncIterator[Optional[TaskEvent]]:
+        """
+        Yield replayed events, then live ones; ends after an overflow notice.
+
+        Args:
+            heartbeat: Yield None after this many idle seconds (None: never)
+        """
+        for event in self._replay:
+            yield event
+        self._replay = []
+        while True:
+            try:
+                event = await asyncio.wait_for(self._queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            yield event
+            if event.type == OVERFLOW:
+                return
+
+
+class EventBroker:
+    """
+    In-process fan-out of task events to subscribers.
+
+    Keeps the most recent events in a ring buffer so reconnecting consumers
+    can resume from their Last-Event-ID. Thread-safe: events may be
+    dispatched from worker threads as well as the event loop.
+    """
+
+    def __init__(self, buffer_size: int, queue_size: int):
+        self.queue_size = queue_size
+        self._buffer: deque[TaskEvent] = deque(maxlen=buffer_size)
+        self._subscribers: set[Subscription] = set()
+        self._lock = threading.Lock()
+        # Local event ids carry a per-process prefix, so an id from before a
+        # restart is never mistaken for a new event with the same number
+        self._epoch = secrets.token_hex(4)
+        self._counter = itertools.count(1)
+        self.published = 0
+        self.overflows = 0
+
+    def next_id(self) -> str:
+        """Allocate an event id for an event published in this process."""
+        return f"{self._epoch}-{next(self._counter)}"
+
+    def dispatch(self, event: TaskEvent) -> None:
+        """
+        Buffer an event and queue it for every subscriber.
+
+        A RESET event clears the buffer instead: events before it can no
+        longer be replayed without a gap.
+        """
+        with self._lock:
+            if event.type == RESET:
+                self._buffer.clear()
+            else:
+                self._buffer.append(event)
+                self.published += 1
+            # Overflowed subscribers get nothing more; forget them even if
+            # their consumer never comes back to unsubscribe
+            overflowed = {subscription for subscription in self._subscribers if subscription.overflowed}
+            self._subscribers -= overflowed
+            self.overflows += len(overflowed)
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:  # the subscriber's event loop is closed
+                self.unsubscribe(subscription)
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        Register a subscriber on the running event loop.
+
+        Args:
+            last_event_id: Id of the last event the consumer saw; buffered
+                events after it are replayed first. If it is no longer
+                buffered, the consumer gets a RESET event instead.
+
+        Returns:
+            The subscription (pass it to unsubscribe when done)
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            replay = []
+            if last_event_id is not None:
+                replay = self._events_after(last_event_id)
+                if replay is None:
+                    replay = [TaskEvent(id=None, type=RESET, data={"type": RESET})]
+            subscription = Subscription(loop, replay, self.queue_size)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering events to a subscriber."""
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+                if subscription.overflowed:
+                    self.overflows += 1
+
+    def stats(self) -> dict:
+        """Subscriber, buffer and overflow counts for metrics."""
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "buffered": len(self._buffer),
+                "buffer_size": self._buffer.maxlen,
+                "published": self.published,
+                "overflows": self.overflows,
+            }
+
+    def _events_after(self, last_event_id: str) -> Optional[list[TaskEvent]]:
+        """Buffered events after the given id, or None if it is not buffered."""
+        events = list(self._buffer)
+        for index in range(len(events) - 1, -1, -1):
+            if events[index].id == last_event_id:
+                return events[index + 1:]
+        return None
+
+
+@lru_cache
+def get_event_broker() -> EventBroker:
+    """Create and cache this process's event broker."""
+    settings = get_settings()
+    return EventBroker(settings.events_buffer_size, settings.events_queue_size)
+
+
+class EventPublisher:
+    """Publishes events in-process, once the write has committed (single node)."""
+
+    name = "memory"
+    listens = False
+
+    def in_transaction(self, payloads: list[dict]) -> list[Executable]:
+        """Statements to run in the write transaction, before it commits."""
+        return []
+
+    def after_commit(self, payloads: list[dict]) -> None:
+        """Publish after the write transaction has committed."""
+        broker = get_event_broker()
+        for payload in payloads:
+            broker.dispatch(TaskEvent(id=broker.next_id(), type=payload["type"], data=payload))
+
+
+class PostgresEventPublisher(EventPublisher):
+    """
+    Publishes through NOTIFY in the write transaction (multi-process).
+
+    Postgres delivers the notification only if the transaction commits, in
+    commit order, to the listener of every worker (including this one), so
+    all workers buffer the same events under the same sequence ids.
+    """
+
+    name = "postgres"
+    listens = True
+
+    def in_transaction(self, payloads: list[dict]) -> list[Executable]:
+        return [
+            select(func.pg_notify(
+                EVENT_CHANNEL,
+                func.concat(task_event_id_seq.next_value(), ":", json.dumps(payload)),
+            ))
+            for payload in payloads
+        ]
+
+    def after_commit(self, payloads: list[dict]) -> None:
+        return None
+
+
+class NullEventPublisher(EventPublisher):
+    """Publishes nothing (feed disabled)."""
+
+    name = "none"
+
+    def after_commit(self, payloads: list[dict]) -> None:
+        return None
+
+
+PUBLISHERS = {
+    "memory": EventPublisher,
+    "postgres": PostgresEventPublisher,
+    "none": NullEventPublisher,
+}
+
+
+@lru_cache
+def get_event_publisher() -> EventPublisher:
+    """
+    Create and cache the publisher selected by the EVENTS_BACKEND setting.
+
+    "auto" uses Postgres NOTIFY on a Postgres database and the in-process
+    broker otherwise.
+
+    Raises:
+        ValueError: If the setting names an unknown backend
+    """
+    name = get_settings().events_backend
+    if name == "auto":
+        name = "postgres" if get_database_url().startswith("postgresql") else "memory"
+    if name not in PUBLISHERS:
+        raise ValueError(f"Unknown events backend: {name}")
+    return PUBLISHERS[name]()
+
+
+def invalidate_caches(event: TaskEvent) -> None:
+    """
+    Drop this process's cached reads made stale by a write from any process.
+
+    Every event bumps the tasks version, so cached list pages are no longer
+    served, and drops the cached copies of the tasks it names. A RESET
+    (events may have been missed) clears the task cache instead.
+    """
+    from app.services.cache import bump_tasks_version, get_task_cache, invalidate_tasks
+
+    bump_tasks_version()
+    if event.type == RESET:
+        get_task_cache().clear()
+    else:
+        invalidate_tasks(get_task_cache(), event.data.get("ids") or [])
+
+
+def parse_notification(payload: str) -> TaskEvent:
+    """Turn a NOTIFY payload ("<id>:<json>") back into an event."""
+    event_id, _, body = payload.partition(":")
+    data = json.loads(body)
+    return TaskEvent(id=event_id, type=data["type"], data=data)
+
+
+async def listen_for_events(retry_delay: float = 1.0, max_retry_delay: float = 30.0) -> None:
+    """
+    LISTEN on the events channel and dispatch notifications until cancelled.
+
+    Uses one dedicated connection per process. Each notification also
+    invalidates this process's caches, so writes from other workers and
+    MCP servers are seen at once rather than after the cache TTLs. After
+    the connection is lost and re-established, a RESET event tells
+    consumers that events may have been missed in between; the caches are
+    cleared on every (re)connect for the same reason.
+
+    Args:
+        retry_delay: Seconds before the first reconnect attempt
+        max_retry_delay: Upper bound for the exponential reconnect backoff
+    """
+    import psycopg
+
+    conninfo = make_url(get_database_url()).set(drivername="postgresql")
+    conninfo = conninfo.render_as_string(hide_password=False)
+    broker = get_event_broker()
+    delay, connected_before = retry_delay, False
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as connection:
+                await connection.execute(f"LISTEN {EVENT_CHANNEL}")
+                # Writes made while nobody listened were missed
+                reset = TaskEvent(id=None, type=RESET, data={"type": RESET})
+                invalidate_caches(reset)
+                if connected_before:
+                    broker.dispatch(reset)
+                connected_before, delay = True, retry_delay
+                async for notification in connection.notifies():
+                    try:
+                        event = parse_notification(notification.payload)
+                        invalidate_caches(event)
+                        broker.dispatch(event)
+                    except (ValueError, KeyError):
+                        logger.warning("Ignoring malformed task event: %r", notification.payload)
+        except psycopg.Error:
+            logger.exception("Task event listener lost its connection; retrying in %.0fs", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_retry_delay)
+
+
+_listener: Optional[asyncio.Task] = None
+_listener_users = 0
+
+
+@asynccontextmanager
+async def event_listener() -> AsyncIterator[None]:
+    """
+    Run listen_for_events while the block is active, if the publisher listens.
+
+    Blocks entered together (the API lifespan, one per MCP session) share
+    a single listener, stopped when the last one exits.
+    """
+    global _listener, _listener_users
+    if not get_event_publisher().listens:
+        yield
+        return
+    _listener_users += 1
+    if _listener is None:
+        _listener = asyncio.create_task(listen_for_events())
+    try:
+        yield
+    finally:
+        _listener_users -= 1
+        if _listener_users == 0 and _listener is not None:
+            listener, _listener = _listener, None
+            listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await listener
@@ -0,0 +1,131 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, Optional, Sequence, TypeVar
+
+from sqlalchemy import tuple_
+from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.models.task import Task, TaskStatus
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class Page(Generic[T]):
+    """A single page of results plus the cursors around it."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, task_id: int) -> str:
+    """
+    Encode a task's sort key into an opaque cursor.
+
+    Args:
+        created_at: The task creation timestamp
+        task_id: The task ID (tie-breaker for equal timestamps)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([created_at.isoformat(), task_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode an opaque cursor back into its (created_at, id) sort key.
+
+    Args:
+        cursor: Cursor previously returned by encode_cursor
+
+    Returns:
+        Tuple of (created_at, task_id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, task_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(task_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def tasks_page_statement(
+    status: Optional[TaskStatus],
+    limit: int,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    columns: Sequence[Any] = (Task,),
+) -> SelectOfScalar[Task]:
+    """
+    Build the keyset query for one page of tasks, newest first.
+
+    One extra row is selected so build_tasks_page can tell whether another
+    page exists. With a `before` cursor the rows come back oldest first.
+    Pass `columns` to select plain column rows instead of Task objects; they
+    must include created_at and id for the cursors.
+
+    Raises:
+        ValueError: If both cursors are given or a cursor is invalid
+    """
+    if after and before:
+        raise ValueError("Only one of 'after' and 'before' may be given")
+
+    sort_key = tuple_(Task.created_at, Task.id)
+    statement = select(*columns)
+    if status:
+        statement = statement.where(Task.status == status)
+
+    if before:
+        # Walk backwards from the cursor; build_tasks_page flips the rows back
+        statement = statement.where(sort_key > tuple_(*decode_cursor(before)))
+        statement = statement.order_by(Task.created_at.asc(), Task.id.asc())
+    else:
+        if after:
+            statement = statement.where(sort_key < tuple_(*decode_cursor(after)))
+        statement = statement.order_by(Task.created_at.desc(), Task.id.desc())
+
+    return statement.limit(limit + 1)
+
+
+def build_tasks_page(
+    tasks: list[Task],
+    limit: int,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> Page[Task]:
+    """Turn the rows fetched by tasks_page_statement into a Page."""
+    has_more = len(tasks) > limit
+    tasks = tasks[:limit]
+
+    if before:
+        tasks.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, after is not None
+
+    page = Page(items=tasks)
+    if tasks:
+        if has_next:
+            page.next_cursor = encode_cursor(tasks[-1].created_at, tasks[-1].id)
+        if has_prev:
+            page.prev_cursor = encode_cursor(tasks[0].created_at, tasks[0].id)
+    return page
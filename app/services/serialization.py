@@ -0,0 +1,207 @@
+"""Fast JSON encoding of task rows, bypassing per-row Pydantic validation."""
+
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Sequence
+
+from sqlalchemy import Row
+
+from app.core.config import get_settings
+from app.services.pagination import Page, encode_cursor
+from app.services.task_export import EXPORT_COLUMNS, EXPORT_FIELDS
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+# TaskRead fields, in TaskRead's order (the columns of EXPORT_COLUMNS)
+TASK_FIELDS = tuple(EXPORT_FIELDS)
+
+# Column of each field, for projections; the cursor fields are always
+# selected because page cursors are built from them
+TASK_COLUMNS = dict(zip(TASK_FIELDS, EXPORT_COLUMNS))
+CURSOR_FIELDS = ("created_at", "id")
+
+# Smallest size budget accepted by encode_tasks_page_within
+MIN_MAX_BYTES = 256
+
+
+class JSONEncoder(ABC):
+    """Encodes plain Python values (dicts, lists, str, datetime, Enum) to JSON bytes."""
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON."""
+
+
+class OrjsonEncoder(JSONEncoder):
+    """orjson: native datetime/Enum support, written in Rust."""
+
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+
+def _default(value: Any) -> Any:
+    """Encode the non-JSON types found in task rows the way Pydantic does."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class StdlibEncoder(JSONEncoder):
+    """The standard library json module (always available)."""
+
+    name = "stdlib"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), default=_default
+        ).encode()
+
+
+ENCODERS = {
+    "orjson": OrjsonEncoder,
+    "stdlib": StdlibEncoder,
+}
+
+
+@lru_cache
+def get_json_encoder() -> JSONEncoder:
+    """
+    Create and cache the encoder selected by the JSON_ENCODER setting.
+
+    "auto" picks orjson when it is installed and falls back to the stdlib.
+
+    Raises:
+        ValueError: If the setting names an unknown or unavailable encoder
+    """
+    name = get_settings().json_encoder
+    if name == "auto":
+        name = "orjson" if orjson is not None else "stdlib"
+    if name not in ENCODERS:
+        raise ValueError(f"Unknown JSON encoder: {name}")
+    if name == "orjson" and orjson is None:
+        raise ValueError("JSON_ENCODER=orjson but orjson is not installed")
+    return ENCODERS[name]()
+
+
+def task_rows_to_dicts(rows: Iterable[Row]) -> list[dict]:
+    """Map rows selected with EXPORT_COLUMNS to TaskRead-shaped dictionaries."""
+    return [dict(zip(TASK_FIELDS, row)) for row in rows]
+
+
+def encode_tasks_page(page: Page[Row], encoder: Optional[JSONEncoder] = None) -> bytes:
+    """
+    Encode a page of task rows exactly as TaskPage would serialize it.
+
+    Args:
+        page: Page of rows selected with EXPORT_COLUMNS
+        encoder: Encoder to use (defaults to get_json_encoder())
+
+    Returns:
+        JSON bytes of {"tasks": [...], "next_cursor": ..., "prev_cursor": ...}
+    """
+    encoder = encoder or get_json_encoder()
+    return encoder.dumps({
+        "tasks": task_rows_to_dicts(page.items),
+        "next_cursor": page.next_cursor,
+        "prev_cursor": page.prev_cursor,
+    })
+
+
+def parse_fields(fields: Optional[Sequence[str]]) -> tuple[str, ...]:
+    """
+    Validate a field projection.
+
+    Args:
+        fields: Task fields to return, or None/empty for all of them
+
+    Returns:
+        The fields in the given order, without duplicates
+
+    Raises:
+        ValueError: If a field is unknown
+    """
+    if not fields:
+        return TASK_FIELDS
+    unknown = [name for name in fields if name not in TASK_COLUMNS]
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(map(str, unknown))}. "
+            f"Must be among: {', '.join(TASK_FIELDS)}"
+        )
+    return tuple(dict.fromkeys(fields))
+
+
+def projection_columns(fields: Sequence[str]) -> tuple:
+    """Columns to select for a projection: its fields, then the cursor fields it lacks."""
+    extra = [name for name in CURSOR_FIELDS if name not in fields]
+    return tuple(TASK_COLUMNS[name] for name in [*fields, *extra])
+
+
+def encode_tasks_page_within(
+    page: Page[Row],
+    fields: Sequence[str],
+    max_bytes: int,
+    encoder: Optional[JSONEncoder] = None,
+) -> bytes:
+    """
+    Encode a page of projected task rows as compact JSON of at most max_bytes.
+
+    If the whole page does not fit, only the leading tasks that fit are
+    kept, "truncated" is set and next_cursor points after the last kept
+    task, so the caller carries on exactly where the output stopped.
+
+    Args:
+        page: Page of rows selected with projection_columns(fields)
+        fields: Fields to output for each task
+        max_bytes: Size budget for the encoded output
+        encoder: Encoder to use (defaults to get_json_encoder())
+
+    Returns:
+        JSON bytes of {"tasks": [...], "next_cursor": ..., "prev_cursor": ..., "truncated": ...}
+
+    Raises:
+        ValueError: If not even one task fits in max_bytes
+    """
+    encoder = encoder or get_json_encoder()
+    tasks = [dict(zip(fields, row)) for row in page.items]
+
+    def envelope(next_cursor: Optional[str], truncated: bool, items: list[dict]) -> dict:
+        return {
+            "tasks": items,
+            "next_cursor": next_cursor,
+            "prev_cursor": page.prev_cursor,
+            "truncated": truncated,
+        }
+
+    encoded = encoder.dumps(envelope(page.next_cursor, False, tasks))
+    if len(encoded) <= max_bytes:
+        return encoded
+
+    # Longest prefix of tasks that fits with its separators and an envelope
+    # carrying the cursor of its last task
+    used, kept = 0, 0
+    for index, (task, row) in enumerate(zip(tasks, page.items)):
+        used += len(encoder.dumps(task)) + (1 if index else 0)
+        cursor = encode_cursor(row.created_at, row.id)
+        if used + len(encoder.dumps(envelope(cursor, True, []))) > max_bytes:
+            break
+        kept = index + 1
+    if not kept:
+        raise ValueError(
+            f"A single task does not fit in {max_bytes} bytes; request fewer fields or a larger max_bytes"
+        )
+
+    last = page.items[kept - 1]
+    return encoder.dumps(envelope(encode_cursor(last.created_at, last.id), True, tasks[:kept]))
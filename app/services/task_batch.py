@@ -0,0 +1,202 @@
+"""Multi-operation task batches, run in one transaction (see run_batch in the services)."""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from pydantic import ValidationError
+
+from app.models.task import TaskStatus
+from app.schemas.task import TaskCreate, TaskUpdate
+
+MAX_BATCH_OPERATIONS = 100
+
+# Fields each operation accepts besides "op"
+OPERATION_FIELDS = {
+    "create": {"title", "description", "status"},
+    "update": {"id", "title", "description", "status"},
+    "update_status": {"id", "status"},
+    "delete": {"id"},
+    "get": {"id"},
+}
+
+
+class BatchOperationError(Exception):
+    """An operation in a batch failed (e.g. its task does not exist)."""
+
+
+class BatchAborted(Exception):
+    """Raised inside an atomic batch to roll back everything after a failure."""
+
+
+@dataclass
+class BatchOperation:
+    """One validated operation of a batch."""
+
+    op: str
+    id: Optional[int] = None
+    create: Optional[TaskCreate] = None
+    update: Optional[TaskUpdate] = None
+    status: Optional[TaskStatus] = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one operation: the task as it was after it ran, or an error."""
+
+    index: int
+    op: str
+    task: Optional[dict] = None
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        """Result as returned by the MCP batch tools."""
+        result = {"index": self.index, "op": self.op, "ok": self.ok}
+        if self.error is not None:
+            if self.id is not None:
+                result["id"] = self.id
+            result["error"] = self.error
+        elif self.task is not None:
+            result["task"] = self.task
+        else:
+            result["id"] = self.id
+        return result
+
+
+@dataclass
+class BatchOutcome:
+    """Per-operation results of a batch and whether its writes were committed."""
+
+    committed: bool = True
+    results: list[BatchResult] = field(default_factory=list)
+
+    def roll_back(self, operations: list[BatchOperation]) -> None:
+        """
+        Report an atomic batch rolled back after the failure of its last result.
+
+        The operations that had succeeded are reported as rolled back,
+        without the task they returned (a created task never existed), and
+        the operations after the failure as not run.
+
+        Args:
+            operations: Every operation of the batch
+        """
+        failed = len(self.results) - 1
+        self.committed = False
+        self.results[:failed] = [
+            BatchResult(
+                index=result.index,
+                op=result.op,
+                id=operations[result.index].id,
+                error=f"Rolled back: operation {failed} failed",
+            )
+            for result in self.results[:failed]
+        ]
+        self.results.extend(
+            BatchResult(
+                index=index,
+                op=operations[index].op,
+                id=operations[index].id,
+                error=f"Not run: operation {failed} failed",
+            )
+            for index in range(failed + 1, len(operations))
+        )
+
+    def to_dict(self) -> dict:
+        """Outcome as returned by the MCP batch tools."""
+        return {
+            "committed": self.committed,
+            "succeeded": sum(result.ok for result in self.results),
+            "failed": sum(not result.ok for result in self.results),
+            "results": [result.to_dict() for result in self.results],
+        }
+
+
+def _validation_message(error: ValidationError) -> str:
+    """First problem reported by pydantic, as "field: message"."""
+    detail = error.errors()[0]
+    location = ".".join(str(part) for part in detail["loc"])
+    return f"{location}: {detail['msg']}" if location else detail["msg"]
+
+
+def _parse_status(value: Any) -> TaskStatus:
+    try:
+        return TaskStatus(str(value).lower())
+    except ValueError:
+        raise ValueError(
+            f"Invalid status: {value}. Must be one of: pending, in_progress, done"
+        ) from None
+
+
+def _parse_operation(item: Any) -> BatchOperation:
+    """Validate one raw operation; see parse_batch_operations."""
+    if not isinstance(item, dict):
+        raise ValueError("must be an object")
+    op = item.get("op")
+    if op not in OPERATION_FIELDS:
+        raise ValueError(f"unknown op {op!r}. Must be one of: {', '.join(OPERATION_FIELDS)}")
+    fields = {key: value for key, value in item.items() if key != "op"}
+    unknown = set(fields) - OPERATION_FIELDS[op]
+    if unknown:
+        raise ValueError(f"unexpected field(s) for {op}: {', '.join(sorted(unknown))}")
+
+    operation = BatchOperation(op=op)
+    if op != "create":
+        task_id = fields.pop("id", None)
+        if isinstance(task_id, bool) or not isinstance(task_id, int):
+            raise ValueError(f"{op} requires an integer id")
+        operation.id = task_id
+    if fields.get("status") is not None:
+        fields["status"] = _parse_status(fields["status"])
+
+    try:
+        if op == "create":
+            operation.create = TaskCreate(**fields)
+        elif op == "update":
+            values = {key: value for key, value in fields.items() if value is not None}
+            if not values:
+                raise ValueError("update requires at least one of title, description, status")
+            operation.update = TaskUpdate(**values)
+        elif op == "update_status":
+            if fields.get("status") is None:
+                raise ValueError("update_status requires a status")
+            operation.status = fields["status"]
+    except ValidationError as e:
+        raise ValueError(_validation_message(e)) from None
+    return operation
+
+
+def parse_batch_operations(items: Any) -> list[BatchOperation]:
+    """
+    Validate a batch before any of it runs.
+
+    Each item is an object with an "op" (create, update, update_status,
+    delete or get) and that operation's fields: create takes title,
+    description and status; update takes id plus any of title, description
+    and status; update_status takes id and status; delete and get take id.
+
+    Args:
+        items: Raw operations, in the order to run them
+
+    Returns:
+        Validated operations
+
+    Raises:
+        ValueError: If the batch is empty, too long or any operation is invalid
+    """
+    if not isinstance(items, list) or not items:
+        raise ValueError("operations must be a non-empty list")
+    if len(items) > MAX_BATCH_OPERATIONS:
+        raise ValueError(f"A batch can contain at most {MAX_BATCH_OPERATIONS} operations")
+
+    operations = []
+    for index, item in enumerate(items):
+        try:
+            operations.append(_parse_operation(item))
+        except ValueError as e:
+            raise ValueError(f"Operation {index}: {e}") from None
+    return operations
@@ -0,0 +1,74 @@
+"""Row encoders for streaming task exports (NDJSON and CSV)."""
+
+import csv
+import io
+import json
+from typing import Iterable, Literal
+
+from sqlalchemy import Row
+
+from app.models.task import Task
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# Rows fetched from the server-side cursor per round trip
+EXPORT_BATCH_SIZE = 1000
+
+# Columns selected for exports, in output order (same fields as TaskRead)
+EXPORT_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.created_at,
+    Task.updated_at,
+)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _plain_values(row: Row) -> list:
+    """Convert a row into JSON/CSV friendly values."""
+    task_id, title, description, status, created_at, updated_at = row
+    return [
+        task_id,
+        title,
+        description,
+        status.value,
+        created_at.isoformat(),
+        updated_at.isoformat(),
+    ]
+
+
+def csv_header() -> str:
+    """Return the CSV header line."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_FIELDS)
+    return buffer.getvalue()
+
+
+def encode_rows(rows: Iterable[Row], export_format: ExportFormat) -> str:
+    """
+    Encode a batch of export rows.
+
+    Args:
+        rows: Rows selected with EXPORT_COLUMNS
+        export_format: "ndjson" or "csv"
+
+    Returns:
+        Encoded text for the batch, one line per row
+    """
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(_plain_values(row) for row in rows)
+        return buffer.getvalue()
+
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, _plain_values(row))), ensure_ascii=False) + "\n"
+        for row in rows
+    )
@@ -0,0 +1,34 @@
+"""Reusable WHERE criteria for set-based task queries."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import ColumnElement
+
+from app.models.task import Task, TaskStatus
+
+
+def task_filter_criteria(
+    ids: Optional[list[int]] = None,
+    status: Optional[TaskStatus] = None,
+    created_before: Optional[datetime] = None,
+) -> list[ColumnElement[bool]]:
+    """
+    Build WHERE criteria selecting tasks by id list and/or filter.
+
+    Args:
+        ids: Only tasks with these IDs
+        status: Only tasks with this status
+        created_before: Only tasks created before this time
+
+    Returns:
+        List of criteria to AND together (empty when nothing was given)
+    """
+    criteria = []
+    if ids is not None:
+        criteria.append(Task.id.in_(ids))
+    if status is not None:
+        criteria.append(Task.status == status)
+    if created_before is not None:
+        criteria.append(Task.created_at < created_before)
+    return criteria
@@ -0,0 +1,280 @@
+"""Bulk task import from NDJSON or CSV (COPY on Postgres, executemany elsewhere)."""
+
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator, Literal, Optional, TextIO
+
+import anyio.from_thread
+from pydantic import ValidationError
+from sqlalchemy import Connection, Engine, insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import get_settings
+from app.db.session import get_engine
+from app.models.task import Task
+from app.services.cache import bump_tasks_version
+from app.services.events import get_event_publisher
+from app.schemas.task import TaskImport
+
+ImportFormat = Literal["ndjson", "csv"]
+
+# Columns written for every imported row, in COPY order
+IMPORT_FIELDS = ("title", "description", "status", "created_at", "updated_at")
+
+# A parsed input record: (line number, record, parse error)
+ParsedRecord = tuple[int, Optional[dict], Optional[str]]
+
+
+@dataclass
+class ImportReport:
+    """Outcome of an import: loaded row count and the rejected rows."""
+
+    imported: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+    max_errors: int = 100
+
+    def add_error(self, line: int, message: str, rows: int = 1) -> None:
+        """Count rejected rows and keep the first max_errors messages."""
+        self.failed += rows
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "error": message})
+
+    def to_dict(self) -> dict:
+        """Convert the report to a dictionary."""
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+def iter_ndjson_records(lines: Iterable[str]) -> Iterator[ParsedRecord]:
+    """Parse NDJSON one line at a time, skipping blank lines."""
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line), None
+        except json.JSONDecodeError as e:
+            yield line_no, None, f"Invalid JSON: {e.msg}"
+
+
+def iter_csv_records(lines: Iterable[str]) -> Iterator[ParsedRecord]:
+    """
+    Parse CSV with a header row one record at a time.
+
+    Empty cells are dropped so schema defaults apply. Unknown columns (such
+    as `id` in an export file) are ignored.
+
+    Raises:
+        ValueError: If the header has no title column
+    """
+    reader = csv.DictReader(lines)
+    if not reader.fieldnames or "title" not in reader.fieldnames:
+        raise ValueError("CSV header must include a title column")
+
+    for record in reader:
+        if None in record:
+            yield reader.line_num, None, "Row has more cells than the header"
+            continue
+        yield reader.line_num, {key: value for key, value in record.items() if value}, None
+
+
+def iter_records(lines: Iterable[str], import_format: ImportFormat) -> Iterator[ParsedRecord]:
+    """Parse input lines in the given format."""
+    if import_format == "csv":
+        return iter_csv_records(lines)
+    return iter_ndjson_records(lines)
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Store timestamps as naive UTC, like the rest of the service."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Flatten a pydantic error into one line."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def validate_records(
+    records: Iterable[ParsedRecord], report: ImportReport
+) -> list[tuple[int, dict]]:
+    """
+    Validate parsed records against TaskImport (TaskCreate plus timestamps).
+
+    Args:
+        records: Parsed records
+        report: Report that collects rejected rows
+
+    Returns:
+        (line number, column values) for every valid row
+    """
+    now = datetime.utcnow()
+    rows = []
+    for line_no, record, parse_error in records:
+        if parse_error:
+            report.add_error(line_no, parse_error)
+            continue
+        try:
+            task = TaskImport.model_validate(record)
+        except ValidationError as e:
+            report.add_error(line_no, _format_validation_error(e))
+            continue
+
+        created_at = _naive_utc(task.created_at) or now
+        rows.append((line_no, {
+            "title": task.title,
+            "description": task.description,
+            "status": task.status,
+            "created_at": created_at,
+            "updated_at": _naive_utc(task.updated_at) or created_at,
+        }))
+    return rows
+
+
+def _copy_rows(connection: Connection, rows: list[dict]) -> None:
+    """Stream rows into the tasks table with psycopg's COPY FROM STDIN."""
+    columns = ", ".join(IMPORT_FIELDS)
+    driver_connection = connection.connection.driver_connection
+    with driver_connection.cursor() as cursor:
+        with cursor.copy(f"COPY {Task.__tablename__} ({columns}) FROM STDIN") as copy:
+            for row in rows:
+                # The status column is a Postgres enum of the member names
+                copy.write_row((
+                    row["title"],
+                    row["description"],
+                    row["status"].name,
+                    row["created_at"],
+                    row["updated_at"],
+                ))
+
+
+def load_rows(connection: Connection, rows: list[dict]) -> None:
+    """
+    Insert validated rows inside the connection's current transaction.
+
+    Uses COPY on Postgres and a single executemany INSERT elsewhere.
+
+    Args:
+        connection: Connection with an open transaction
+        rows: Column values from validate_records
+    """
+    if connection.dialect.name == "postgresql":
+        _copy_rows(connection, rows)
+    else:
+        connection.execute(insert(Task), rows)
+
+
+def import_tasks(
+    lines: Iterable[str],
+    import_format: ImportFormat,
+    engine: Optional[Engine] = None,
+    chunk_size: Optional[int] = None,
+    max_errors: Optional[int] = None,
+) -> ImportReport:
+    """
+    Import tasks from NDJSON or CSV text, one chunk per transaction.
+
+    Input is parsed lazily, so memory is bounded by chunk_size rather than
+    the file size. Invalid rows are reported and skipped; if the database
+    rejects a chunk, only that chunk is rolled back and reported.
+
+    Args:
+        lines: Input text, e.g. an open file
+        import_format: "ndjson" or "csv"
+        engine: Sync engine to load into (defaults to the app engine)
+        chunk_size: Rows validated and loaded per transaction
+        max_errors: Maximum number of error messages kept in the report
+
+    Returns:
+        Import report
+
+    Raises:
+        ValueError: If the input cannot be parsed at all (bad CSV header, not UTF-8)
+    """
+    settings = get_settings()
+    engine = engine or get_engine()
+    chunk_size = chunk_size or settings.import_chunk_size
+    report = ImportReport(max_errors=max_errors or settings.import_max_reported_errors)
+    db_errors = (SQLAlchemyError, engine.dialect.loaded_dbapi.Error)
+
+    publisher = get_event_publisher()
+    records = iter_records(lines, import_format)
+    while chunk := list(islice(records, chunk_size)):
+        rows = validate_records(chunk, report)
+        if not rows:
+            continue
+        # COPY does not return ids, so the change feed gets a row count
+        payloads = [{"type": "imported", "count": len(rows)}]
+        try:
+            with engine.begin() as connection:
+                load_rows(connection, [values for _, values in rows])
+                for statement in publisher.in_transaction(payloads):
+                    connection.execute(statement)
+        except db_errors as e:
+            first_line, last_line = rows[0][0], rows[-1][0]
+            report.add_error(
+                first_line,
+                f"Lines {first_line}-{last_line} were not imported: {e}",
+                rows=len(rows),
+            )
+        else:
+            report.imported += len(rows)
+            bump_tasks_version()
+            publisher.after_commit(payloads)
+    return report
+
+
+class _AsyncChunkReader(io.RawIOBase):
+    """Blocking reader over an async byte stream, for use in a worker thread."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self._pending = b""
+        self._done = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending and not self._done:
+            chunk = anyio.from_thread.run(anext, self._chunks, None)
+            if chunk is None:
+                self._done = True
+            else:
+                self._pending = chunk
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def open_async_upload(chunks: AsyncIterator[bytes]) -> TextIO:
+    """
+    Wrap an async byte stream (e.g. request.stream()) as a UTF-8 text file.
+
+    Reads block the calling worker thread until the event loop delivers the
+    next chunk, so an upload is parsed while it is still arriving and is read
+    no faster than it can be loaded.
+
+    Args:
+        chunks: Async iterator of raw body chunks
+
+    Returns:
+        Text stream to pass to import_tasks from a worker thread
+    """
+    raw = io.BufferedReader(_AsyncChunkReader(chunks))
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
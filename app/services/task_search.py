@@ -0,0 +1,116 @@
+"""Ranked full-text / fuzzy task search (see app/db/search.py for the indexes)."""
+
+from dataclasses import dataclass, field
+from typing import Generic, Optional, TypeVar
+
+from sqlalchemy import ColumnElement, column, func, literal, literal_column, or_, table
+from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from app.core.text import normalize_text, search_terms
+from app.db.search import SEARCH_TEXT, SEARCH_VECTOR
+from app.models.task import Task, TaskStatus
+
+T = TypeVar("T")
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_QUERY_LENGTH = 200
+
+_tasks_fts = table("tasks_fts", column("rowid"))
+
+
+@dataclass
+class SearchPage(Generic[T]):
+    """One page of search results, best match first."""
+
+    items: list[T] = field(default_factory=list)
+    next_offset: Optional[int] = None
+
+
+def _postgres_search(query: str, terms: list[str]) -> tuple[ColumnElement, ColumnElement]:
+    """Match and ranking expressions over the indexed search expressions."""
+    search_vector = literal_column(SEARCH_VECTOR)
+    search_text = literal_column(SEARCH_TEXT)
+    normalized = normalize_text(query)
+
+    # Every term as a prefix ('simple' config, like the indexed vector)
+    tsquery = func.to_tsquery(
+        literal_column("'simple'::regconfig"), " & ".join(f"{term}:*" for term in terms)
+    )
+    # `<%` is word_similarity() above pg_trgm.word_similarity_threshold,
+    # answered from the trigram index; it catches misspelled words
+    match = or_(search_vector.op("@@")(tsquery), literal(normalized).op("<%")(search_text))
+    rank = func.ts_rank(search_vector, tsquery) + func.word_similarity(normalized, search_text)
+    return match, rank.desc()
+
+
+def _sqlite_search(terms: list[str]) -> tuple[ColumnElement, ColumnElement]:
+    """MATCH and bm25 ranking expressions over the FTS5 table."""
+    fts = literal_column("tasks_fts")
+    # Quoted so FTS5 syntax characters are taken literally; `*` = prefix
+    expression = " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+    # bm25() is lower-is-better; weight title matches 10x description matches
+    return fts.op("MATCH")(expression), func.bm25(fts, 10.0, 1.0)
+
+
+def search_statement(
+    dialect: str,
+    query: str,
+    status: Optional[TaskStatus] = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    offset: int = 0,
+) -> Optional[SelectOfScalar[Task]]:
+    """
+    Build the ranked search query for a dialect.
+
+    Fetches one row more than `limit` so build_search_page can tell whether
+    another page follows.
+
+    Args:
+        dialect: Database dialect name (postgresql or sqlite)
+        query: Search text; Persian/Arabic variants are normalized
+        status: Optional filter by task status
+        limit: Maximum number of tasks to return
+        offset: Number of ranked results to skip
+
+    Returns:
+        Select statement, or None if the query contains no searchable words
+
+    Raises:
+        ValueError: If the dialect has no search support
+    """
+    terms = search_terms(query)
+    if not terms:
+        return None
+
+    statement = select(Task)
+    if dialect == "postgresql":
+        match, order = _postgres_search(query, terms)
+    elif dialect == "sqlite":
+        match, order = _sqlite_search(terms)
+        statement = statement.join(_tasks_fts, _tasks_fts.c.rowid == Task.id)
+    else:
+        raise ValueError(f"Search is not supported on {dialect}")
+
+    statement = statement.where(match)
+    if status:
+        statement = statement.where(Task.status == status)
+    return statement.order_by(order, Task.id.desc()).offset(offset).limit(limit + 1)
+
+
+def build_search_page(items: list[T], limit: int, offset: int) -> SearchPage[T]:
+    """
+    Trim the extra row fetched by search_statement and set next_offset.
+
+    Args:
+        items: Rows returned by the query (up to limit + 1)
+        limit: Requested page size
+        offset: Requested offset
+
+    Returns:
+        Page of at most `limit` items
+    """
+    if len(items) > limit:
+        return SearchPage(items=items[:limit], next_offset=offset + limit)
+    return SearchPage(items=items)
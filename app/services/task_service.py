@@ -1,19 +1,64 @@
 """Task service layer for business logic."""
 
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterator, Optional, Sequence
+from sqlalchemy import Row, delete, func, insert, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select
 
-from app.models.task import Task, TaskStatus
+from app.models.task import Task, TaskStatus, TaskStatusCount
 from app.schemas.task import TaskCreate, TaskUpdate
+from app.services.cache import (
+    CacheBackend,
+    bump_tasks_version,
+    cache_task,
+    cached_task,
+    get_task_cache,
+    get_tasks_version,
+    invalidate_tasks,
+)
+from app.services.etags import PreconditionFailedError
+from app.services.events import EventPublisher, change_events, get_event_publisher
+from app.services.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    build_tasks_page,
+    tasks_page_statement,
+)
+from app.services.task_export import EXPORT_BATCH_SIZE, EXPORT_COLUMNS
+from app.services.task_filters import task_filter_criteria
+from app.services.task_batch import (
+    BatchAborted,
+    BatchOperation,
+    BatchOperationError,
+    BatchOutcome,
+    BatchResult,
+)
+from app.services.task_search import (
+    DEFAULT_SEARCH_LIMIT,
+    SearchPage,
+    build_search_page,
+    search_statement,
+)
+from app.services.task_stats import build_task_stats
 
 
 class TaskService:
     """Service class for task operations."""
     
-    def __init__(self, session: Session):
-        """Initialize service with database session."""
+    def __init__(
+        self,
+        session: Session,
+        cache: Optional[CacheBackend] = None,
+        events: Optional[EventPublisher] = None,
+    ):
+        """Initialize service with database session, task cache and event publisher."""
         self.session = session
+        self.cache = cache if cache is not None else get_task_cache()
+        self.events = events if events is not None else get_event_publisher()
+        # Writes deferred by an open transaction() block: (event type, task ids)
+        self._pending: Optional[list[tuple[str, Sequence[int]]]] = None
     
     def get_all_tasks(self, status: Optional[TaskStatus] = None) -> list[Task]:
         """
@@ -33,9 +78,104 @@ class TaskService:
         results = self.session.exec(statement)
         return list(results.all())
     
+    def get_tasks_page(
+        self,
+        status: Optional[TaskStatus] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> Page[Task]:
+        """
+        Get one page of tasks using keyset pagination.
+        
+        Tasks are ordered newest first by (created_at, id), which is served
+        by the composite (status, created_at, id) index, so the cost of a
+        page does not depend on how deep into the list it is.
+        
+        Args:
+            status: Optional filter by task status
+            limit: Maximum number of tasks to return
+            after: Cursor of the last task on the previous page
+            before: Cursor of the first task on the next page
+            
+        Returns:
+            Page of tasks with cursors for the neighbouring pages
+            
+        Raises:
+            ValueError: If both cursors are given or a cursor is invalid
+        """
+        statement = tasks_page_statement(status, limit, after, before)
+        tasks = list(self.session.exec(statement).all())
+        return build_tasks_page(tasks, limit, after, before)
+        
+    def get_tasks_page_rows(
+        self,
+        status: Optional[TaskStatus] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        columns: Sequence[Any] = EXPORT_COLUMNS,
+    ) -> Page[Row]:
+        """
+        Get one page of tasks as plain column rows (EXPORT_COLUMNS by default).
+        
+        Same query and cursors as get_tasks_page, but without building ORM
+        objects, for responses that encode rows directly. Columns left out
+        of `columns` are never read from the database.
+        
+        Args:
+            status: Optional filter by task status
+            limit: Maximum number of tasks to return
+            after: Cursor of the last task on the previous page
+            before: Cursor of the first task on the next page
+            columns: Columns to select; must include Task.created_at and Task.id
+            
+        Returns:
+            Page of rows with cursors for the neighbouring pages
+            
+        Raises:
+            ValueError: If both cursors are given or a cursor is invalid
+        """
+        statement = tasks_page_statement(status, limit, after, before, columns=columns)
+        rows = list(self.session.exec(statement).all())
+        return build_tasks_page(rows, limit, after, before)
+
+    def stream_tasks(
+        self,
+        status: Optional[TaskStatus] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[Sequence[Row]]:
+        """
+        Stream all tasks in batches through a server-side cursor.
+        
+        Only plain column rows (EXPORT_COLUMNS) are fetched, so memory stays
+        bounded by batch_size no matter how large the table is.
+        
+        Args:
+            status: Optional filter by task status
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            Batches of rows, newest task first
+        """
+        statement = select(*EXPORT_COLUMNS)
+        if status:
+            statement = statement.where(Task.status == status)
+        statement = statement.order_by(Task.created_at.desc(), Task.id.desc())
+        
+        result = self.session.exec(
+            statement.execution_options(yield_per=batch_size)
+        )
+        yield from result.partitions()
+    
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
-        Get a single task by ID.
+        Get a single task by ID, through the read cache.
+        
+        Only found tasks are cached; every write path drops the tasks it
+        touched after committing, and entries expire after the cache TTL.
+        Inside a transaction() block the cache is bypassed, since the block
+        may have written the task without committing yet.
         
         Args:
             task_id: The task ID
@@ -43,10 +183,102 @@ class TaskService:
         Returns:
             Task if found, None otherwise
         """
+        use_cache = self._pending is None
+        task = cached_task(self.cache, task_id) if use_cache else None
+        if task is not None:
+            return task
+        
+        read_version = get_tasks_version().value
         statement = select(Task).where(Task.id == task_id)
         result = self.session.exec(statement)
-        return result.first()
-    
+        task = result.first()
+        if task is not None and use_cache:
+            cache_task(self.cache, task, read_version)
+        return task
+        
+    def get_task_updated_at(self, task_id: int) -> Optional[datetime]:
+        """
+        Get only the last update time of a task, for ETag checks.
+        
+        Served from the read cache when possible, otherwise a single-column
+        SELECT, so no full row is loaded.
+        
+        Args:
+            task_id: The task ID
+            
+        Returns:
+            updated_at if the task exists, None otherwise
+        """
+        task = cached_task(self.cache, task_id)
+        if task is not None:
+            return task.updated_at
+            
+        statement = select(Task.updated_at).where(Task.id == task_id)
+        return self.session.exec(statement).first()
+        
+    def get_tasks_fingerprint(
+        self, status: Optional[TaskStatus] = None
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        Summarize the filtered task set for list ETags.
+        
+        Args:
+            status: Optional filter by task status
+            
+        Returns:
+            (number of tasks, newest updated_at)
+        """
+        statement = select(func.count(), func.max(Task.updated_at)).select_from(Task)
+        if status:
+            statement = statement.where(Task.status == status)
+        count, max_updated_at = self.session.exec(statement).one()
+        return count, max_updated_at
+        
+    def search_tasks(
+        self,
+        query: str,
+        status: Optional[TaskStatus] = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> SearchPage[Task]:
+        """
+        Search task titles and descriptions, best match first.
+        
+        Uses the full-text (and on Postgres trigram) indexes; Persian and
+        Arabic character variants in the query are normalized.
+        
+        Args:
+            query: Search text
+            status: Optional filter by task status
+            limit: Maximum number of tasks to return
+            offset: Number of ranked results to skip
+            
+        Returns:
+            Page of matching tasks with the offset of the next page
+            
+        Raises:
+            ValueError: If the database has no search support
+        """
+        dialect = self.session.get_bind().dialect.name
+        statement = search_statement(dialect, query, status, limit, offset)
+        if statement is None:
+            return SearchPage()
+        tasks = list(self.session.exec(statement).all())
+        return build_search_page(tasks, limit, offset)
+        
+    def get_task_stats(self) -> dict:
+        """
+        Get the number of tasks per status and in total.
+        
+        Reads the few rows of task_status_counts, which triggers keep up to
+        date on every write, instead of counting the tasks table.
+        
+        Returns:
+            Dictionary with pending, in_progress, done and total counts
+        """
+        statement = select(TaskStatusCount.status, TaskStatusCount.count)
+        return build_task_stats(self.session.exec(statement).all())
+
     def create_task(self, task_data: TaskCreate) -> Task:
         """
         Create a new task.
@@ -58,83 +290,401 @@ class TaskService:
             Created task
         """
         now = datetime.utcnow()
-        task = Task(
+        statement = insert(Task).values(
             title=task_data.title,
             description=task_data.description,
             status=task_data.status,
             created_at=now,
             updated_at=now,
-        )
-        self.session.add(task)
-        self.session.commit()
-        self.session.refresh(task)
+        ).returning(Task)
+        task = self.session.scalars(statement).one()
+        self._commit("created", [task.id])
         return task
     
-    def update_task(self, task_id: int, task_data: TaskUpdate) -> Optional[Task]:
+    def create_tasks(self, tasks_data: list[TaskCreate]) -> list[Task]:
+        """
+        Create many tasks in a single transaction.
+        
+        Rows are sent as one multi-row INSERT ... RETURNING (batched by the
+        driver for very large lists) instead of an add/commit/refresh
+        round trip per task.
+        
+        Args:
+            tasks_data: Task creation data, in the order to insert
+            
+        Returns:
+            Created tasks, in the same order as tasks_data
+        """
+        if not tasks_data:
+            return []
+        
+        now = datetime.utcnow()
+        rows = [
+            {
+                "title": task_data.title,
+                "description": task_data.description,
+                "status": task_data.status,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for task_data in tasks_data
+        ]
+        statement = insert(Task).returning(Task, sort_by_parameter_order=True)
+        tasks = list(self.session.scalars(statement, rows).all())
+        self._commit("created", [task.id for task in tasks])
+        return tasks
+    
+    def update_task(
+        self,
+        task_id: int,
+        task_data: TaskUpdate,
+        if_updated_at: Optional[list[datetime]] = None,
+    ) -> Optional[Task]:
         """
         Update an existing task.
         
         Args:
             task_id: The task ID
             task_data: Task update data
+            if_updated_at: Only update if updated_at is one of these (If-Match)
             
         Returns:
             Updated task if found, None otherwise
+            
+        Raises:
+            PreconditionFailedError: If the task exists but if_updated_at does not match
         """
-        task = self.get_task_by_id(task_id)
-        if not task:
-            return None
-        
-        # Update fields that are provided
-        update_data = task_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(task, key, value)
-        
-        # Always update updated_at timestamp
-        task.updated_at = datetime.utcnow()
-        
-        self.session.add(task)
-        self.session.commit()
-        self.session.refresh(task)
-        return task
-    
-    def update_task_status(self, task_id: int, status: TaskStatus) -> Optional[Task]:
+        # Update fields that are provided, always bumping updated_at
+        values = task_data.model_dump(exclude_unset=True)
+        values["updated_at"] = datetime.utcnow()
+        return self._update_returning(task_id, values, if_updated_at)
+
+    def update_task_status(
+        self,
+        task_id: int,
+        status: TaskStatus,
+        if_updated_at: Optional[list[datetime]] = None,
+    ) -> Optional[Task]:
         """
         Update only the status of a task.
         
         Args:
             task_id: The task ID
             status: New task status
+            if_updated_at: Only update if updated_at is one of these (If-Match)
             
         Returns:
             Updated task if found, None otherwise
+            
+        Raises:
+            PreconditionFailedError: If the task exists but if_updated_at does not match
         """
-        task = self.get_task_by_id(task_id)
-        if not task:
-            return None
+        values = {"status": status, "updated_at": datetime.utcnow()}
+        return self._update_returning(task_id, values, if_updated_at)
+
+    def delete_task(
+        self, task_id: int, if_updated_at: Optional[list[datetime]] = None
+    ) -> bool:
+        """
+        Delete a task by ID.
+        
+        Args:
+            task_id: The task ID
+            if_updated_at: Only delete if updated_at is one of these (If-Match)
+            
+        Returns:
+            True if deleted, False if not found
+            
+        Raises:
+            PreconditionFailedError: If the task exists but if_updated_at does not match
+        """
+        statement = delete(Task).where(Task.id == task_id)
+        if if_updated_at is not None:
+            statement = statement.where(Task.updated_at.in_(if_updated_at))
+        deleted_id = (self.session.scalars(statement.returning(Task.id))).one_or_none()
+        self._commit("deleted", [deleted_id] if deleted_id is not None else [])
+        if deleted_id is None:
+            if if_updated_at is not None:
+                self._check_precondition(task_id)
+            return False
+        return True
+
+    def update_tasks(
+        self,
+        task_data: TaskUpdate,
+        ids: Optional[list[int]] = None,
+        status: Optional[TaskStatus] = None,
+        created_before: Optional[datetime] = None,
+    ) -> list[int]:
+        """
+        Update every task matching an id list and/or filter in one statement.
+            
+        Runs a single UPDATE ... WHERE ... RETURNING id instead of a
+        read-modify-write round trip per task.
+            
+        Args:
+            task_data: Fields to set on every matching task
+            ids: Only tasks with these IDs
+            status: Only tasks with this status
+            created_before: Only tasks created before this time
+                
+        Returns:
+            IDs of the updated tasks
+                
+        Raises:
+            ValueError: If no selection criteria or no fields are given
+        """
+        criteria = task_filter_criteria(ids, status, created_before)
+        if not criteria:
+            raise ValueError("Either ids or a filter is required")
+            
+        values = task_data.model_dump(exclude_unset=True)
+        if not values:
+            raise ValueError("No fields to update")
+        values["updated_at"] = datetime.utcnow()
+            
+        statement = update(Task).where(*criteria).values(**values).returning(Task.id)
+        updated_ids = list(self.session.scalars(statement).all())
+        self._commit("updated", updated_ids)
+        return updated_ids
+        
+    def delete_tasks(
+        self,
+        ids: Optional[list[int]] = None,
+        status: Optional[TaskStatus] = None,
+        created_before: Optional[datetime] = None,
+    ) -> list[int]:
+        """
+        Delete every task matching an id list and/or filter in one statement.
+            
+        Args:
+            ids: Only tasks with these IDs
+            status: Only tasks with this status
+            created_before: Only tasks created before this time
+                
+        Returns:
+            IDs of the deleted tasks
+                
+        Raises:
+            ValueError: If no selection criteria are given
+        """
+        criteria = task_filter_criteria(ids, status, created_before)
+        if not criteria:
+            raise ValueError("Either ids or a filter is required")
+            
+        statement = delete(Task).where(*criteria).returning(Task.id)
+        deleted_ids = list(self.session.scalars(statement).all())
+        self._commit("deleted", deleted_ids)
+        return deleted_ids
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group several writes into one transaction and one commit.
+        
+        Writes made by this service inside the block are committed together
+        when it exits, announced by one change event per run of writes of
+        the same type, and invalidated from the caches once. If the block
+        raises, all of them are rolled back. Blocks cannot be nested.
         
-        task.status = status
-        task.updated_at = datetime.utcnow()
+        Raises:
+            RuntimeError: If a transaction() block is already open
+        """
+        if self._pending is not None:
+            raise RuntimeError("transaction() blocks cannot be nested")
+        self._pending = []
+        try:
+            yield
+        except BaseException:
+            self._pending = None
+            self.session.rollback()
+            raise
         
-        self.session.add(task)
+        pending, self._pending = self._pending, None
+        writes: list[tuple[str, list[int]]] = []
+        for event_type, task_ids in pending:
+            if writes and writes[-1][0] == event_type:
+                writes[-1][1].extend(task_ids)
+            else:
+                writes.append((event_type, list(task_ids)))
+        payloads = [
+            payload
+            for event_type, task_ids in writes
+            for payload in change_events(event_type, task_ids)
+        ]
+        for statement in self.events.in_transaction(payloads):
+            self.session.exec(statement)
         self.session.commit()
-        self.session.refresh(task)
-        return task
+        self._after_write([task_id for _, task_ids in writes for task_id in task_ids])
+        self.events.after_commit(payloads)
     
-    def delete_task(self, task_id: int) -> bool:
+    def run_batch(self, operations: list[BatchOperation], atomic: bool = True) -> BatchOutcome:
         """
-        Delete a task by ID.
+        Run several operations in order, in one transaction on this session.
+        
+        Args:
+            operations: Validated operations (see parse_batch_operations)
+            atomic: If True, the first failure rolls back the whole batch,
+                the remaining operations are not run and every result is
+                reported as failed (see BatchOutcome.roll_back). If False, each
+                operation runs in a savepoint: a failed one is undone alone
+                and the others still run and commit.
+        
+        Returns:
+            Per-operation results and whether the batch was committed
+        """
+        outcome = BatchOutcome()
+        try:
+            with self.transaction():
+                for index, operation in enumerate(operations):
+                    result = self._run_batch_operation(index, operation, savepoint=not atomic)
+                    outcome.results.append(result)
+                    if atomic and not result.ok:
+                        raise BatchAborted(result.error)
+        except BatchAborted:
+            outcome.roll_back(operations)
+        return outcome
+    
+    def _update_returning(
+        self,
+        task_id: int,
+        values: dict,
+        if_updated_at: Optional[list[datetime]] = None,
+    ) -> Optional[Task]:
+        """
+        Apply values to one task with a single UPDATE ... RETURNING.
+        
+        Not-found is detected from the empty result, so no SELECT is needed
+        before the write and no refresh after it. An If-Match condition is
+        part of the same WHERE clause; only when it fails is the task looked
+        up again, to tell a stale version from a missing task.
         
         Args:
             task_id: The task ID
+            values: Column values to set
+            if_updated_at: Only update if updated_at is one of these
             
         Returns:
-            True if deleted, False if not found
+            Updated task if found, None otherwise
+            
+        Raises:
+            PreconditionFailedError: If the task exists but if_updated_at does not match
         """
-        task = self.get_task_by_id(task_id)
-        if not task:
-            return False
+        statement = update(Task).where(Task.id == task_id)
+        if if_updated_at is not None:
+            statement = statement.where(Task.updated_at.in_(if_updated_at))
+        statement = (
+            statement
+            .values(**values)
+            .returning(Task)
+            .execution_options(populate_existing=True)
+        )
+        task = self.session.scalars(statement).one_or_none()
+        self._commit("updated", [task_id] if task is not None else [])
+        if task is None:
+            if if_updated_at is not None:
+                self._check_precondition(task_id)
+            return None
+        return task
+        
+    def _run_batch_operation(
+        self, index: int, operation: BatchOperation, savepoint: bool
+    ) -> BatchResult:
+        """
+        Run one batch operation, turning a failure into an error result.
         
-        self.session.delete(task)
+        Args:
+            index: Position of the operation in the batch
+            operation: The operation
+            savepoint: Run it in a savepoint, so a failure undoes only its writes
+        
+        Returns:
+            The operation's result
+        """
+        mark = len(self._pending)
+        try:
+            if savepoint:
+                with self.session.begin_nested():
+                    return self._apply_batch_operation(index, operation)
+            return self._apply_batch_operation(index, operation)
+        except BatchOperationError as e:
+            error = str(e)
+        except SQLAlchemyError as e:
+            error = f"Database error: {e.__class__.__name__}"
+        # The failed operation's writes are undone: forget them
+        del self._pending[mark:]
+        return BatchResult(index=index, op=operation.op, id=operation.id, error=error)
+    
+    def _apply_batch_operation(self, index: int, operation: BatchOperation) -> BatchResult:
+        """
+        Dispatch one batch operation to the matching service method.
+        
+        Raises:
+            BatchOperationError: If the operation's task does not exist
+        """
+        if operation.op == "delete":
+            if not self.delete_task(operation.id):
+                raise BatchOperationError(f"Task with id {operation.id} not found")
+            return BatchResult(index=index, op=operation.op, id=operation.id)
+        
+        if operation.op == "create":
+            task = self.create_task(operation.create)
+        elif operation.op == "update":
+            task = self.update_task(operation.id, operation.update)
+        elif operation.op == "update_status":
+            task = self.update_task_status(operation.id, operation.status)
+        else:
+            task = self.get_task_by_id(operation.id)
+        if task is None:
+            raise BatchOperationError(f"Task with id {operation.id} not found")
+        return BatchResult(index=index, op=operation.op, id=task.id, task=task.to_dict())
+    
+    def _check_precondition(self, task_id: int) -> None:
+        """
+        Explain a conditional write that matched no row.
+        
+        Raises:
+            PreconditionFailedError: If the task exists (its version changed)
+        """
+        statement = select(Task.id).where(Task.id == task_id)
+        if self.session.exec(statement).first() is not None:
+            raise PreconditionFailedError(f"Task with id {task_id} has been modified")
+
+    def _commit(self, event_type: str, task_ids: Sequence[int]) -> None:
+        """
+        Commit the write, publishing its change events, then run _after_write.
+        
+        Event statements (Postgres NOTIFY) run inside the transaction, so
+        an event is delivered exactly when its write commits; in-process
+        events are published after the commit. Inside a transaction() block
+        all of this is left to the block.
+        
+        Args:
+            event_type: "created", "updated" or "deleted"
+            task_ids: IDs of the written tasks (empty if nothing matched)
+        """
+        if self._pending is not None:
+            self._pending.append((event_type, task_ids))
+            return
+        payloads = change_events(event_type, task_ids)
+        for statement in self.events.in_transaction(payloads):
+            self.session.exec(statement)
         self.session.commit()
-        return True
+        self._after_write(task_ids)
+        self.events.after_commit(payloads)
+        
+    def _after_write(self, task_ids: Sequence[int]) -> None:
+        """
+        Invalidate caches after a committed write.
+        
+        Bumps the table version, so cached task lists are no longer served
+        and reads already in flight do not cache what they loaded, then
+        drops cached copies of the written tasks.
+        
+        Args:
+            task_ids: IDs of the tasks created, updated or deleted
+        """
+        if task_ids:
+            # Version first: a read racing this write checks it after caching
+            bump_tasks_version()
+            invalidate_tasks(self.cache, task_ids)
@@ -0,0 +1,140 @@
+"""Per-status task counts, served from the trigger-maintained summary table."""
+
+import asyncio
+import logging
+from typing import Iterable, Optional
+
+from sqlalchemy import Engine, delete, func, insert, select, text
+
+from app.db.session import get_engine
+from app.models.task import Task, TaskStatus, TaskStatusCount
+
+logger = logging.getLogger(__name__)
+
+
+def build_task_stats(rows: Iterable[tuple[TaskStatus, int]]) -> dict:
+    """
+    Turn task_status_counts rows into the stats payload.
+
+    Args:
+        rows: (status, count) pairs; missing statuses count as zero
+
+    Returns:
+        Dictionary with one count per status value plus the total
+    """
+    counts = {status.value: 0 for status in TaskStatus}
+    for status, count in rows:
+        counts[status.value] = count
+    counts["total"] = sum(counts.values())
+    return counts
+
+
+def reconcile_status_counts(engine: Optional[Engine] = None) -> dict:
+    """
+    Recompute task_status_counts from the tasks table and report any drift.
+
+    On Postgres the recount takes no table lock. The tasks and their
+    counters are read in one REPEATABLE READ snapshot, where every
+    committed write has updated both, so their difference is exactly the
+    drift. The drift is then added to the counters as deltas, in the same
+    way the triggers apply theirs, so concurrent writes are neither
+    blocked nor lost. Only one process reconciles at a time: the others
+    skip the run.
+
+    On SQLite the counters are deleted first, which takes the database's
+    write lock, and then recounted.
+
+    Args:
+        engine: Sync engine (defaults to the app engine)
+
+    Returns:
+        Counter corrections by status value (empty when nothing drifted,
+        or when another process is reconciling)
+    """
+    engine = engine or get_engine()
+    if engine.dialect.name == "postgresql":
+        return _reconcile_postgres(engine)
+
+    with engine.begin() as connection:
+        # DELETE first so SQLite takes its write lock before the recount
+        stored = dict(connection.execute(
+            delete(TaskStatusCount).returning(TaskStatusCount.status, TaskStatusCount.count)
+        ).all())
+        connection.execute(
+            insert(TaskStatusCount).from_select(
+                ["status", "count"],
+                select(Task.status, func.count()).group_by(Task.status),
+            )
+        )
+        actual = dict(connection.execute(
+            select(TaskStatusCount.status, TaskStatusCount.count)
+        ).all())
+    return _drift(stored, actual)
+
+
+def _reconcile_postgres(engine: Engine) -> dict:
+    """reconcile_status_counts on Postgres: snapshot recount, then delta upserts."""
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+    with engine.connect() as connection:
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(hashtext('task_status_counts_reconcile'))")
+        ).scalar()
+        connection.commit()
+        if not acquired:
+            return {}
+        try:
+            with connection.begin():
+                connection.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"))
+                actual = dict(connection.execute(
+                    select(Task.status, func.count()).group_by(Task.status)
+                ).all())
+                stored = dict(connection.execute(
+                    select(TaskStatusCount.status, TaskStatusCount.count)
+                ).all())
+            drift = _drift(stored, actual)
+            if drift:
+                statement = pg_insert(TaskStatusCount).values(
+                    [{"status": TaskStatus(status), "count": delta} for status, delta in drift.items()]
+                )
+                statement = statement.on_conflict_do_update(
+                    index_elements=[TaskStatusCount.status],
+                    set_={"count": TaskStatusCount.count + statement.excluded.count},
+                )
+                with connection.begin():
+                    connection.execute(statement)
+            return drift
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(hashtext('task_status_counts_reconcile'))"))
+            connection.commit()
+
+
+def _drift(stored: dict, actual: dict) -> dict:
+    """Per-status difference between recounted and stored counts."""
+    drift = {}
+    for status in TaskStatus:
+        difference = actual.get(status, 0) - stored.get(status, 0)
+        if difference:
+            drift[status.value] = difference
+    return drift
+
+
+async def reconcile_periodically(interval: float) -> None:
+    """
+    Run reconcile_status_counts every `interval` seconds until cancelled.
+
+    Every API worker runs this loop; on Postgres only the one that gets the
+    advisory lock recounts in each round.
+
+    Args:
+        interval: Seconds between runs
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            drift = await asyncio.to_thread(reconcile_status_counts)
+        except Exception:
+            logger.exception("Task status count reconciliation failed")
+            continue
+        if drift:
+            logger.warning("Corrected task status count drift: %s", drift)
@@ -0,0 +1,111 @@
+"""
+Compare the asyncio route stack with the previous sync (threadpool) stack.
+
+Both apps are driven in-process through httpx's ASGI transport with the same
+request mix (list a page, fetch a task by id) at high client concurrency.
+
+Usage:
+    uv run python -m benchmarks.async_vs_sync --concurrency 500 --requests 5000
+
+Set BENCH_DATABASE_URL to a Postgres URL to benchmark against Postgres;
+otherwise a temporary SQLite database is used.
+
+Note: once client concurrency exceeds the connection pool, the sync stack can
+stall outright. Every threadpool worker ends up waiting for a pooled
+connection while the sessions holding those connections wait for a worker to
+run their cleanup. Requests slower than --timeout are counted as errors so the
+run still finishes. The async stack runs first so stalled sync requests
+left over from the sync run cannot skew its numbers.
+"""
+
+import argparse
+import asyncio
+import json
+from typing import Optional
+
+from benchmarks.common import configure_database, run_load, seed_tasks
+
+
+def build_sync_app():
+    """Build an app serving the same reads through sync `def` routes."""
+    from fastapi import Depends, FastAPI, HTTPException, Query
+    from sqlmodel import Session
+
+    from app.db.session import get_session
+    from app.models.task import TaskStatus
+    from app.schemas.task import TaskPage, TaskRead
+    from app.services.task_service import TaskService
+
+    app = FastAPI()
+
+    def get_task_service(session: Session = Depends(get_session)) -> TaskService:
+        return TaskService(session)
+
+    @app.get("/api/v1/tasks", response_model=TaskPage)
+    def list_tasks(
+        status_filter: Optional[TaskStatus] = Query(default=None, alias="status"),
+        limit: int = Query(default=50),
+        service: TaskService = Depends(get_task_service),
+    ):
+        page = service.get_tasks_page(status=status_filter, limit=limit)
+        return {"tasks": page.items, "next_cursor": page.next_cursor}
+
+    @app.get("/api/v1/tasks/{task_id}", response_model=TaskRead)
+    def get_task(task_id: int, service: TaskService = Depends(get_task_service)):
+        task = service.get_task_by_id(task_id)
+        if not task:
+            raise HTTPException(status_code=404)
+        return task
+
+    return app
+
+
+async def bench_app(
+    app, total: int, concurrency: int, task_count: int, timeout: float
+) -> dict:
+    """Drive `app` with a 50/50 mix of page listings and single-task reads."""
+    import httpx
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", limits=limits, timeout=120
+    ) as client:
+        async def send(i: int) -> bool:
+            if i % 2:
+                response = await client.get("/api/v1/tasks", params={"limit": 20})
+            else:
+                response = await client.get(f"/api/v1/tasks/{i % task_count + 1}")
+            return response.status_code == 200
+
+        # Warm up pools and caches before measuring
+        await run_load(send, min(total, concurrency), concurrency, timeout)
+        return await run_load(send, total, concurrency, timeout)
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Seed the database and benchmark both stacks."""
+    configure_database()
+    seed_tasks(args.tasks)
+
+    from app.db.session import get_async_engine
+    from app.main import app as async_app
+
+    results = {
+        name: await bench_app(app, args.requests, args.concurrency, args.tasks, args.timeout)
+        for name, app in (("async", async_app), ("sync", build_sync_app()))
+    }
+    await get_async_engine().dispose()
+
+    print(json.dumps(results, indent=2))
+    speedup = results["async"]["rps"] / results["sync"]["rps"] if results["sync"]["rps"] else 0
+    print(f"\nasync/sync throughput: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout (s)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,193 @@
+"""
+Throughput of the clients' command parser, checked against the old parsers.
+
+Parses a corpus of English and Persian commands (generated, or one per
+line from --corpus, e.g. a recorded agent session) with the shared
+app.mcp_client.parser and with the previous per-client implementations
+in benchmarks.parser_reference, for both client dialects. Fails (exit
+status 1) if the two disagree on any command.
+
+Commands typed with Arabic-keyboard letters (ي, ك) are reported apart:
+the old parsers did not recognize their Persian keywords, the shared
+parser normalizes them, so for those the check is that the shared parser
+picks the tool the old one picks for the normalized command.
+
+Usage:
+    uv run python -m benchmarks.command_parser --commands 20000
+    uv run python -m benchmarks.command_parser --corpus session.log
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from app.mcp_client.parser import CommandParser, normalize_persian
+from benchmarks.parser_reference import parse_command, parse_user_input
+
+TEMPLATES = [
+    # list
+    "لیست تسک‌ها رو نشون بده",
+    "لیست pending رو نشون بده",
+    "لیست تسک‌های انجام شده",
+    "همه تسک ها",
+    "تسک ها رو نشون بده",
+    "done لیست",
+    "show all tasks",
+    "List tasks",
+    "list pending tasks",
+    "list done",
+    "get all tasks",
+    "show me the Completed tasks",
+    "tasks",
+    # create
+    "یک تسک جدید با عنوان {title} بساز",
+    "تسک جدید با عنوان \"{title}\"",
+    "بساز تسک با عنوان {title}",
+    "با عنوان {title} بساز",
+    "create task titled {title}",
+    "Create a task with '{title}'",
+    "new task {title}",
+    "add task {title}",
+    # update
+    "وضعیت تسک {id} رو done کن",
+    "وضعیت تسک {id} رو انجام کن",
+    "تسک {id} رو معلق کن",
+    "تغییر وضعیت {id} به in_progress",
+    "update task {id} to done",
+    "Mark task {id} as in_progress",
+    "set {id} to pending",
+    "تسک {id} تمام شده",
+    "{id} finished",
+    # detail
+    "جزئیات تسک {id}",
+    "تسک {id} رو نشون بده",
+    "نمایش تسک {id}",
+    "show task {id}",
+    "view task {id}",
+    "task {id} details",
+    "info for task {id}",
+    "detail {id}",
+    # delete
+    "تسک {id} رو حذف کن",
+    "حذف تسک {id}",
+    "پاک کن {id}",
+    "delete task {id}",
+    "remove task {id}",
+    "delete {id}",
+    "task {id} delete",
+    # stats
+    "آمار تسک‌ها",
+    "چند تا تسک داریم",
+    "stats",
+    "How many tasks are done?",
+    # search
+    "جستجوی {word}",
+    "جستجو کن برای {word}",
+    "سرچ {word}",
+    "{word} رو پیدا کن",
+    "search {word}",
+    "find tasks about {word}",
+    "search \"\"",
+    # prompts (FastMCP) and unrecognized
+    "help",
+    "راهنما",
+    "workflow",
+    "daily summary",
+    "خلاصه روزانه",
+    "hello there",
+    "سلام",
+    "",
+]
+
+TITLES = ["خرید نان", "گزارش ماهانه", "Write report", "fix login bug", "تماس با علی", "Review PR #12"]
+WORDS = ["فاکتور", "invoice", "login", "گزارش", "report bug"]
+
+# Arabic-keyboard spellings of Persian keywords
+ARABIC_KEYBOARD = str.maketrans({"ی": "ي", "ک": "ك"})
+
+
+def generate_corpus(count: int, seed: int) -> list[str]:
+    """Random commands from the templates, with varying ids, titles and words."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        command = rng.choice(TEMPLATES).format(
+            id=rng.randint(1, 5000), title=rng.choice(TITLES), word=rng.choice(WORDS)
+        )
+        if rng.random() < 0.05:
+            command = command.translate(ARABIC_KEYBOARD)
+        corpus.append(command)
+    return corpus
+
+
+def time_parser(parse, corpus: list[str], repeat: int) -> float:
+    """Best commands/s over `repeat` passes through the corpus."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for command in corpus:
+            parse(command)
+        best = min(best, time.perf_counter() - started)
+    return len(corpus) / best if best else 0.0
+
+
+def compare(parse, reference, corpus: list[str]) -> dict:
+    """Check the shared parser against the old one on every command."""
+    mismatches = []
+    normalized = {"commands": 0, "recognized_before": 0, "recognized_now": 0}
+    for command in corpus:
+        result = parse(command)
+        if normalize_persian(command) != command:
+            # Only the tool is compared: titles and queries keep the letters as typed
+            normalized["commands"] += 1
+            normalized["recognized_before"] += reference(command)[0] is not None
+            normalized["recognized_now"] += result[0] is not None
+            expected = reference(normalize_persian(command))[0]
+            if result[0] != expected:
+                mismatches.append({"command": command, "expected": expected, "got": result[0]})
+        elif result != reference(command):
+            mismatches.append({"command": command, "expected": reference(command), "got": result})
+    return {"mismatches": len(mismatches), "first_mismatches": mismatches[:5], "arabic_keyboard": normalized}
+
+
+def main(args: argparse.Namespace) -> None:
+    """Check and time both dialects and print JSON."""
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as f:
+            corpus = [line.rstrip("\n") for line in f]
+    else:
+        corpus = generate_corpus(args.commands, args.seed)
+
+    dialects = {
+        "cli": (CommandParser().parse, parse_user_input),
+        "fastmcp": (CommandParser(id_argument="task_id", prompts=True, loose_delete=True).parse, parse_command),
+    }
+    results = {"commands": len(corpus)}
+    failed = False
+    for name, (parse, reference) in dialects.items():
+        check = compare(parse, reference, corpus)
+        failed = failed or check["mismatches"] > 0
+        before = time_parser(reference, corpus, args.repeat)
+        after = time_parser(parse, corpus, args.repeat)
+        results[name] = {
+            "reference_per_s": round(before),
+            "shared_per_s": round(after),
+            "speedup": round(after / before, 2) if before else 0.0,
+            **check,
+        }
+
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    if failed:
+        print("The shared parser disagrees with the old parsers", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--commands", type=int, default=20000, help="Size of the generated corpus")
+    parser.add_argument("--corpus", help="File with one command per line instead")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes; the best one counts")
+    parser.add_argument("--seed", type=int, default=1)
+    main(parser.parse_args())
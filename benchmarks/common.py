@@ -0,0 +1,110 @@
+"""Shared helpers for the benchmark scripts."""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+
+def configure_database(database_url: Optional[str] = None) -> str:
+    """
+    Point the app at the benchmark database before it is imported.
+
+    Uses BENCH_DATABASE_URL (e.g. a Postgres URL) when set, otherwise a
+    fresh SQLite file in the temp directory.
+    """
+    database_url = database_url or os.getenv("BENCH_DATABASE_URL")
+    if not database_url:
+        path = os.path.join(tempfile.gettempdir(), "todo_bench.db")
+        if os.path.exists(path):
+            os.remove(path)
+        database_url = f"sqlite:///{path}"
+    os.environ["DATABASE_URL"] = database_url
+    return database_url
+
+
+def seed_tasks(count: int) -> list[int]:
+    """Create the schema, replace all tasks with `count` new ones and return their IDs."""
+    from sqlalchemy import delete, insert
+
+    from app.db.session import get_engine, init_db
+    from app.models.task import Task, TaskStatus
+
+    init_db()
+    statuses = list(TaskStatus)
+    start = datetime.utcnow() - timedelta(seconds=count)
+    rows = [
+        {
+            "title": f"Benchmark task {i}",
+            "description": f"Seeded row {i} for load testing",
+            "status": statuses[i % len(statuses)],
+            "created_at": start + timedelta(seconds=i),
+            "updated_at": start + timedelta(seconds=i),
+        }
+        for i in range(count)
+    ]
+    with get_engine().begin() as conn:
+        conn.execute(delete(Task))
+        if not rows:
+            return []
+        result = conn.execute(insert(Task).returning(Task.id), rows)
+        return sorted(result.scalars())
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile (0-100) of samples, nearest-rank."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_load(
+    send: Callable[[int], Awaitable[bool]],
+    total: int,
+    concurrency: int,
+    timeout: Optional[float] = None,
+) -> dict:
+    """
+    Call `send(i)` for i in range(total) with at most `concurrency` in flight.
+
+    `send` returns True on success; calls slower than `timeout` seconds are
+    cancelled and counted as errors. Latencies are reported in milliseconds.
+    """
+    latencies: list[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal errors, next_index
+        while next_index < total:
+            i = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                ok = await asyncio.wait_for(send(i), timeout)
+            except Exception:
+                ok = False
+            latencies.append((time.perf_counter() - started) * 1000)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
@@ -0,0 +1,117 @@
+"""
+Time from client start to first tool result, per way of reaching the server.
+
+Each run opens a fresh client connection and calls list_tasks once;
+the time covers starting the server (if any), the MCP handshake and the
+call. Modes:
+
+    uv-stdio     spawn `uv run python -m <server>` over stdio (the old
+                 FastMCP client default; skipped if uv is not installed)
+    stdio        spawn `python -m <server>` over stdio with this interpreter
+    daemon-cold  no daemon running: start it, then attach over HTTP
+    daemon-warm  attach over HTTP to the already-running daemon
+
+Usage:
+    uv run python -m benchmarks.mcp_client_startup --runs 5
+    uv run python -m benchmarks.mcp_client_startup --server fastmcp --modes stdio daemon-warm
+
+Set BENCH_DATABASE_URL to a Postgres URL to benchmark against Postgres;
+otherwise a temporary SQLite database is used.
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import statistics
+import time
+
+from benchmarks.common import configure_database, seed_tasks
+
+SERVER_MODULES = {
+    "lowlevel": "app.mcp_server",
+    "fastmcp": "app.mcp_server.fastmcp_server",
+}
+MODES = ["uv-stdio", "stdio", "daemon-cold", "daemon-warm"]
+
+
+def wait_for_exit(port: int, timeout: float = 10.0) -> None:
+    """Wait until nothing listens on the daemon port any more."""
+    from app.mcp_client.daemon import DEFAULT_DAEMON_HOST, is_listening
+
+    deadline = time.monotonic() + timeout
+    while is_listening(DEFAULT_DAEMON_HOST, port) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+async def first_result_ms(target) -> float:
+    """Connect to the target, call list_tasks once and return the elapsed ms."""
+    from app.mcp_client.connection import ReconnectingSession
+
+    started = time.perf_counter()
+    async with ReconnectingSession(target, retries=0) as session:
+        result = await session.call_tool("list_tasks", {"limit": 20})
+        elapsed = (time.perf_counter() - started) * 1000
+    if result.isError or not result.content:
+        raise RuntimeError(f"list_tasks failed: {result.content}")
+    return elapsed
+
+
+def run_mode(mode: str, module: str, args: argparse.Namespace) -> list[float]:
+    """Time args.runs connections in one mode."""
+    from app.mcp_client.connection import ServerTarget
+    from app.mcp_client.daemon import ensure_daemon, stop_daemon
+
+    if mode == "uv-stdio":
+        target = ServerTarget(command="uv", args=["run", "python", "-m", module])
+    elif mode == "stdio":
+        target = ServerTarget.stdio(module)
+    else:
+        target = ServerTarget(daemon_module=module, port=args.port)
+
+    timings = []
+    for _ in range(args.runs):
+        if mode == "daemon-cold":
+            stop_daemon(args.port)
+            wait_for_exit(args.port)
+        elif mode == "daemon-warm":
+            ensure_daemon(module, args.port)
+        timings.append(asyncio.run(first_result_ms(target)))
+    return timings
+
+
+def main(args: argparse.Namespace) -> None:
+    """Seed the database, time every mode and print JSON."""
+    from app.mcp_client.daemon import stop_daemon
+
+    configure_database()
+    seed_tasks(args.tasks)
+    module = SERVER_MODULES[args.server]
+
+    results = {}
+    try:
+        for mode in args.modes:
+            if mode == "uv-stdio" and shutil.which("uv") is None:
+                results[mode] = {"skipped": "uv is not installed"}
+                continue
+            timings = run_mode(mode, module, args)
+            results[mode] = {
+                "runs": len(timings),
+                "min_ms": round(min(timings), 1),
+                "median_ms": round(statistics.median(timings), 1),
+                "max_ms": round(max(timings), 1),
+            }
+    finally:
+        stop_daemon(args.port)
+
+    print(json.dumps({"server": args.server, "modes": results}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--server", choices=list(SERVER_MODULES), default="lowlevel")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8766, help="Port of the benchmark's daemon")
+    parser.add_argument("--tasks", type=int, default=1000)
+    main(parser.parse_args())
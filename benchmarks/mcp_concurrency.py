@@ -0,0 +1,133 @@
+"""
+Fire concurrent tool calls at the low-level MCP server and check the pool.
+
+All calls are sent at once over an in-memory MCP session, so the server
+dispatches them concurrently as it would pipelined stdio requests. The
+script samples the asyncio engine's pool while they run and fails
+(exit status 1) if any call errored, if more connections were checked out
+than the pool allows (DB_POOL_SIZE + DB_MAX_OVERFLOW), or if any connection
+is still checked out once every call has returned.
+
+Usage:
+    uv run python -m benchmarks.mcp_concurrency --calls 1000
+
+Set BENCH_DATABASE_URL to a Postgres URL to benchmark against Postgres;
+otherwise a temporary SQLite database is used.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from benchmarks.common import configure_database, percentile, seed_tasks
+
+# Read-heavy mix with some writes, like an agent working through a backlog
+OPERATIONS = ["get_task_by_id", "list_tasks", "get_task_by_id", "update_task_status", "get_task_stats"]
+
+
+def tool_call(i: int, task_ids: list[int]) -> tuple[str, dict]:
+    """Tool name and arguments for the i-th call."""
+    name = OPERATIONS[i % len(OPERATIONS)]
+    task_id = task_ids[i % len(task_ids)]
+    if name == "get_task_by_id":
+        return name, {"id": task_id}
+    if name == "list_tasks":
+        return name, {"limit": 20}
+    if name == "update_task_status":
+        return name, {"id": task_id, "status": ["pending", "in_progress", "done"][i % 3]}
+    return name, {}
+
+
+async def sample_pool(pool, stop: asyncio.Event, interval: float) -> int:
+    """Return the peak number of checked-out connections until `stop` is set."""
+    peak = 0
+    while not stop.is_set():
+        peak = max(peak, pool.checkedout())
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+    return max(peak, pool.checkedout())
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Send every call at once and collect latencies, errors and pool usage."""
+    from mcp.shared.memory import create_connected_server_and_client_session
+
+    from app.core.config import get_settings
+    from app.db.session import get_async_engine
+    from app.mcp_server.server import server
+
+    task_ids = seed_tasks(args.tasks)
+    settings = get_settings()
+    capacity = settings.db_pool_size + settings.db_max_overflow
+    pool = get_async_engine().sync_engine.pool
+    latencies: list[float] = []
+    failures: list[str] = []
+
+    async def call(i: int) -> None:
+        name, arguments = tool_call(i, task_ids)
+        started = time.perf_counter()
+        try:
+            result = await client.call_tool(name, arguments)
+            text = result.content[0].text if result.content else ""
+            if result.isError or '"error"' in text:
+                failures.append(f"{name}: {text[:200]}")
+        except Exception as e:
+            failures.append(f"{name}: {e!r}")
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    async with create_connected_server_and_client_session(server) as client:
+        await client.list_tools()
+        stop = asyncio.Event()
+        sampler = asyncio.create_task(sample_pool(pool, stop, args.sample_interval))
+        started = time.perf_counter()
+        await asyncio.gather(*(call(i) for i in range(args.calls)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        peak = await sampler
+
+    leaked = pool.checkedout()
+    await get_async_engine().dispose()
+    return {
+        "calls": args.calls,
+        "errors": len(failures),
+        "first_errors": failures[:5],
+        "seconds": round(elapsed, 3),
+        "calls_per_s": round(args.calls / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "pool_capacity": capacity,
+        "peak_checked_out": peak,
+        "checked_out_after": leaked,
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run the calls, print the results as JSON and check the invariants."""
+    configure_database()
+    result = asyncio.run(run(args))
+    print(json.dumps(result, indent=2))
+
+    problems = []
+    if result["errors"]:
+        problems.append(f"{result['errors']} of {result['calls']} calls failed")
+    if result["peak_checked_out"] > result["pool_capacity"]:
+        problems.append(
+            f"{result['peak_checked_out']} connections checked out, pool allows {result['pool_capacity']}"
+        )
+    if result["checked_out_after"]:
+        problems.append(f"{result['checked_out_after']} connections still checked out after the run")
+    if problems:
+        print("; ".join(problems), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--sample-interval", type=float, default=0.001)
+    main(parser.parse_args())
@@ -0,0 +1,167 @@
+"""
+Load test for the MCP servers' HTTP transports: sessions/s and tool call latency.
+
+Starts one server process (or attaches to --url) and opens many MCP
+client sessions against it, at most --concurrency at a time. Each session
+initializes, makes --calls tool calls (list / get / stats) and closes.
+Reports sessions per second and per-call latency percentiles; the server
+process keeps one engine and connection pool for all of them. With --url
+nothing is seeded and the server's existing tasks are used.
+
+Usage:
+    uv run python -m benchmarks.mcp_http_load --sessions 500 --concurrency 50
+    uv run python -m benchmarks.mcp_http_load --server fastmcp --transport sse
+    uv run python -m benchmarks.mcp_http_load --url http://127.0.0.1:8001/mcp
+
+Set BENCH_DATABASE_URL to a Postgres URL to benchmark against Postgres;
+otherwise a temporary SQLite database is used.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+
+from benchmarks.common import configure_database, percentile, run_load, seed_tasks
+
+SERVER_MODULES = {
+    "lowlevel": "app.mcp_server",
+    "fastmcp": "app.mcp_server.fastmcp_server",
+}
+ENDPOINTS = {"http": "/mcp", "sse": "/sse"}
+
+
+def start_server(args: argparse.Namespace) -> subprocess.Popen:
+    """Start the server in a child process and wait until it accepts connections."""
+    command = [
+        sys.executable, "-m", SERVER_MODULES[args.server],
+        "--transport", args.transport, "--host", "127.0.0.1", "--port", str(args.port),
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + args.startup_timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", args.port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError("Server did not start in time")
+
+
+@asynccontextmanager
+async def client_session(url: str, transport: str):
+    """Open and initialize one MCP client session over HTTP or SSE."""
+    from mcp import ClientSession
+    from mcp.client.sse import sse_client
+    from mcp.client.streamable_http import streamable_http_client
+
+    connect = streamable_http_client(url) if transport == "http" else sse_client(url)
+    async with connect as streams:
+        async with ClientSession(streams[0], streams[1]) as session:
+            await session.initialize()
+            yield session
+
+
+def tool_calls(server: str, count: int, task_ids: list[int], seed: int) -> list[tuple[str, dict]]:
+    """The calls one session makes: a read-heavy mix of list, get and stats."""
+    id_argument = "id" if server == "lowlevel" else "task_id"
+    calls = []
+    for i in range(count):
+        kind = (seed + i) % 3
+        if kind == 0:
+            calls.append(("list_tasks", {"limit": 20, "fields": ["id", "title", "status"]}))
+        elif kind == 1:
+            calls.append(("get_task_by_id", {id_argument: task_ids[(seed * 7 + i) % len(task_ids)]}))
+        else:
+            calls.append(("get_task_stats", {}))
+    return calls
+
+
+async def run(args: argparse.Namespace, url: str, task_ids: list[int]) -> dict:
+    """Open the sessions and time them and their tool calls."""
+    if not task_ids:
+        # Attached to a server with its own database: use the tasks it has
+        async with client_session(url, args.transport) as session:
+            result = await session.call_tool("list_tasks", {"limit": 500, "fields": ["id"]})
+            task_ids = [task["id"] for task in json.loads(result.content[0].text)["tasks"]] or [1]
+
+    call_latencies: list[float] = []
+    call_errors = 0
+
+    async def send(i: int) -> bool:
+        nonlocal call_errors
+        async with client_session(url, args.transport) as session:
+            for name, arguments in tool_calls(args.server, args.calls, task_ids, i):
+                started = time.perf_counter()
+                result = await session.call_tool(name, arguments)
+                call_latencies.append((time.perf_counter() - started) * 1000)
+                if result.isError or '"error"' in (result.content[0].text if result.content else ""):
+                    call_errors += 1
+        return True
+
+    sessions = await run_load(send, args.sessions, args.concurrency, timeout=args.session_timeout)
+    return {
+        "server": args.server,
+        "transport": args.transport,
+        "sessions": {
+            "total": sessions["requests"],
+            "concurrency": sessions["concurrency"],
+            "errors": sessions["errors"],
+            "per_s": sessions["rps"],
+            "p50_ms": sessions["p50_ms"],
+            "p95_ms": sessions["p95_ms"],
+            "p99_ms": sessions["p99_ms"],
+        },
+        "tool_calls": {
+            "total": len(call_latencies),
+            "errors": call_errors,
+            "per_s": round(len(call_latencies) / sessions["seconds"], 1) if sessions["seconds"] else 0.0,
+            "p50_ms": round(percentile(call_latencies, 50), 2),
+            "p95_ms": round(percentile(call_latencies, 95), 2),
+            "p99_ms": round(percentile(call_latencies, 99), 2),
+        },
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    """Seed the database, start the server, run the sessions and print JSON."""
+    process = None
+    task_ids: list[int] = []
+    url = args.url
+    if url is None:
+        configure_database()
+        task_ids = seed_tasks(args.tasks)
+        process = start_server(args)
+        url = f"http://127.0.0.1:{args.port}{ENDPOINTS[args.transport]}"
+    try:
+        result = asyncio.run(run(args, url, task_ids))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    print(json.dumps(result, indent=2))
+    if result["sessions"]["errors"] or result["tool_calls"]["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--server", choices=list(SERVER_MODULES), default="lowlevel")
+    parser.add_argument("--transport", choices=list(ENDPOINTS), default="http")
+    parser.add_argument("--url", help="Attach to a running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=10, help="Tool calls per session")
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--session-timeout", type=float, default=60.0)
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    main(parser.parse_args())
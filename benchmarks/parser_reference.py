@@ -0,0 +1,342 @@
+"""
+The clients' command parsers as they were before app.mcp_client.parser.
+
+Kept verbatim (cli.parse_user_input and TodoFastMCPClient.parse_command)
+as the reference that benchmarks.command_parser checks the shared parser
+against and times it with.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from app.mcp_client.parser import STATUS_MAPPING
+
+
+def parse_user_input(user_input: str) -> Tuple[Optional[str], dict]:
+    """
+    Parse user input to determine the tool and arguments.
+    
+    Returns:
+        Tuple of (tool_name, arguments_dict) or (None, {}) if not recognized
+    """
+    text = user_input.lower().strip()
+    
+    # Pattern for listing tasks
+    list_patterns = [
+        r"لیست.*تسک",
+        r"تسک.*ها.*نشون",
+        r"نشون.*بده.*تسک",
+        r"همه.*تسک",
+        r"لیست.*(pending|in_progress|done|انجام|معلق)",
+        r"(pending|in_progress|done).*لیست",
+        r"list.*task",
+        r"show.*task",
+        r"get.*task",
+        r"all.*task",
+        r"list.*(pending|in_progress|done)",
+        r"(pending|in_progress|done).*list",
+    ]
+    
+    # Pattern for creating tasks
+    create_patterns = [
+        r"(?:یک\s*)?تسک.*(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?(?:\s*بساز)?$",
+        r"(?:بساز|ایجاد).*تسک.*(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?",
+        r"(?:تسک\s*)?(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?\s*(?:بساز|ایجاد)",
+        r"create.*task.*(?:titled?|with)\s+[\"']?(.+)[\"']?$",
+        r"new.*task\s+[\"']?(.+)[\"']?$",
+        r"add.*task\s+[\"']?(.+)[\"']?$",
+    ]
+    
+    # Pattern for updating status
+    update_patterns = [
+        r"وضعیت.*تسک\s*(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
+        r"(?:تسک\s*)?(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)\s*کن",
+        r"(?:تغییر|آپدیت).*(?:وضعیت)?.*(\d+).*(?:به)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
+        r"update.*(?:task\s*)?(\d+).*(?:to|status)?\s*(pending|in_progress|done)",
+        r"(?:mark|set).*(?:task\s*)?(\d+).*(?:as|to)?\s*(pending|in_progress|done)",
+    ]
+    
+    # Pattern for getting task details
+    detail_patterns = [
+        r"جزئیات.*تسک\s*(\d+)",
+        r"تسک\s*(\d+).*(?:جزئیات|نشون|ببین)",
+        r"(?:نشون|نمایش).*تسک\s*(\d+)",
+        r"(?:get|show|view).*task\s*(\d+)",
+        r"task\s*(\d+).*(?:detail|info)",
+        r"(?:detail|info).*(?:of|for)?.*task\s*(\d+)",
+    ]
+    
+    # Pattern for deleting tasks
+    delete_patterns = [
+        r"(?:حذف|پاک).*تسک\s*(\d+)",
+        r"تسک\s*(\d+).*(?:رو|را)?\s*(?:حذف|پاک)\s*کن",
+        r"delete.*task\s*(\d+)",
+        r"remove.*task\s*(\d+)",
+        r"task\s*(\d+).*delete",
+    ]
+    
+    # Pattern for searching tasks
+    search_patterns = [
+        r"^(?:جستجو|جست\s*و\s*جو|سرچ)ی?\s*(?:کن\s*)?(?:برای\s*|تسک\s*(?:های|‌ها)?\s*)?(.+)",
+        r"^(.+?)\s*(?:رو|را)\s*پیدا\s*کن$",
+        r"^(?:search|find)\s+(?:for\s+)?(?:tasks?\s+)?(?:about\s+|with\s+|matching\s+)?(.+)",
+    ]
+    
+    # Check for per-status counts
+    if re.search(r"(\bstats?\b|statistics|how many|آمار|چند\s*تا)", text, re.IGNORECASE):
+        return ("get_task_stats", {})
+    
+    # Check for search
+    for pattern in search_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            query = match.group(1).strip().strip('"\'')
+            if query:
+                return ("search_tasks", {"query": query})
+    
+    # Check for list with status filter
+    for pattern in list_patterns:
+        if re.search(pattern, text):
+            # Check for status filter
+            status = None
+            # First check for English status in original input
+            for eng_status in ["pending", "in_progress", "done"]:
+                if eng_status in user_input.lower():
+                    status = eng_status
+                    break
+            # Then check for Persian status
+            if not status:
+                for persian, english in STATUS_MAPPING.items():
+                    if persian in user_input:
+                        status = english
+                        break
+            
+            args = {}
+            if status:
+                args["status"] = status
+            return ("list_tasks", args)
+    
+    # Check for create task
+    for pattern in create_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            title = match.group(1).strip()
+            # Clean up title
+            title = re.sub(r'\s*(بساز|ایجاد کن|create|add).*$', '', title, flags=re.IGNORECASE)
+            title = title.strip().strip('"\'')
+            if title:
+                return ("create_task", {"title": title})
+    
+    # Check for update status
+    for pattern in update_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            task_id = int(match.group(1))
+            status_raw = match.group(2).strip()
+            status = STATUS_MAPPING.get(status_raw, status_raw)
+            return ("update_task_status", {"id": task_id, "status": status})
+    
+    # Check for get task details
+    for pattern in detail_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            task_id = int(match.group(1))
+            return ("get_task_by_id", {"id": task_id})
+    
+    # Check for delete task
+    for pattern in delete_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            task_id = int(match.group(1))
+            return ("delete_task", {"id": task_id})
+    
+    # Fallback: try to extract any number and status for update
+    numbers = re.findall(r'\d+', text)
+    if numbers:
+        task_id = int(numbers[0])
+        
+        # Check for status words
+        for persian, english in STATUS_MAPPING.items():
+            if persian in text:
+                return ("update_task_status", {"id": task_id, "status": english})
+        
+        # Just show details if only a number mentioned
+        if "جزئیات" in text or "detail" in text or "نشون" in text or "show" in text:
+            return ("get_task_by_id", {"id": task_id})
+    
+    # Check if it's just asking for list
+    if any(word in text for word in ["تسک", "task", "list", "لیست", "همه", "all"]):
+        return ("list_tasks", {})
+    
+    return (None, {})
+
+
+def parse_command(user_input: str) -> Tuple[Optional[str], dict]:
+    """
+    Parse user input and return (tool_name, arguments).
+
+    Supports both English and Persian commands with comprehensive patterns.
+    """
+    text = user_input.lower().strip()
+
+    # Pattern for listing tasks
+    list_patterns = [
+        r"لیست.*تسک",
+        r"تسک.*ها.*نشون",
+        r"نشون.*بده.*تسک",
+        r"همه.*تسک",
+        r"لیست.*(pending|in_progress|done|انجام|معلق)",
+        r"(pending|in_progress|done).*لیست",
+        r"list.*task",
+        r"show.*task",
+        r"get.*task",
+        r"all.*task",
+        r"list.*(pending|in_progress|done)",
+        r"(pending|in_progress|done).*list",
+    ]
+
+    # Pattern for creating tasks
+    create_patterns = [
+        r"(?:یک\s*)?تسک.*(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?(?:\s*بساز)?$",
+        r"(?:بساز|ایجاد).*تسک.*(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?",
+        r"(?:تسک\s*)?(?:جدید\s*)?(?:با\s*عنوان|عنوان)\s+[\"']?(.+?)[\"']?\s*(?:بساز|ایجاد)",
+        r"create.*task.*(?:titled?|with)\s+[\"']?(.+)[\"']?$",
+        r"new.*task\s+[\"']?(.+)[\"']?$",
+        r"add.*task\s+[\"']?(.+)[\"']?$",
+    ]
+
+    # Pattern for updating status
+    update_patterns = [
+        r"وضعیت.*تسک\s*(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
+        r"(?:تسک\s*)?(\d+).*(?:رو|را)?\s*(pending|in_progress|done|انجام|تمام|معلق)\s*کن",
+        r"(?:تغییر|آپدیت).*(?:وضعیت)?.*(\d+).*(?:به)?\s*(pending|in_progress|done|انجام|تمام|معلق)",
+        r"update.*(?:task\s*)?(\d+).*(?:to|status)?\s*(pending|in_progress|done)",
+        r"(?:mark|set).*(?:task\s*)?(\d+).*(?:as|to)?\s*(pending|in_progress|done)",
+    ]
+
+    # Pattern for getting task details
+    detail_patterns = [
+        r"جزئیات.*تسک\s*(\d+)",
+        r"تسک\s*(\d+).*(?:جزئیات|نشون|ببین)",
+        r"(?:نشون|نمایش).*تسک\s*(\d+)",
+        r"(?:get|show|view).*task\s*(\d+)",
+        r"task\s*(\d+).*(?:detail|info)",
+        r"(?:detail|info).*(?:of|for)?.*task\s*(\d+)",
+    ]
+
+    # Pattern for deleting tasks
+    delete_patterns = [
+        r"(?:حذف|پاک).*تسک\s*(\d+)",
+        r"(?:حذف|پاک).*\s*(\d+)",
+        r"تسک\s*(\d+).*(?:رو|را)?\s*(?:حذف|پاک)\s*کن",
+        r"delete.*task\s*(\d+)",
+        r"delete.*\s*(\d+)",
+        r"remove.*task\s*(\d+)",
+        r"remove.*\s*(\d+)",
+        r"task\s*(\d+).*delete",
+    ]
+
+    # Check for prompt patterns first
+    if re.search(r"(help|guide|راهنما|کمک)", text, re.IGNORECASE):
+        return ("prompt:task_management_guide", {})
+
+    if re.search(r"(workflow|جریان کار|مراحل)", text, re.IGNORECASE):
+        return ("prompt:task_status_workflow", {})
+
+    if re.search(r"(daily|روزانه|summary|خلاصه)", text, re.IGNORECASE):
+        return ("prompt:daily_task_summary", {})
+
+    # Pattern for searching tasks
+    search_patterns = [
+        r"^(?:جستجو|جست\s*و\s*جو|سرچ)ی?\s*(?:کن\s*)?(?:برای\s*|تسک\s*(?:های|‌ها)?\s*)?(.+)",
+        r"^(.+?)\s*(?:رو|را)\s*پیدا\s*کن$",
+        r"^(?:search|find)\s+(?:for\s+)?(?:tasks?\s+)?(?:about\s+|with\s+|matching\s+)?(.+)",
+    ]
+
+    # Check for per-status counts
+    if re.search(r"(\bstats?\b|statistics|how many|آمار|چند\s*تا)", text, re.IGNORECASE):
+        return ("get_task_stats", {})
+
+    # Check for search
+    for pattern in search_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            query = match.group(1).strip().strip('"\'')
+            if query:
+                return ("search_tasks", {"query": query})
+
+    # Check for list with status filter
+    for pattern in list_patterns:
+        if re.search(pattern, text):
+            # Check for status filter
+            status = None
+            # First check for English status in original input
+            for eng_status in ["pending", "in_progress", "done"]:
+                if eng_status in user_input.lower():
+                    status = eng_status
+                    break
+            # Then check for Persian status using STATUS_MAPPING
+            if not status:
+                for persian, english in STATUS_MAPPING.items():
+                    if persian in user_input:
+                        status = english
+                        break
+
+            args = {}
+            if status:
+                args["status"] = status
+            return ("list_tasks", args)
+
+    # Check for create task
+    for pattern in create_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            title = match.group(1).strip()
+            # Clean up title
+            title = re.sub(r'\s*(بساز|ایجاد کن|create|add).*$', '', title, flags=re.IGNORECASE)
+            title = title.strip().strip('"\'')
+            if title:
+                return ("create_task", {"title": title})
+
+    # Check for update status
+    for pattern in update_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            task_id = int(match.group(1))
+            status_raw = match.group(2).strip()
+            status = STATUS_MAPPING.get(status_raw, status_raw)
+            return ("update_task_status", {"task_id": task_id, "status": status})
+
+    # Check for get task details
+    for pattern in detail_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            task_id = int(match.group(1))
+            return ("get_task_by_id", {"task_id": task_id})
+
+    # Check for delete task
+    for pattern in delete_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            task_id = int(match.group(1))
+            return ("delete_task", {"task_id": task_id})
+
+    # Fallback: try to extract any number and status for update
+    numbers = re.findall(r'\d+', text)
+    if numbers:
+        task_id = int(numbers[0])
+
+        # Check for status words using STATUS_MAPPING
+        for persian, english in STATUS_MAPPING.items():
+            if persian in text:
+                return ("update_task_status", {"task_id": task_id, "status": english})
+
+        # Just show details if only a number mentioned
+        if "جزئیات" in text or "detail" in text or "نشون" in text or "show" in text:
+            return ("get_task_by_id", {"task_id": task_id})
+
+    # Check if it's just asking for list
+    if any(word in text for word in ["تسک", "task", "list", "لیست", "همه", "all"]):
+        return ("list_tasks", {})
+
+    return (None, {})
@@ -0,0 +1,148 @@
+"""
+Count database round trips and time each TaskService write path.
+
+Compares the current single-statement write paths (UPDATE/DELETE ...
+RETURNING) with the previous read-modify-write implementation. The old
+implementation is reproduced below as LegacyTaskService.
+
+Usage:
+    uv run python -m benchmarks.round_trips --iterations 500
+
+Set BENCH_DATABASE_URL to a Postgres URL to measure real network round trips;
+otherwise a temporary SQLite database is used.
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+from benchmarks.common import configure_database, percentile, seed_tasks
+
+
+class RoundTripCounter:
+    """Counts statements and COMMITs sent on an engine."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine, "before_cursor_execute", self._on_statement)
+        event.listen(engine, "commit", self._on_commit)
+
+    def _on_statement(self, *args):
+        self.statements += 1
+
+    def _on_commit(self, *args):
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+    @property
+    def total(self) -> int:
+        return self.statements + self.commits
+
+
+class LegacyTaskService:
+    """The previous SELECT → mutate → COMMIT → refresh write paths."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def get_task_by_id(self, task_id):
+        from sqlmodel import select
+
+        from app.models.task import Task
+
+        return self.session.exec(select(Task).where(Task.id == task_id)).first()
+
+    def update_task(self, task_id, task_data):
+        task = self.get_task_by_id(task_id)
+        if not task:
+            return None
+        for key, value in task_data.model_dump(exclude_unset=True).items():
+            setattr(task, key, value)
+        task.updated_at = datetime.utcnow()
+        self.session.add(task)
+        self.session.commit()
+        self.session.refresh(task)
+        return task
+
+    def update_task_status(self, task_id, status):
+        task = self.get_task_by_id(task_id)
+        if not task:
+            return None
+        task.status = status
+        task.updated_at = datetime.utcnow()
+        self.session.add(task)
+        self.session.commit()
+        self.session.refresh(task)
+        return task
+
+    def delete_task(self, task_id):
+        task = self.get_task_by_id(task_id)
+        if not task:
+            return False
+        self.session.delete(task)
+        self.session.commit()
+        return True
+
+
+def measure(service_cls, operation: str, task_ids: list[int], counter: RoundTripCounter) -> dict:
+    """Run `operation` once per task id, each on a fresh session like a request would."""
+    from sqlmodel import Session
+
+    from app.db.session import get_engine
+    from app.models.task import TaskStatus
+    from app.schemas.task import TaskUpdate
+
+    latencies = []
+    counter.reset()
+    for i, task_id in enumerate(task_ids):
+        with Session(get_engine(), expire_on_commit=service_cls is LegacyTaskService) as session:
+            service = service_cls(session)
+            started = time.perf_counter()
+            if operation == "update_task":
+                task = service.update_task(task_id, TaskUpdate(title=f"Renamed {i}"))
+                task.title  # what the route serializes
+            elif operation == "update_task_status":
+                task = service.update_task_status(task_id, TaskStatus.DONE)
+                task.status
+            else:
+                service.delete_task(task_id)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "round_trips_per_op": round(counter.total / len(task_ids), 2),
+        "statements_per_op": round(counter.statements / len(task_ids), 2),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    """Seed the database and compare both implementations."""
+    configure_database()
+
+    from app.db.session import get_engine
+    from app.services.task_service import TaskService
+
+    counter = RoundTripCounter(get_engine())
+    results = {}
+    for operation in ("update_task", "update_task_status", "delete_task"):
+        results[operation] = {}
+        for name, service_cls in (("legacy", LegacyTaskService), ("current", TaskService)):
+            # Re-seed so both implementations delete/update the same rows
+            task_ids = seed_tasks(args.iterations)
+            results[operation][name] = measure(service_cls, operation, task_ids, counter)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=500)
+    main(parser.parse_args())
@@ -0,0 +1,379 @@
+"""
+Throughput and latency of every task route, with a regression check against a saved run.
+
+Seeds --tasks tasks, then drives each route in app/api/routes/tasks.py
+in-process through httpx's ASGI transport (with the app's lifespan
+running, as under uvicorn) at each --concurrency level, and reports
+requests/s and p50/p95/p99 latency per route and level. The database is
+re-seeded before each level; reads run before writes, and the delete
+routes remove rows created for them, so every level starts from the same
+table. Requests answered with an unexpected status count as errors.
+
+The task event feeds (GET and WebSocket /tasks/events) never finish, and
+httpx's ASGI transport buffers whole responses and has no WebSockets, so
+they are driven as raw ASGI calls and timed until the subscription is
+open (response headers sent / connection accepted).
+
+Every route of the router must have a scenario here: a new route without
+one fails the run.
+
+Results are printed as JSON and, with --output, written to a file. With
+--baseline, a saved run is compared route by route and the run fails
+(exit status 1) when p95 latency grows, or throughput drops, by more than
+--threshold (relative; p95 changes under --min-delta-ms are ignored as
+noise), or when any request errored.
+
+Usage:
+    uv run python -m benchmarks.routes --output baseline.json
+    uv run python -m benchmarks.routes --baseline baseline.json --threshold 0.25
+    uv run python -m benchmarks.routes --routes "GET /tasks" "GET /tasks/{task_id}" --concurrency 1 50
+
+Set BENCH_DATABASE_URL to a Postgres URL to benchmark against Postgres;
+otherwise a temporary SQLite database is used.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from contextlib import redirect_stdout, suppress
+from dataclasses import dataclass
+from typing import Optional
+
+from benchmarks.common import configure_database, run_load, seed_tasks
+
+API_PREFIX = "/api/v1"
+STATUSES = [None, "pending", "in_progress", "done"]
+SEARCH_TERMS = ["benchmark", "task 1", "seeded row", "load testing", "banchmark"]
+
+# Tasks per request of the batch, import and bulk routes
+BATCH_SIZE = 10
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """How to exercise one route."""
+
+    # Name of the Routes method sending one request
+    method: str
+    # Rows each request consumes (deletes), created before the timed run
+    fresh_rows: int = 0
+
+
+# In run order: reads, then writes, then deletes
+SCENARIOS = {
+    "GET /tasks": Scenario("list_tasks"),
+    "GET /tasks/stats": Scenario("task_stats"),
+    "GET /tasks/search": Scenario("search_tasks"),
+    "GET /tasks/export": Scenario("export_tasks"),
+    "GET /tasks/{task_id}": Scenario("get_task"),
+    "GET /tasks/events": Scenario("open_event_stream"),
+    "WEBSOCKET /tasks/events": Scenario("open_event_socket"),
+    "POST /tasks": Scenario("create_task"),
+    "POST /tasks/batch": Scenario("create_tasks"),
+    "POST /tasks/import": Scenario("import_tasks"),
+    "PUT /tasks/{task_id}": Scenario("update_task"),
+    "PATCH /tasks/{task_id}": Scenario("patch_task"),
+    "PATCH /tasks/bulk": Scenario("update_tasks"),
+    "DELETE /tasks/{task_id}": Scenario("delete_task", fresh_rows=1),
+    "DELETE /tasks/bulk": Scenario("delete_tasks", fresh_rows=BATCH_SIZE),
+}
+
+
+def router_routes() -> set[str]:
+    """The "METHOD /path" keys of every route in app/api/routes/tasks.py."""
+    from fastapi.routing import APIRoute, APIWebSocketRoute
+
+    from app.api.routes.tasks import router
+
+    routes = set()
+    for route in router.routes:
+        if isinstance(route, APIRoute):
+            routes.update(f"{method} {route.path}" for method in route.methods)
+        elif isinstance(route, APIWebSocketRoute):
+            routes.add(f"WEBSOCKET {route.path}")
+    return routes
+
+
+def insert_tasks(count: int) -> list[int]:
+    """Add `count` tasks for the delete routes to remove and return their IDs."""
+    from sqlalchemy import insert
+
+    from app.db.session import get_engine
+    from app.models.task import Task
+
+    if count == 0:
+        return []
+    rows = [{"title": f"Disposable task {i}", "description": "Created to be deleted"} for i in range(count)]
+    with get_engine().begin() as conn:
+        return list(conn.execute(insert(Task).returning(Task.id), rows).scalars())
+
+
+async def open_subscription(app, scope: dict, opened: str) -> bool:
+    """
+    Call a never-ending ASGI endpoint until it sends `opened`, then hang up.
+
+    Returns:
+        True if the endpoint opened (HTTP 200 or WebSocket accept)
+    """
+    first = {"type": "http.request", "body": b"", "more_body": False}
+    if scope["type"] == "websocket":
+        first = {"type": "websocket.connect"}
+    ready = asyncio.get_running_loop().create_future()
+    received = False
+
+    async def receive() -> dict:
+        nonlocal received
+        if not received:
+            received = True
+            return first
+        # The client never sends anything else; it hangs up by cancelling
+        await asyncio.Future()
+
+    async def send(message: dict) -> None:
+        if not ready.done() and message["type"] in (opened, "http.response.start", "websocket.close"):
+            ready.set_result(message["type"] == opened and message.get("status", 200) == 200)
+
+    call = asyncio.create_task(app(scope, receive, send))
+    try:
+        await asyncio.wait({ready, call}, return_when=asyncio.FIRST_COMPLETED)
+        return ready.done() and ready.result()
+    finally:
+        call.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await call
+
+
+class Routes:
+    """One request per call for each route; each returns True on the expected status."""
+
+    def __init__(self, app, client, task_ids: list[int]):
+        self.app = app
+        self.client = client
+        self.task_ids = task_ids
+        # IDs for the delete routes, refilled before each of their runs
+        self.fresh: list[int] = []
+
+    def task_id(self, i: int) -> int:
+        return self.task_ids[i % len(self.task_ids)]
+
+    def status(self, i: int) -> Optional[str]:
+        return STATUSES[i % len(STATUSES)]
+
+    async def list_tasks(self, i: int) -> bool:
+        params = {"limit": 20}
+        if self.status(i):
+            params["status"] = self.status(i)
+        response = await self.client.get(f"{API_PREFIX}/tasks", params=params)
+        return response.status_code == 200
+
+    async def task_stats(self, i: int) -> bool:
+        response = await self.client.get(f"{API_PREFIX}/tasks/stats")
+        return response.status_code == 200
+
+    async def search_tasks(self, i: int) -> bool:
+        params = {"q": SEARCH_TERMS[i % len(SEARCH_TERMS)], "limit": 20}
+        response = await self.client.get(f"{API_PREFIX}/tasks/search", params=params)
+        return response.status_code == 200
+
+    async def export_tasks(self, i: int) -> bool:
+        params = {"format": "csv" if i % 2 else "ndjson"}
+        if self.status(i):
+            params["status"] = self.status(i)
+        response = await self.client.get(f"{API_PREFIX}/tasks/export", params=params)
+        return response.status_code == 200
+
+    async def get_task(self, i: int) -> bool:
+        response = await self.client.get(f"{API_PREFIX}/tasks/{self.task_id(i)}")
+        return response.status_code == 200
+
+    async def open_event_stream(self, i: int) -> bool:
+        path = f"{API_PREFIX}/tasks/events"
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+            "query_string": b"", "headers": [(b"host", b"bench"), (b"accept", b"text/event-stream")],
+            "client": ("127.0.0.1", 10000 + i % 50000), "server": ("bench", 80),
+        }
+        return await open_subscription(self.app, scope, "http.response.start")
+
+    async def open_event_socket(self, i: int) -> bool:
+        path = f"{API_PREFIX}/tasks/events"
+        scope = {
+            "type": "websocket", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "scheme": "ws", "path": path, "raw_path": path.encode(), "root_path": "",
+            "query_string": b"", "headers": [(b"host", b"bench")], "subprotocols": [],
+            "client": ("127.0.0.1", 10000 + i % 50000), "server": ("bench", 80),
+        }
+        return await open_subscription(self.app, scope, "websocket.accept")
+
+    async def create_task(self, i: int) -> bool:
+        body = {"title": f"Created task {i}", "description": "Created by the route benchmark"}
+        response = await self.client.post(f"{API_PREFIX}/tasks", json=body)
+        return response.status_code == 201
+
+    async def create_tasks(self, i: int) -> bool:
+        body = [{"title": f"Batch task {i}-{n}"} for n in range(BATCH_SIZE)]
+        response = await self.client.post(f"{API_PREFIX}/tasks/batch", json=body)
+        return response.status_code == 201
+
+    async def import_tasks(self, i: int) -> bool:
+        lines = (json.dumps({"title": f"Imported task {i}-{n}"}) for n in range(BATCH_SIZE))
+        response = await self.client.post(
+            f"{API_PREFIX}/tasks/import",
+            params={"format": "ndjson"},
+            content="\n".join(lines).encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        return response.status_code == 200 and response.json()["failed"] == 0
+
+    async def update_task(self, i: int) -> bool:
+        body = {"title": f"Updated task {i}", "status": self.status(i) or "pending"}
+        response = await self.client.put(f"{API_PREFIX}/tasks/{self.task_id(i)}", json=body)
+        return response.status_code == 200
+
+    async def patch_task(self, i: int) -> bool:
+        body = {"status": self.status(i) or "done"}
+        response = await self.client.patch(f"{API_PREFIX}/tasks/{self.task_id(i)}", json=body)
+        return response.status_code == 200
+
+    async def update_tasks(self, i: int) -> bool:
+        ids = [self.task_id(i * BATCH_SIZE + n) for n in range(BATCH_SIZE)]
+        body = {"ids": ids, "changes": {"status": self.status(i) or "in_progress"}}
+        response = await self.client.patch(f"{API_PREFIX}/tasks/bulk", json=body)
+        return response.status_code == 200
+
+    async def delete_task(self, i: int) -> bool:
+        response = await self.client.delete(f"{API_PREFIX}/tasks/{self.fresh.pop()}")
+        return response.status_code == 200
+
+    async def delete_tasks(self, i: int) -> bool:
+        ids = [self.fresh.pop() for _ in range(BATCH_SIZE)]
+        response = await self.client.request("DELETE", f"{API_PREFIX}/tasks/bulk", json={"ids": ids})
+        return response.status_code == 200 and response.json()["deleted"] == BATCH_SIZE
+
+
+async def run_level(app, args: argparse.Namespace, concurrency: int) -> dict:
+    """Re-seed the tasks and time every selected route at one concurrency level."""
+    import httpx
+
+    task_ids = seed_tasks(args.tasks)
+    warmup = min(args.requests, concurrency)
+    results = {}
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench", limits=limits, timeout=120
+    ) as client:
+        routes = Routes(app, client, task_ids)
+        for route in args.routes:
+            scenario = SCENARIOS[route]
+            routes.fresh = insert_tasks((warmup + args.requests) * scenario.fresh_rows)
+            send = getattr(routes, scenario.method)
+            # Warm up pools and caches before measuring
+            await run_load(send, warmup, concurrency, args.timeout)
+            results[route] = await run_load(send, args.requests, concurrency, args.timeout)
+            print(
+                f"{route} c={concurrency}: {results[route]['rps']} req/s, "
+                f"p95 {results[route]['p95_ms']}ms, {results[route]['errors']} errors",
+                file=sys.stderr,
+            )
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list[str]:
+    """
+    Regressions of `current` against `baseline`, for the routes and levels both ran.
+
+    Returns:
+        One message per regression
+    """
+    regressions = []
+    for route, levels in current["routes"].items():
+        for level, result in levels.items():
+            before = baseline.get("routes", {}).get(route, {}).get(level)
+            if before is None:
+                continue
+            p95_limit = max(before["p95_ms"] * (1 + threshold), before["p95_ms"] + min_delta_ms)
+            if result["p95_ms"] > p95_limit:
+                regressions.append(
+                    f"{route} c={level}: p95 {result['p95_ms']}ms, baseline {before['p95_ms']}ms"
+                )
+            if result["rps"] < before["rps"] * (1 - threshold):
+                regressions.append(
+                    f"{route} c={level}: {result['rps']} req/s, baseline {before['rps']} req/s"
+                )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Benchmark the routes at every level, write the JSON and check for regressions."""
+    database_url = configure_database()
+
+    missing = router_routes() - set(SCENARIOS)
+    if missing:
+        print(f"Routes without a benchmark scenario: {', '.join(sorted(missing))}", file=sys.stderr)
+        sys.exit(1)
+
+    from app.main import app
+
+    levels = {}
+    # The lifespan prints start-up messages; keep stdout for the JSON
+    with redirect_stdout(sys.stderr):
+        async with app.router.lifespan_context(app):
+            for concurrency in args.concurrency:
+                levels[concurrency] = await run_level(app, args, concurrency)
+
+    results = {
+        "database": database_url.split(":", 1)[0],
+        "python": platform.python_version(),
+        "tasks": args.tasks,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "routes": {
+            route: {str(concurrency): levels[concurrency][route] for concurrency in args.concurrency}
+            for route in args.routes
+        },
+    }
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+
+    problems = [
+        f"{route} c={level}: {result['errors']} of {result['requests']} requests failed"
+        for route, route_levels in results["routes"].items()
+        for level, result in route_levels.items()
+        if result["errors"]
+    ]
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        problems += compare(results, baseline, args.threshold, args.min_delta_ms)
+    if problems:
+        print("\n".join(problems), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1000, help="Tasks seeded before each concurrency level")
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per route and level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument(
+        "--routes", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS), metavar="ROUTE",
+        help='Routes to run, e.g. "GET /tasks/{task_id}" (default: all)',
+    )
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout (s)")
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative p95 / throughput change")
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=2.0, help="p95 increases below this are never regressions"
+    )
+    args = parser.parse_args()
+    # Keep the run order (reads, writes, deletes) whatever order they were given in
+    args.routes = [route for route in SCENARIOS if route in args.routes]
+    asyncio.run(main(args))
@@ -0,0 +1,148 @@
+"""
+Compare list response encoders at 1k / 10k / 100k rows.
+
+"legacy" is what FastAPI did for list_tasks: ORM Task objects validated into
+TaskPage via from_attributes, dumped to Python values and encoded with the
+stdlib json module. The other paths skip the ORM and per-row validation and
+encode plain column rows directly (see app/services/serialization.py).
+
+Each path is timed twice: "encode" starts from already fetched objects/rows,
+"fetch_encode" includes the database query. All paths must produce the
+same JSON; the script exits with an error if they do not.
+
+Usage:
+    uv run python -m benchmarks.serialization --sizes 1000 10000 100000
+
+Set BENCH_DATABASE_URL to a Postgres URL to benchmark against Postgres;
+otherwise a temporary SQLite database is used.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from benchmarks.common import configure_database, seed_tasks
+
+
+def legacy_encode(tasks) -> bytes:
+    """ORM objects -> TaskPage validation -> Python values -> stdlib json."""
+    from pydantic import TypeAdapter
+
+    from app.schemas.task import TaskPage
+
+    adapter = TypeAdapter(TaskPage)
+    payload = {"tasks": tasks, "next_cursor": None, "prev_cursor": None}
+    value = adapter.validate_python(payload, from_attributes=True)
+    content = adapter.dump_python(value, mode="json")
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode()
+
+
+def pydantic_encode(tasks) -> bytes:
+    """ORM objects -> TaskPage validation -> pydantic-core JSON."""
+    from app.schemas.task import TaskPage
+
+    payload = {"tasks": tasks, "next_cursor": None, "prev_cursor": None}
+    return TaskPage.model_validate(payload, from_attributes=True).model_dump_json().encode()
+
+
+def rows_encoder(encoder):
+    """Plain column rows -> dicts -> encoder."""
+    from app.services.pagination import Page
+    from app.services.serialization import encode_tasks_page
+
+    def encode(rows) -> bytes:
+        return encode_tasks_page(Page(items=rows), encoder)
+
+    return encode
+
+
+def fetch_tasks(session, limit: int) -> list:
+    from sqlmodel import select
+
+    from app.models.task import Task
+
+    statement = select(Task).order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+    return list(session.exec(statement).all())
+
+
+def fetch_rows(session, limit: int) -> list:
+    from sqlmodel import select
+
+    from app.models.task import Task
+    from app.services.task_export import EXPORT_COLUMNS
+
+    statement = select(*EXPORT_COLUMNS).order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+    return list(session.exec(statement).all())
+
+
+def best_of(func, repeat: int) -> tuple[float, bytes]:
+    """Run func `repeat` times; return the fastest time (s) and its output."""
+    best, output = float("inf"), b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = func()
+        best = min(best, time.perf_counter() - started)
+    return best, output
+
+
+def main(args: argparse.Namespace) -> None:
+    """Seed the largest size once, then time every path at every size."""
+    configure_database()
+    seed_tasks(max(args.sizes))
+
+    from sqlmodel import Session
+
+    from app.db.session import get_engine
+    from app.services.serialization import ENCODERS, orjson
+
+    paths = {
+        "legacy": ("orm", legacy_encode),
+        "pydantic_json": ("orm", pydantic_encode),
+        "rows_stdlib": ("rows", rows_encoder(ENCODERS["stdlib"]())),
+    }
+    if orjson is not None:
+        paths["rows_orjson"] = ("rows", rows_encoder(ENCODERS["orjson"]()))
+
+    results = {}
+    with Session(get_engine(), expire_on_commit=False) as session:
+        for size in args.sizes:
+            fetched = {"orm": fetch_tasks(session, size), "rows": fetch_rows(session, size)}
+            fetchers = {"orm": fetch_tasks, "rows": fetch_rows}
+            outputs = {}
+            results[size] = {}
+            for name, (source, encode) in paths.items():
+                encode_s, outputs[name] = best_of(lambda: encode(fetched[source]), args.repeat)
+                total_s, _ = best_of(
+                    lambda: encode(fetchers[source](session, size)), args.repeat
+                )
+                results[size][name] = {
+                    "encode_ms": round(encode_s * 1000, 2),
+                    "encode_rows_per_s": round(size / encode_s),
+                    "fetch_encode_ms": round(total_s * 1000, 2),
+                }
+            for name in paths:
+                base = results[size]["legacy"]
+                results[size][name]["encode_speedup"] = round(
+                    base["encode_ms"] / results[size][name]["encode_ms"], 2
+                )
+                results[size][name]["fetch_encode_speedup"] = round(
+                    base["fetch_encode_ms"] / results[size][name]["fetch_encode_ms"], 2
+                )
+
+            reference = outputs["legacy"]
+            mismatched = [name for name, output in outputs.items() if output != reference]
+            if mismatched:
+                print(f"Output differs from legacy at {size} rows: {mismatched}", file=sys.stderr)
+                sys.exit(1)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,110 @@
+"""
+Cold-start cost of the API and MCP server processes: import time and init_db.
+
+Every sample is a fresh interpreter, as for a new uvicorn worker or stdio
+MCP process. It imports the entry module, then runs init_db in the given
+DB_INIT mode (see app.db.schema). Modes:
+
+    always   run the DDL on every start (the behavior before schema versions)
+    auto     check the recorded schema version and skip the DDL if current
+    skip     no database work at start-up
+
+With --max-import-ms / --max-init-ms it exits with status 1 when a median
+exceeds the budget, so CI can run it as a start-up regression check.
+
+Usage:
+    uv run python -m benchmarks.startup --runs 5
+    uv run python -m benchmarks.startup --max-import-ms 1500 --max-init-ms 50
+
+Set BENCH_DATABASE_URL to a Postgres URL to benchmark against Postgres;
+otherwise a temporary SQLite database is used.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmarks.common import configure_database
+
+MODULES = ["app.main", "app.mcp_server.server", "app.mcp_server.fastmcp_server"]
+MODES = ["always", "auto", "skip"]
+
+# Runs in the child interpreter; prints import and init_db times in ms
+CHILD = """
+import importlib, json, sys, time
+started = time.perf_counter()
+importlib.import_module(sys.argv[1])
+imported = time.perf_counter()
+from app.db.session import get_engine, init_db
+get_engine().connect().close()  # connecting is not init_db's cost
+connected = time.perf_counter()
+ran_ddl = init_db(sys.argv[2])
+done = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "init_ms": (done - connected) * 1000,
+    "ran_ddl": ran_ddl,
+}))
+"""
+
+
+def sample(module: str, mode: str) -> dict:
+    """Start one fresh interpreter and return its timings."""
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", CHILD, module, mode],
+        capture_output=True,
+        text=True,
+        env={**os.environ},
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(args: argparse.Namespace) -> None:
+    """Time every module and mode, print JSON and check the budgets."""
+    configure_database()
+    # Start from an initialized database, as a restarted service would
+    sample("app.db.session", "always")
+
+    results = {}
+    for module in args.modules:
+        results[module] = {}
+        for mode in args.modes:
+            samples = [sample(module, mode) for _ in range(args.runs)]
+            results[module][mode] = {
+                "import_ms": round(statistics.median(s["import_ms"] for s in samples), 1),
+                "init_ms": round(statistics.median(s["init_ms"] for s in samples), 1),
+                "ran_ddl": any(s["ran_ddl"] for s in samples),
+            }
+    print(json.dumps(results, indent=2))
+
+    problems = []
+    for module, modes in results.items():
+        for mode, timings in modes.items():
+            if args.max_import_ms is not None and timings["import_ms"] > args.max_import_ms:
+                problems.append(f"{module} imports in {timings['import_ms']}ms (budget {args.max_import_ms}ms)")
+            if (
+                args.max_init_ms is not None and mode != "always"
+                and timings["init_ms"] > args.max_init_ms
+            ):
+                problems.append(
+                    f"init_db({mode!r}) after {module} took {timings['init_ms']}ms (budget {args.max_init_ms}ms)"
+                )
+            if mode != "always" and timings["ran_ddl"]:
+                problems.append(f"init_db({mode!r}) ran the DDL on an up-to-date database")
+    if problems:
+        print("\n".join(sorted(set(problems))), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, help="Fail if a module's median import time exceeds this")
+    parser.add_argument("--max-init-ms", type=float, help="Fail if init_db in auto/skip mode exceeds this")
+    main(parser.parse_args())
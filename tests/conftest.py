@@ -0,0 +1,50 @@
+"""Shared fixtures: a throwaway SQLite database and a client running the app lifespan."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Before the app is imported: engines and settings are cached on first use
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'test.db'}"
+os.environ["STATS_RECONCILE_INTERVAL"] = "0"
+
+
+def reset_tasks() -> None:
+    """Delete every task and counter row and empty the caches."""
+    from sqlalchemy import delete
+
+    from app.db.session import get_engine
+    from app.models.task import Task, TaskStatusCount
+    from app.services.cache import bump_tasks_version, get_list_cache, get_task_cache
+
+    with get_engine().begin() as connection:
+        connection.execute(delete(Task))
+        connection.execute(delete(TaskStatusCount))
+    get_task_cache().clear()
+    get_list_cache().clear()
+    bump_tasks_version()
+
+
+@pytest.fixture
+def client():
+    """TestClient for the API, on an initialized database with no tasks."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as client:
+        reset_tasks()
+        yield client
+
+
+@pytest.fixture
+def create_task(client):
+    """Create a task through the API and return its JSON."""
+    def create(title: str = "Task", **fields) -> dict:
+        response = client.post("/api/v1/tasks", json={"title": title, **fields})
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return create
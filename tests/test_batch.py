@@ -0,0 +1,50 @@
+"""Multi-operation batches: results when an atomic batch rolls back."""
+
+import asyncio
+import json
+
+from app.mcp_server.server import handle_batch
+
+
+def run_batch(operations: list[dict], atomic: bool = True) -> dict:
+    """Call the low-level server's batch handler and decode its result."""
+    content = asyncio.run(handle_batch({"operations": operations, "atomic": atomic}))
+    return json.loads(content[0].text)
+
+
+def test_rolled_back_batch_reports_no_applied_operations(client, create_task):
+    task = create_task()
+
+    outcome = run_batch([
+        {"op": "create", "title": "Never committed"},
+        {"op": "update_status", "id": task["id"], "status": "done"},
+        {"op": "delete", "id": 999999},
+        {"op": "get", "id": task["id"]},
+    ])
+
+    assert outcome["committed"] is False
+    assert (outcome["succeeded"], outcome["failed"]) == (0, 4)
+    results = outcome["results"]
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert not any(result["ok"] or "task" in result for result in results)
+    assert "id" not in results[0]
+    assert results[0]["error"] == results[1]["error"] == "Rolled back: operation 2 failed"
+    assert "not found" in results[2]["error"]
+    assert results[3]["error"] == "Not run: operation 2 failed"
+
+    assert client.get(f"/api/v1/tasks/{task['id']}").json()["status"] == "pending"
+    assert client.get("/api/v1/tasks/stats").json()["total"] == 1
+
+
+def test_non_atomic_batch_commits_the_operations_that_succeeded(client, create_task):
+    task = create_task()
+
+    outcome = run_batch(
+        [{"op": "delete", "id": 999999}, {"op": "update_status", "id": task["id"], "status": "done"}],
+        atomic=False,
+    )
+
+    assert outcome["committed"] is True
+    assert [result["ok"] for result in outcome["results"]] == [False, True]
+    assert outcome["results"][1]["task"]["status"] == "done"
+    assert client.get(f"/api/v1/tasks/{task['id']}").json()["status"] == "done"
@@ -0,0 +1,40 @@
+"""Bulk update and delete: selection and the size limit of the ids list."""
+
+import asyncio
+
+import pytest
+
+from app.mcp_server.server import MCPError, handle_delete_tasks
+from app.schemas.task import MAX_BULK_IDS
+
+
+def test_bulk_update_by_ids_changes_only_those_tasks(client, create_task):
+    first, second = create_task("First"), create_task("Second")
+
+    response = client.request(
+        "PATCH", "/api/v1/tasks/bulk", json={"ids": [first["id"]], "changes": {"status": "done"}}
+    )
+    assert response.status_code == 200, response.text
+    assert client.get(f"/api/v1/tasks/{first['id']}").json()["status"] == "done"
+    assert client.get(f"/api/v1/tasks/{second['id']}").json()["status"] == "pending"
+
+
+@pytest.mark.parametrize(
+    "method, extra",
+    [("DELETE", {}), ("PATCH", {"changes": {"status": "done"}})],
+)
+def test_bulk_ids_over_the_limit_are_a_validation_error(client, method, extra):
+    ids = list(range(1, MAX_BULK_IDS + 2))
+
+    response = client.request(method, "/api/v1/tasks/bulk", json={"ids": ids, **extra})
+    assert response.status_code == 400
+    assert response.json()["error"] == "Validation Error"
+    assert [detail["field"] for detail in response.json()["details"]] == ["body.ids"]
+
+
+def test_mcp_bulk_delete_over_the_limit_is_a_validation_error():
+    ids = list(range(1, MAX_BULK_IDS + 2))
+
+    with pytest.raises(MCPError) as error:
+        asyncio.run(handle_delete_tasks({"ids": ids}))
+    assert error.value.code == "VALIDATION_ERROR"
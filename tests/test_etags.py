@@ -0,0 +1,62 @@
+"""ETag, If-None-Match and If-Match on the task routes."""
+
+
+def test_get_task_returns_304_while_unchanged(client, create_task):
+    task = create_task()
+    response = client.get(f"/api/v1/tasks/{task['id']}")
+    etag = response.headers["ETag"]
+
+    cached = client.get(f"/api/v1/tasks/{task['id']}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+
+    client.patch(f"/api/v1/tasks/{task['id']}", json={"status": "done"})
+    changed = client.get(f"/api/v1/tasks/{task['id']}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["status"] == "done"
+    assert changed.headers["ETag"] != etag
+
+
+def test_update_with_stale_if_match_fails_with_412(client, create_task):
+    task = create_task()
+    etag = client.get(f"/api/v1/tasks/{task['id']}").headers["ETag"]
+    client.put(f"/api/v1/tasks/{task['id']}", json={"title": "Changed elsewhere"})
+
+    response = client.put(
+        f"/api/v1/tasks/{task['id']}", json={"title": "Lost update"}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 412
+    assert client.get(f"/api/v1/tasks/{task['id']}").json()["title"] == "Changed elsewhere"
+
+
+def test_update_with_current_if_match_applies(client, create_task):
+    task = create_task()
+    etag = client.get(f"/api/v1/tasks/{task['id']}").headers["ETag"]
+
+    response = client.patch(
+        f"/api/v1/tasks/{task['id']}", json={"status": "in_progress"}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "in_progress"
+    assert response.headers["ETag"] != etag
+
+
+def test_delete_with_stale_if_match_keeps_the_task(client, create_task):
+    task = create_task()
+    etag = client.get(f"/api/v1/tasks/{task['id']}").headers["ETag"]
+    client.patch(f"/api/v1/tasks/{task['id']}", json={"status": "done"})
+
+    response = client.delete(f"/api/v1/tasks/{task['id']}", headers={"If-Match": etag})
+    assert response.status_code == 412
+    assert client.get(f"/api/v1/tasks/{task['id']}").status_code == 200
+
+
+def test_list_etag_changes_after_a_write(client, create_task):
+    create_task()
+    etag = client.get("/api/v1/tasks").headers["ETag"]
+    assert client.get("/api/v1/tasks", headers={"If-None-Match": etag}).status_code == 304
+
+    create_task("Another task")
+    response = client.get("/api/v1/tasks", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()["tasks"]) == 2
@@ -0,0 +1,90 @@
+"""init_db modes and the schema_version short-circuit."""
+
+import pytest
+from sqlalchemy import event, inspect, text
+
+from app.db import session
+from app.db.schema import SCHEMA_VERSION, get_schema_version
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Point init_db at an empty SQLite file of its own."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'init.db'}")
+    session.get_database_url.cache_clear()
+    session.get_engine.cache_clear()
+    yield session.get_engine()
+    session.get_engine().dispose()
+    session.get_database_url.cache_clear()
+    session.get_engine.cache_clear()
+
+
+def record_statements(engine) -> list[str]:
+    """Collect every SQL statement the engine runs from now on."""
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_fresh_database_is_created_and_stamped(engine):
+    assert session.init_db("auto") is True
+
+    tables = set(inspect(engine).get_table_names())
+    assert {"tasks", "task_status_counts", "schema_version"} <= tables
+    assert get_schema_version(engine) == SCHEMA_VERSION
+
+
+def test_current_database_skips_the_ddl_in_auto_mode(engine):
+    session.init_db("auto")
+    statements = record_statements(engine)
+
+    assert session.init_db("auto") is False
+    assert len(statements) == 1
+    assert "schema_version" in statements[0]
+    assert not any(statement.lstrip().upper().startswith(("CREATE", "ALTER", "DROP")) for statement in statements)
+
+
+def test_older_schema_version_runs_the_missing_migrations(engine):
+    session.init_db("auto")
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM schema_version WHERE version > 1"))
+        connection.execute(text("DROP INDEX ix_tasks_created_at_id"))
+
+    assert session.init_db("auto") is True
+    assert get_schema_version(engine) == SCHEMA_VERSION
+    assert "ix_tasks_created_at_id" in {index["name"] for index in inspect(engine).get_indexes("tasks")}
+
+
+def test_version_table_from_before_migrations_is_upgraded(engine):
+    session.init_db("auto")
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE schema_version"))
+        connection.execute(text("CREATE TABLE schema_version (version INTEGER NOT NULL)"))
+        connection.execute(text("INSERT INTO schema_version VALUES (1)"))
+
+    assert session.init_db("auto") is True
+    columns = {column["name"] for column in inspect(engine).get_columns("schema_version")}
+    assert {"version", "name", "applied_at"} <= columns
+    assert get_schema_version(engine) == SCHEMA_VERSION
+
+
+def test_always_mode_reruns_without_restamping(engine):
+    session.init_db("auto")
+
+    assert session.init_db("always") is True
+    with engine.connect() as connection:
+        versions = connection.execute(text("SELECT version FROM schema_version")).scalars().all()
+    assert sorted(versions) == list(range(1, SCHEMA_VERSION + 1))
+
+
+def test_skip_mode_touches_nothing(engine):
+    statements = record_statements(engine)
+
+    assert session.init_db("skip") is False
+    assert statements == []
+    assert inspect(engine).get_table_names() == []
+
+
+def test_unknown_mode_raises_value_error(engine):
+    with pytest.raises(ValueError, match="Unknown database init mode"):
+        session.init_db("sometimes")
@@ -0,0 +1,96 @@
+"""Concurrent tool calls on the low-level MCP server stay within its call slots."""
+
+import asyncio
+
+from mcp.shared.memory import create_connected_server_and_client_session
+from sqlalchemy import event
+
+from app.core.config import get_settings
+from app.db.session import get_async_engine
+from app.mcp_server import server as mcp_server
+
+CALLS = 1000
+
+# Read-heavy mix with some writes, like benchmarks/mcp_concurrency.py
+OPERATIONS = ["get_task_by_id", "list_tasks", "get_task_by_id", "update_task_status", "get_task_stats"]
+
+
+def tool_call(i: int, task_ids: list[int]) -> tuple[str, dict]:
+    """Tool name and arguments for the i-th call."""
+    name = OPERATIONS[i % len(OPERATIONS)]
+    task_id = task_ids[i % len(task_ids)]
+    if name == "get_task_by_id":
+        return name, {"id": task_id}
+    if name == "list_tasks":
+        return name, {"limit": 20}
+    if name == "update_task_status":
+        return name, {"id": task_id, "status": ["pending", "in_progress", "done"][i % 3]}
+    return name, {}
+
+
+class CheckoutCounter:
+    """Track checked-out connections of a pool, and the most at once."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+
+    def checkout(self, *args) -> None:
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+
+    def checkin(self, *args) -> None:
+        self.current -= 1
+
+
+async def call_all(task_ids: list[int], calls: int = CALLS) -> list[str]:
+    """Send every call at once over one MCP session and return the failures."""
+    failures = []
+
+    async def call(i: int) -> None:
+        name, arguments = tool_call(i, task_ids)
+        result = await client.call_tool(name, arguments)
+        text = result.content[0].text if result.content else ""
+        if result.isError or '"error"' in text:
+            failures.append(f"{name}: {text[:200]}")
+
+    async with create_connected_server_and_client_session(mcp_server.server) as client:
+        await asyncio.gather(*(call(i) for i in range(calls)))
+    return failures
+
+
+def limit_call_slots(monkeypatch, slots: int) -> None:
+    """Give the MCP server fewer call slots than the pool allows."""
+    settings = get_settings().model_copy(update={"db_pool_size": slots, "db_max_overflow": 0})
+    monkeypatch.setattr(mcp_server, "get_settings", lambda: settings)
+
+
+def test_concurrent_calls_stay_within_the_call_slots(client, create_task, monkeypatch):
+    task_ids = [create_task(f"Task {i}")["id"] for i in range(20)]
+    # Fewer slots than the pool allows, so the pool's own limit cannot mask a leak
+    slots = 3
+    limit_call_slots(monkeypatch, slots)
+
+    engine = get_async_engine().sync_engine
+    counter = CheckoutCounter()
+    event.listen(engine, "checkout", counter.checkout)
+    event.listen(engine, "checkin", counter.checkin)
+    try:
+        failures = asyncio.run(call_all(task_ids))
+    finally:
+        event.remove(engine, "checkout", counter.checkout)
+        event.remove(engine, "checkin", counter.checkin)
+
+    assert failures == []
+    assert 0 < counter.peak <= slots
+    assert counter.current == 0
+
+
+def test_call_slots_work_on_a_second_event_loop(client, create_task, monkeypatch):
+    task_ids = [create_task(f"Task {i}")["id"] for i in range(5)]
+    limit_call_slots(monkeypatch, 2)
+
+    # Calls waiting for a slot on a semaphore bound to the first loop
+    # used to fail with "bound to a different event loop"
+    for _ in range(2):
+        assert asyncio.run(call_all(task_ids, calls=50)) == []
@@ -0,0 +1,76 @@
+"""Keyset pagination of GET /tasks."""
+
+import asyncio
+
+import pytest
+
+from app.mcp_server.server import MCPError, handle_list_tasks
+
+
+def titles(page: dict) -> list[str]:
+    return [task["title"] for task in page["tasks"]]
+
+
+def test_pages_walk_newest_first_without_gaps(client, create_task):
+    for i in range(7):
+        create_task(f"Task {i}")
+
+    seen, after = [], None
+    while True:
+        params = {"limit": 3, **({"after": after} if after else {})}
+        response = client.get("/api/v1/tasks", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        seen += titles(page)
+        after = page["next_cursor"]
+        if after is None:
+            break
+
+    assert seen == [f"Task {i}" for i in reversed(range(7))]
+
+
+def test_prev_cursor_returns_the_newer_page(client, create_task):
+    for i in range(6):
+        create_task(f"Task {i}")
+
+    first = client.get("/api/v1/tasks", params={"limit": 3}).json()
+    second = client.get("/api/v1/tasks", params={"limit": 3, "after": first["next_cursor"]}).json()
+    back = client.get("/api/v1/tasks", params={"limit": 3, "before": second["prev_cursor"]}).json()
+
+    assert titles(second) == ["Task 2", "Task 1", "Task 0"]
+    assert titles(back) == titles(first)
+
+
+def test_cursor_is_stable_across_inserts(client, create_task):
+    for i in range(4):
+        create_task(f"Task {i}")
+    first = client.get("/api/v1/tasks", params={"limit": 2}).json()
+
+    create_task("Newer task")
+    second = client.get("/api/v1/tasks", params={"limit": 2, "after": first["next_cursor"]}).json()
+
+    assert titles(second) == ["Task 1", "Task 0"]
+
+
+def test_status_filter_applies_to_every_page(client, create_task):
+    for i in range(6):
+        create_task(f"Task {i}", status="done" if i % 2 else "pending")
+
+    first = client.get("/api/v1/tasks", params={"limit": 2, "status": "done"}).json()
+    second = client.get(
+        "/api/v1/tasks", params={"limit": 2, "status": "done", "after": first["next_cursor"]}
+    ).json()
+
+    assert titles(first) + titles(second) == ["Task 5", "Task 3", "Task 1"]
+    assert second["next_cursor"] is None
+
+
+def test_malformed_cursor_is_rejected(client):
+    response = client.get("/api/v1/tasks", params={"after": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_mcp_list_tasks_rejects_a_zero_limit(client):
+    with pytest.raises(MCPError) as error:
+        asyncio.run(handle_list_tasks({"limit": 0}))
+    assert error.value.code == "VALIDATION_ERROR"
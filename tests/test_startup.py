@@ -0,0 +1,55 @@
+"""Cold-start budget: importing app.main and running the lifespan in a fresh interpreter."""
+
+import json
+import os
+import subprocess
+import sys
+
+# Generous for slow CI machines; a regression that pulls heavy modules
+# back onto the import path or DDL back into start-up still trips them
+IMPORT_BUDGET_MS = 1500
+STARTUP_BUDGET_MS = 2000
+
+# Runs in the child interpreter; prints its timings as JSON
+CHILD = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+deferred = "app.api.routes.tasks" not in sys.modules
+
+async def start_and_stop():
+    application = app.main.app
+    async with application.router.lifespan_context(application):
+        return time.perf_counter()
+
+running = asyncio.run(start_and_stop())
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (running - imported) * 1000,
+    "routes_deferred": deferred,
+}))
+"""
+
+
+def run_child() -> dict:
+    """Start a fresh interpreter with DB_INIT=skip and return its timings."""
+    env = {**os.environ, "DB_INIT": "skip", "STATS_RECONCILE_INTERVAL": "0"}
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", CHILD],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_and_startup_stay_within_budget():
+    # Best of three, so one slow sample on a busy machine does not fail it
+    samples = [run_child() for _ in range(3)]
+
+    assert all(sample["routes_deferred"] for sample in samples)
+    assert min(sample["import_ms"] for sample in samples) < IMPORT_BUDGET_MS
+    assert min(sample["startup_ms"] for sample in samples) < STARTUP_BUDGET_MS
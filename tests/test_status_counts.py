@@ -0,0 +1,52 @@
+"""Trigger-maintained task_status_counts and GET /tasks/stats."""
+
+from sqlalchemy import text
+
+from app.db.session import get_engine
+from app.services.task_stats import reconcile_status_counts
+
+
+def stats(client) -> dict:
+    response = client.get("/api/v1/tasks/stats")
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_counts_follow_inserts_updates_and_deletes(client, create_task):
+    first = create_task(status="pending")
+    second = create_task(status="pending")
+    create_task(status="done")
+    assert stats(client) == {"pending": 2, "in_progress": 0, "done": 1, "total": 3}
+
+    client.patch(f"/api/v1/tasks/{first['id']}", json={"status": "in_progress"})
+    assert stats(client) == {"pending": 1, "in_progress": 1, "done": 1, "total": 3}
+
+    client.delete(f"/api/v1/tasks/{second['id']}")
+    assert stats(client) == {"pending": 0, "in_progress": 1, "done": 1, "total": 2}
+
+
+def test_counts_follow_batch_and_bulk_writes(client):
+    response = client.post("/api/v1/tasks/batch", json=[{"title": f"Task {i}"} for i in range(5)])
+    assert response.status_code == 201
+    ids = [task["id"] for task in response.json()]
+
+    client.patch("/api/v1/tasks/bulk", json={"ids": ids[:3], "changes": {"status": "done"}})
+    assert stats(client) == {"pending": 2, "in_progress": 0, "done": 3, "total": 5}
+
+    client.request("DELETE", "/api/v1/tasks/bulk", json={"filter": {"status": "done"}})
+    assert stats(client) == {"pending": 2, "in_progress": 0, "done": 0, "total": 2}
+
+
+def test_counts_match_a_recount(client, create_task):
+    for status in ["pending", "done", "done", "in_progress"]:
+        create_task(status=status)
+    assert reconcile_status_counts() == {}
+
+
+def test_reconcile_corrects_drift(client, create_task):
+    create_task(status="done")
+    with get_engine().begin() as connection:
+        connection.execute(text("UPDATE task_status_counts SET count = count + 4 WHERE status = 'DONE'"))
+
+    assert reconcile_status_counts() == {"done": -4}
+    assert stats(client)["done"] == 1